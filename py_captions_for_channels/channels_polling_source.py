@@ -15,9 +15,10 @@ import requests
 from .channels_api import ChannelsAPI
 from .config import translate_dvr_path
 from .config import LOCAL_TEST_DIR, PROCESSING_ENABLED, WHITELIST_REQUIRED
+from .config import REDIS_URL
 from .execution_tracker import get_tracker
 from .database import get_db
-from .services.polling_cache_service import PollingCacheService
+from .services.polling_cache_service import PollingCacheService, connect_redis
 from .services.heartbeat_service import HeartbeatService
 from .services.settings_service import SettingsService
 from .shutdown_control import get_shutdown_controller
@@ -181,7 +182,7 @@ class ChannelsPollingSource:
 
         # Get database session for polling cache
         db = next(get_db())
-        cache_service = PollingCacheService(db)
+        cache_service = PollingCacheService(db, redis_client=connect_redis(REDIS_URL))
         heartbeat_service = HeartbeatService(db)
 
         # Cleanup old cache entries on startup (keep last 24 hours)
@@ -521,11 +522,7 @@ class ChannelsPollingSource:
                     if path:
                         try:
                             tracker = get_tracker()
-                            all_executions = tracker.get_executions(limit=1000)
-                            existing_by_path = next(
-                                (e for e in all_executions if e.get("path") == path),
-                                None,
-                            )
+                            existing_by_path = tracker.get_execution_by_path(path)
                             if existing_by_path:
                                 status = existing_by_path.get("status")
                                 # Skip if already processed/running/pending/discovered
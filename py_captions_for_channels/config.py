@@ -415,6 +415,12 @@ POLL_MAX_AGE_HOURS = get_env_int(
 POLL_MAX_QUEUE_SIZE = get_env_int(
     "POLL_MAX_QUEUE_SIZE", 1
 )  # Max pending/running executions (1=serial to avoid Whisper model race conditions)
+# Max detected events waiting for the processor; when full, the event source
+# waits instead of buffering without limit (backpressure during backfills)
+POLL_QUEUE_MAXSIZE = get_env_int("POLL_QUEUE_MAXSIZE", 256)
+# Optional Redis URL (e.g. redis://localhost:6379/0) for a shared hot cache in
+# front of the polling cache table. Empty = database only.
+REDIS_URL = os.getenv("REDIS_URL", "")
 
 # Pipeline configuration
 DRY_RUN = get_env_bool("DRY_RUN", False)
@@ -5,21 +5,32 @@ from pathlib import Path
 from typing import Generator
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import QueuePool
 
 # Database file location — derived from DATA_DIR (see config.py)
 from .config import DB_PATH
 
 DB_URL = f"sqlite:///{DB_PATH}"
 
-# Create engine with NullPool for SQLite
-# NullPool creates a new connection for each session, avoiding
-# "another row available" errors from shared connections
-# check_same_thread=False is safe because each session gets its own connection
+# Create engine with a QueuePool for SQLite
+# Each session checks out its own connection exclusively (never shared
+# concurrently, avoiding "another row available" errors), but connections
+# are reused instead of reopened per session, saving the connect + PRAGMA
+# setup cost on every request.  Connections are reset (rolled back) on
+# return and recycled periodically.
+# check_same_thread=False is safe because a connection is only ever used by
+# the session that checked it out
 engine = create_engine(
     DB_URL,
     connect_args={"check_same_thread": False, "timeout": 30},
-    poolclass=NullPool,  # No pooling - each session gets its own connection
+    poolclass=QueuePool,
+    pool_size=10,
+    # Unbounded overflow: like the previous NullPool, a checkout never
+    # blocks (some callers leave sessions to the GC); extra connections
+    # beyond pool_size are simply closed on return
+    max_overflow=-1,
+    pool_recycle=1800,
+    query_cache_size=1200,  # Compiled-statement cache (default 500)
     echo=False,  # Set to True for SQL query logging
 )
 
@@ -122,6 +133,15 @@ def _apply_migrations():
                     conn.commit()
                 LOG.info("Migration complete: job_sequence column added and backfilled")
 
+            # Migration: status lookups use the (status, started_at) composite
+            from .models import Execution
+
+            for index in Execution.__table__.indexes:
+                index.create(bind=engine, checkfirst=True)
+            with engine.connect() as conn:
+                conn.execute(text("DROP INDEX IF EXISTS idx_executions_status"))
+                conn.commit()
+
         # Migration: Add generate_srt, run_transcode, skip_caption_generation
         if "manual_queue" in inspector.get_table_names():
             mq_cols = [col["name"] for col in inspector.get_columns("manual_queue")]
@@ -153,6 +173,57 @@ def _apply_migrations():
                 conn.commit()
             LOG.info("Migration complete: manual_queue columns verified/added")
 
+        # Migration: progress_metadata is a JSON column now; legacy TEXT values
+        # that aren't valid JSON would fail to load, so clear them
+        if "progress" in inspector.get_table_names():
+            with engine.connect() as conn:
+                cleared = conn.execute(
+                    text(
+                        "UPDATE progress SET progress_metadata = NULL "
+                        "WHERE progress_metadata IS NOT NULL "
+                        "AND NOT json_valid(progress_metadata)"
+                    )
+                ).rowcount
+                conn.commit()
+            if cleared:
+                LOG.info("Cleared %d malformed progress_metadata value(s)", cleared)
+
+        # Migration: Quarantine indexes (composite + unique active path)
+        if "quarantine_items" in inspector.get_table_names():
+            from .models import QuarantineItem
+
+            q_indexes = {ix["name"] for ix in inspector.get_indexes("quarantine_items")}
+            has_duplicates = False
+            if "uq_quarantine_active_original" not in q_indexes:
+                # The unique index cannot be built while duplicates exist.
+                # Deduplicating deletes quarantined files, so that is left
+                # to the admin action rather than done by a migration.
+                with engine.connect() as conn:
+                    has_duplicates = (
+                        conn.execute(
+                            text(
+                                "SELECT 1 FROM quarantine_items "
+                                "WHERE status = 'quarantined' "
+                                "GROUP BY original_path HAVING COUNT(*) > 1 LIMIT 1"
+                            )
+                        ).first()
+                        is not None
+                    )
+                if has_duplicates:
+                    LOG.warning(
+                        "Duplicate active quarantine entries found; run "
+                        "quarantine deduplication, then restart to add the "
+                        "unique index"
+                    )
+
+            for index in QuarantineItem.__table__.indexes:
+                if has_duplicates and index.name == "uq_quarantine_active_original":
+                    continue
+                index.create(bind=engine, checkfirst=True)
+            with engine.connect() as conn:
+                conn.execute(text("DROP INDEX IF EXISTS idx_quarantine_status"))
+                conn.commit()
+
     except Exception as e:
         LOG.warning(f"Error applying migrations: {e}")
         # Don't fail startup if migration fails - column might already exist
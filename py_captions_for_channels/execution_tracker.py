@@ -329,19 +329,62 @@ class ExecutionTracker:
                 else:
                     LOG.warning("Attempted to complete unknown execution: %s", job_id)
 
-    def get_executions(self, limit: int = 50) -> List[dict]:
+    def get_executions(
+        self, limit: int = 50, status: str = None, kind: str = None
+    ) -> List[dict]:
         """Get recent executions, most recent first.
 
         Args:
             limit: Maximum number of executions to return
+            status: Filter by status (optional)
+            kind: Filter by kind (optional)
 
         Returns:
             List of execution dicts
         """
         with self._get_service() as service:
-            executions = service.get_executions(limit=limit)
+            executions = service.get_executions(limit=limit, status=status, kind=kind)
             return [service.to_dict(exec) for exec in executions]
 
+    def get_executions_by_status(
+        self,
+        statuses: List[str],
+        limit: Optional[int] = None,
+        exclude_kind: Optional[str] = None,
+        error_prefix: Optional[str] = None,
+    ) -> List[dict]:
+        """Get executions in any of the given statuses, oldest first.
+
+        Args:
+            statuses: Statuses to match
+            limit: Maximum number of executions to return (optional)
+            exclude_kind: Skip executions of this kind (optional)
+            error_prefix: Only match error messages starting with this (optional)
+
+        Returns:
+            List of execution dicts
+        """
+        with self._get_service() as service:
+            executions = service.get_executions_by_status(
+                statuses, limit, exclude_kind, error_prefix
+            )
+            return [service.to_dict(exec) for exec in executions]
+
+    def count_by_status(
+        self, statuses: List[str], exclude_kind: Optional[str] = None
+    ) -> int:
+        """Count executions in any of the given statuses.
+
+        Args:
+            statuses: Statuses to match
+            exclude_kind: Skip executions of this kind (optional)
+
+        Returns:
+            Number of matching executions
+        """
+        with self._get_service() as service:
+            return service.count_by_status(statuses, exclude_kind)
+
     def get_execution(self, job_id: str) -> Optional[dict]:
         """Get a specific execution by ID.
 
@@ -355,6 +398,26 @@ class ExecutionTracker:
             execution = service.get_execution(job_id)
             return service.to_dict(execution) if execution else None
 
+    def get_execution_by_path(
+        self,
+        path: Optional[str],
+        statuses: Optional[List[str]] = None,
+        kind: Optional[str] = None,
+    ) -> Optional[dict]:
+        """Get the most recent execution for a recording path.
+
+        Args:
+            path: Recording file path
+            statuses: Only consider executions with one of these statuses
+            kind: Only consider executions of this kind
+
+        Returns:
+            Execution dict or None
+        """
+        with self._get_service() as service:
+            execution = service.get_execution_by_path(path, statuses, kind)
+            return service.to_dict(execution) if execution else None
+
     def mark_stale_executions(self, timeout_seconds: int = 7200) -> int:
         """Mark long-running executions as failed (interrupted).
 
@@ -383,12 +446,11 @@ class ExecutionTracker:
             List of file paths that were interrupted
         """
         with self._get_service() as service:
-            executions = service.get_executions(limit=1000)
+            executions = service.get_executions(limit=1000, status="completed")
             paths = []
             for execution in executions:
                 if (
-                    execution.status == "completed"
-                    and not execution.success
+                    not execution.success
                     and execution.error_message
                     and "interrupted" in execution.error_message.lower()
                 ):
@@ -8,9 +8,11 @@ from sqlalchemy import (
     Boolean,
     Float,
     DateTime,
+    JSON,
     Text,
     ForeignKey,
     Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from .database import Base
@@ -49,7 +51,8 @@ class Execution(Base):
 
     __tablename__ = "executions"
     __table_args__ = (
-        Index("idx_executions_status", "status"),
+        # Composite also serves status-only lookups (leftmost prefix)
+        Index("idx_executions_status_started_at", "status", "started_at"),
         Index("idx_executions_path", "path"),
         Index("idx_executions_started_at", "started_at"),
         Index("idx_executions_job_sequence", "job_sequence"),
@@ -199,7 +202,8 @@ class Progress(Base):
     process_type = Column(String(50), nullable=False)  # 'whisper', 'ffmpeg'
     percent = Column(Float, nullable=False)
     message = Column(String(500), nullable=True)
-    progress_metadata = Column(Text, nullable=True)  # JSON
+    # Native JSON column: SQLAlchemy (de)serializes dicts on write/read
+    progress_metadata = Column(JSON(none_as_null=True), nullable=True)
     updated_at = Column(DateTime, nullable=False)
 
     def __repr__(self):
@@ -263,8 +267,20 @@ class QuarantineItem(Base):
 
     __tablename__ = "quarantine_items"
     __table_args__ = (
-        Index("idx_quarantine_status", "status"),
+        # Composite indexes: every active-item query filters on status first,
+        # then on expiry or original path (which also serves the path sort)
+        Index("idx_quarantine_status_expires", "status", "expires_at"),
+        Index("idx_quarantine_status_original", "status", "original_path"),
         Index("idx_quarantine_expires_at", "expires_at"),
+        # At most one active quarantine record per original file; inserts of a
+        # second one fail with IntegrityError instead of needing a pre-SELECT
+        Index(
+            "uq_quarantine_active_original",
+            "original_path",
+            unique=True,
+            sqlite_where=text("status = 'quarantined'"),
+            postgresql_where=text("status = 'quarantined'"),
+        ),
         Index("idx_quarantine_created_at", "created_at"),
     )
 
@@ -5,7 +5,7 @@ import logging
 import os
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, desc, func, or_
 from sqlalchemy.orm import Session
 from ..models import Execution, ExecutionStep, JobSequence
 
@@ -101,12 +101,40 @@ class ExecutionService:
         """
         return self.db.query(Execution).filter(Execution.id == job_id).first()
 
-    def get_executions(self, limit: int = 50, status: str = None) -> List[Execution]:
+    def get_execution_by_path(
+        self,
+        path: Optional[str],
+        statuses: Optional[List[str]] = None,
+        kind: Optional[str] = None,
+    ) -> Optional[Execution]:
+        """Get the most recent execution for a recording path.
+
+        Uses the path index instead of scanning recent executions.
+
+        Args:
+            path: Recording file path
+            statuses: Only consider executions with one of these statuses
+            kind: Only consider executions of this kind
+
+        Returns:
+            Most recently started matching Execution, or None
+        """
+        query = self.db.query(Execution).filter(Execution.path == path)
+        if statuses:
+            query = query.filter(Execution.status.in_(statuses))
+        if kind:
+            query = query.filter(Execution.kind == kind)
+        return query.order_by(desc(Execution.started_at)).first()
+
+    def get_executions(
+        self, limit: int = 50, status: str = None, kind: str = None
+    ) -> List[Execution]:
         """Get recent executions, most recent first.
 
         Args:
             limit: Maximum number of executions to return
             status: Filter by status (optional)
+            kind: Filter by kind (optional)
 
         Returns:
             List of Execution objects
@@ -114,8 +142,69 @@ class ExecutionService:
         query = self.db.query(Execution)
         if status:
             query = query.filter(Execution.status == status)
+        if kind:
+            query = query.filter(Execution.kind == kind)
         return query.order_by(desc(Execution.started_at)).limit(limit).all()
 
+    def _status_query(
+        self,
+        statuses: List[str],
+        exclude_kind: Optional[str] = None,
+        error_prefix: Optional[str] = None,
+    ):
+        """Build a query for executions in any of the given statuses."""
+        query = self.db.query(Execution).filter(Execution.status.in_(statuses))
+        if exclude_kind:
+            # kind is nullable; NULL rows are not of the excluded kind
+            query = query.filter(
+                or_(Execution.kind.is_(None), Execution.kind != exclude_kind)
+            )
+        if error_prefix:
+            query = query.filter(Execution.error_message.startswith(error_prefix))
+        return query
+
+    def get_executions_by_status(
+        self,
+        statuses: List[str],
+        limit: Optional[int] = None,
+        exclude_kind: Optional[str] = None,
+        error_prefix: Optional[str] = None,
+    ) -> List[Execution]:
+        """Get executions in any of the given statuses, oldest first.
+
+        Filters in SQL on the (status, started_at) index instead of scanning
+        recent executions in Python.
+
+        Args:
+            statuses: Statuses to match
+            limit: Maximum number of executions to return (optional)
+            exclude_kind: Skip executions of this kind (optional)
+            error_prefix: Only match error messages starting with this (optional)
+
+        Returns:
+            List of Execution objects ordered by started_at ascending
+        """
+        query = self._status_query(statuses, exclude_kind, error_prefix)
+        query = query.order_by(asc(Execution.started_at))
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def count_by_status(
+        self, statuses: List[str], exclude_kind: Optional[str] = None
+    ) -> int:
+        """Count executions in any of the given statuses.
+
+        Args:
+            statuses: Statuses to match
+            exclude_kind: Skip executions of this kind (optional)
+
+        Returns:
+            Number of matching executions
+        """
+        query = self._status_query(statuses, exclude_kind)
+        return query.with_entities(func.count(Execution.id)).scalar() or 0
+
     def get_daily_job_number(self, execution: Execution) -> Optional[int]:
         """Get the execution's number within its local day (1-indexed)."""
         if not execution.started_at:
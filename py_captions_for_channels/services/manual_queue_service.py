@@ -1,7 +1,8 @@
 """Service layer for manual process queue operations."""
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from ..models import ManualQueueItem
 
@@ -88,6 +89,67 @@ class ManualQueueService:
         self.db.refresh(item)
         return item
 
+    def bulk_add_to_queue(self, items: List[Dict[str, Any]]) -> int:
+        """Add many paths to the queue in a single transaction.
+
+        Each item accepts the same keys as add_to_queue().  Paths already
+        in the queue have their settings updated, as with add_to_queue().
+
+        Args:
+            items: List of dicts with a "path" key and optional settings
+
+        Returns:
+            Number of items written
+        """
+        if not items:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        rows = {}
+        for entry in items:
+            generate_srt = entry.get("generate_srt")
+            if generate_srt is None:
+                generate_srt = not entry.get("skip_caption_generation", False)
+            run_transcode = entry.get("run_transcode")
+            if run_transcode is None:
+                run_transcode = True
+            # Later entries for the same path win, as with repeated adds
+            rows[entry["path"]] = {
+                "path": entry["path"],
+                "generate_srt": generate_srt,
+                "run_transcode": run_transcode,
+                "skip_caption_generation": not generate_srt,
+                "log_verbosity": entry.get("log_verbosity", "NORMAL"),
+                "added_at": now,
+                "updated_at": now,
+            }
+
+        stmt = sqlite_insert(ManualQueueItem).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ManualQueueItem.path],
+            set_={
+                "generate_srt": stmt.excluded.generate_srt,
+                "run_transcode": stmt.excluded.run_transcode,
+                "skip_caption_generation": stmt.excluded.skip_caption_generation,
+                "log_verbosity": stmt.excluded.log_verbosity,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.db.execute(stmt)
+        try:
+            self.db.commit()
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "no transaction" in error_msg:
+                pass
+            else:
+                try:
+                    self.db.rollback()
+                except Exception:
+                    pass  # Rollback itself may fail if no transaction
+                raise
+        return len(rows)
+
     def get_queue_item(self, path: str) -> Optional[ManualQueueItem]:
         """Get a specific queue item by path.
 
@@ -159,6 +221,37 @@ class ManualQueueService:
             return True
         return False
 
+    def remove_many_from_queue(self, paths: List[str]) -> int:
+        """Remove several paths from the queue in a single transaction.
+
+        Args:
+            paths: File paths to remove
+
+        Returns:
+            Number of items removed
+        """
+        if not paths:
+            return 0
+
+        removed = (
+            self.db.query(ManualQueueItem)
+            .filter(ManualQueueItem.path.in_(paths))
+            .delete(synchronize_session=False)
+        )
+        try:
+            self.db.commit()
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "no transaction" in error_msg:
+                pass
+            else:
+                try:
+                    self.db.rollback()
+                except Exception:
+                    pass  # Rollback itself may fail if no transaction
+                raise
+        return removed
+
     def clear_queue(self) -> int:
         """Remove all items from the queue.
 
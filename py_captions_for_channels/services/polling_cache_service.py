@@ -2,12 +2,42 @@
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from ..models import PollingCache
 from ..logging.structured_logger import get_logger
 
 LOG = get_logger(__name__)
 
+# Redis keys mirror the DB retention window used by cleanup_old() so the hot
+# cache never claims a recording the database has already forgotten.
+REDIS_KEY_PREFIX = "polling_cache:"
+REDIS_TTL_SECONDS = 24 * 3600
+
+
+def connect_redis(url: str):
+    """Create a Redis client for the polling cache hot layer.
+
+    Args:
+        url: Redis connection URL (e.g. ``redis://localhost:6379/0``)
+
+    Returns:
+        ``redis.Redis`` client, or None if the URL is empty, the ``redis``
+        package is not installed, or the server is unreachable
+    """
+    if not url:
+        return None
+    try:
+        import redis
+
+        client = redis.Redis.from_url(url, socket_timeout=1)
+        client.ping()
+        LOG.info("Polling cache using Redis hot layer at %s", url)
+        return client
+    except Exception as e:
+        LOG.warning("Redis unavailable for polling cache (%s); using DB only", e)
+        return None
+
 
 class PollingCacheService:
     """CRUD operations for polling cache.
@@ -16,13 +46,31 @@ class PollingCacheService:
     processing across restarts.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, redis_client=None):
         """Initialize service with database session.
 
         Args:
             db: SQLAlchemy database session
+            redis_client: Optional ``redis.Redis`` client used as a shared
+                hot cache in front of the database
         """
         self.db = db
+        self.redis = redis_client
+
+    def _redis_mark(self, rec_id: str, yielded_at: datetime) -> None:
+        """Record a yielded recording in Redis, expiring with the DB entry."""
+        if self.redis is None:
+            return
+        if yielded_at.tzinfo is None:
+            yielded_at = yielded_at.replace(tzinfo=timezone.utc)
+        age = (datetime.now(timezone.utc) - yielded_at).total_seconds()
+        ttl = int(REDIS_TTL_SECONDS - age)
+        if ttl <= 0:
+            return
+        try:
+            self.redis.set(REDIS_KEY_PREFIX + rec_id, 1, ex=ttl)
+        except Exception as e:
+            LOG.debug("Redis write failed for %s: %s", rec_id, e)
 
     def add_yielded(self, rec_id: str, yielded_at: Optional[datetime] = None) -> bool:
         """Add a recording to the yielded cache.
@@ -54,6 +102,7 @@ class PollingCacheService:
                     except Exception:
                         pass  # Rollback itself may fail if no transaction
                     raise
+            self._redis_mark(rec_id, yielded_at)
             return False
 
         # Add new entry
@@ -71,6 +120,7 @@ class PollingCacheService:
                 except Exception:
                     pass  # Rollback itself may fail if no transaction
                 raise
+        self._redis_mark(rec_id, yielded_at)
         return True
 
     def has_yielded(self, rec_id: str) -> bool:
@@ -82,10 +132,18 @@ class PollingCacheService:
         Returns:
             True if recording has been yielded
         """
+        if self.redis is not None:
+            try:
+                if self.redis.exists(REDIS_KEY_PREFIX + rec_id):
+                    return True
+            except Exception as e:
+                LOG.debug("Redis lookup failed for %s: %s", rec_id, e)
         try:
-            return (
-                self.db.query(PollingCache).filter_by(rec_id=rec_id).first() is not None
-            )
+            cache_item = self.db.query(PollingCache).filter_by(rec_id=rec_id).first()
+            if cache_item is None:
+                return False
+            self._redis_mark(rec_id, cache_item.yielded_at)
+            return True
         except Exception as e:
             # Handle session errors by rolling back and returning False
             try:
@@ -127,11 +185,12 @@ class PollingCacheService:
         """
         try:
             cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-            result = (
-                self.db.query(PollingCache)
-                .filter(PollingCache.yielded_at < cutoff)
-                .delete()
-            )
+            # Plain DML: no ORM row loading to synchronize the session
+            result = self.db.execute(
+                delete(PollingCache)
+                .where(PollingCache.yielded_at < cutoff)
+                .execution_options(synchronize_session=False)
+            ).rowcount
             try:
                 self.db.commit()
             except Exception as e:
@@ -178,8 +237,11 @@ class PollingCacheService:
         Returns:
             Number of entries removed
         """
+        self._redis_clear()
         try:
-            result = self.db.query(PollingCache).delete()
+            result = self.db.execute(
+                delete(PollingCache).execution_options(synchronize_session=False)
+            ).rowcount
             try:
                 self.db.commit()
             except Exception as e:
@@ -201,3 +263,14 @@ class PollingCacheService:
                 pass
             LOG.warning("Error clearing polling cache: %s", e)
             return 0
+
+    def _redis_clear(self) -> None:
+        """Drop all polling cache keys from Redis."""
+        if self.redis is None:
+            return
+        try:
+            keys = list(self.redis.scan_iter(match=REDIS_KEY_PREFIX + "*"))
+            if keys:
+                self.redis.delete(*keys)
+        except Exception as e:
+            LOG.debug("Redis clear failed: %s", e)
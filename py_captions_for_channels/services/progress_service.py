@@ -1,8 +1,8 @@
 """Service layer for progress tracking operations."""
 
-import json
 from datetime import datetime, timezone
 from typing import List, Optional, Dict
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from ..models import Progress
 
@@ -40,8 +40,7 @@ class ProgressService:
             # Check if progress entry exists
             progress = self.db.query(Progress).filter(Progress.job_id == job_id).first()
 
-            # Serialize details to JSON if present
-            details_json = json.dumps(details) if details else None
+            details = details or None
             now = datetime.now(timezone.utc)
 
             if progress:
@@ -49,7 +48,7 @@ class ProgressService:
                 progress.process_type = process_type
                 progress.percent = percent
                 progress.message = message
-                progress.progress_metadata = details_json
+                progress.progress_metadata = details
                 progress.updated_at = now
             else:
                 # Create new
@@ -58,7 +57,7 @@ class ProgressService:
                     process_type=process_type,
                     percent=percent,
                     message=message,
-                    progress_metadata=details_json,
+                    progress_metadata=details,
                     updated_at=now,
                 )
                 self.db.add(progress)
@@ -119,9 +118,12 @@ class ProgressService:
             True if removed, False if not found
         """
         try:
-            progress = self.get_progress(job_id)
-            if progress:
-                self.db.delete(progress)
+            removed = self.db.execute(
+                delete(Progress)
+                .where(Progress.job_id == job_id)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if removed:
                 try:
                     self.db.commit()
                 except Exception as e:
@@ -147,8 +149,10 @@ class ProgressService:
         Returns:
             Number of entries removed
         """
-        count = self.db.query(Progress).count()
-        self.db.query(Progress).delete()
+        # Single DELETE; rowcount gives the removed count without a COUNT(*) scan
+        count = self.db.execute(
+            delete(Progress).execution_options(synchronize_session=False)
+        ).rowcount
         try:
             self.db.commit()
         except Exception as e:
@@ -173,19 +177,11 @@ class ProgressService:
         Returns:
             Dict representation matching old JSON format
         """
-        # Deserialize metadata from JSON
-        metadata = {}
-        if progress.progress_metadata:
-            try:
-                metadata = json.loads(progress.progress_metadata)
-            except (json.JSONDecodeError, TypeError):
-                metadata = {}
-
         return {
             "process_type": progress.process_type,
             "percent": progress.percent,
             "message": progress.message,
-            "details": metadata,
+            "details": progress.progress_metadata or {},
             "updated_at": progress.updated_at.isoformat(),
         }
 
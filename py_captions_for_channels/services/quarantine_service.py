@@ -6,14 +6,19 @@ routed to the quarantine directory on its own filesystem so that
 ``os.rename()`` always succeeds (instant move, no cross-device copy).
 """
 
+import errno
+import itertools
 import logging
 import os
 import shutil
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
 
-from sqlalchemy import func
+from sqlalchemy import Row, bindparam, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..models import QuarantineItem
@@ -23,6 +28,107 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 
+# Max ids per IN (...) clause; stays well under SQLite's variable limit
+_MAX_IN_PARAMS = 500
+
+# Per-process counter; with the pid it makes quarantine names collision-free
+_SEQ = itertools.count()
+
+# Shard directories already created by this process
+_created_shards = set()
+
+# Rows fetched per round trip when streaming quarantine listings
+_STREAM_WINDOW = 1000
+
+# Worker threads for overlapping unlink() syscalls in batch deletes
+_UNLINK_WORKERS = 8
+
+
+def _chunks(items: List[int], size: int = _MAX_IN_PARAMS) -> Iterator[List[int]]:
+    """Split *items* into consecutive slices of at most *size* elements."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _now_param():
+    """Current UTC time as a named bind parameter.
+
+    Keeps the compiled SQL identical across calls (statement cache hits)
+    and replaces the deprecated, naive ``datetime.utcnow()``.
+    """
+    return bindparam("now", datetime.now(timezone.utc))
+
+
+def _shard_dir(base_dir: Path, filename: str) -> Path:
+    """Return (creating once) the shard subdirectory for *filename*.
+
+    Files are spread over 256 subdirectories keyed by a CRC of the name so
+    no single directory grows unbounded.  Existing records keep their full
+    ``quarantine_path``, so files quarantined before sharding stay valid.
+    """
+    shard = base_dir / f"{zlib.crc32(filename.encode()) & 0xFF:02x}"
+    if shard not in _created_shards:
+        shard.mkdir(parents=True, exist_ok=True)
+        _created_shards.add(shard)
+    return shard
+
+
+def _try_unlink(item_id: int, quarantine_path: str) -> bool:
+    """Remove a quarantined file, treating an already-missing file as success.
+
+    Returns:
+        True if the file is gone, False if removal failed
+    """
+    try:
+        os.remove(quarantine_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        LOG.error("Failed to delete item %d: %s", item_id, e)
+        return False
+    return True
+
+
+def _copy_file_range(src: str, dst: str) -> None:
+    """Copy *src* to *dst* in-kernel with ``os.copy_file_range``."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+            pass
+    shutil.copystat(src, dst)
+
+
+def _move_file(src: str, dst: str) -> None:
+    """Move a file, preferring rename, then a zero-copy cross-device copy.
+
+    ``os.rename`` is instant on the same filesystem.  Across filesystems
+    (``EXDEV``) the data is copied with ``os.copy_file_range`` so no bytes
+    pass through Python, then the source is unlinked.  ``shutil.move`` is
+    the last resort where ``copy_file_range`` is unavailable.
+    """
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        cross_device = e.errno == errno.EXDEV
+
+    if cross_device and hasattr(os, "copy_file_range"):
+        try:
+            _copy_file_range(src, dst)
+        except OSError as e:
+            if os.path.exists(dst):
+                os.unlink(dst)
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EOPNOTSUPP):
+                raise
+            LOG.debug("copy_file_range unsupported for %s: %s", src, e)
+        else:
+            os.unlink(src)
+            return
+
+    shutil.move(src, dst)
+
 
 class QuarantineService:
     """Service for managing quarantined orphaned files.
@@ -90,7 +196,9 @@ class QuarantineService:
     ) -> Optional[QuarantineItem]:
         """Move a file to quarantine instead of deleting it.
 
-        Skips files that don't exist or are already quarantined.
+        Skips files that don't exist or are already quarantined.  The
+        latter is detected by the unique index on active ``original_path``
+        rather than a separate lookup.
 
         Args:
             original_path: Original file path
@@ -104,46 +212,28 @@ class QuarantineService:
         """
         original_path_obj = Path(original_path)
 
+        # Single stat(): existence check and size in one syscall.
         # Skip if file doesn't exist (already moved by concurrent scan, etc.)
-        if not original_path_obj.exists():
+        try:
+            file_size = os.stat(original_path).st_size
+        except FileNotFoundError:
             LOG.debug(
                 "Skipping quarantine of %s: file does not exist (already moved?)",
                 original_path,
             )
             return None
 
-        # Skip if already quarantined (prevents duplicate DB records)
-        if self.is_already_quarantined(original_path):
-            LOG.debug(
-                "Skipping quarantine of %s: already quarantined",
-                original_path,
-            )
-            return None
-
-        # Generate quarantine path with timestamp + microseconds to avoid collisions
+        # Generate a unique quarantine path without probing the directory:
+        # timestamp + pid + per-process sequence cannot collide.
         # Route to same-filesystem quarantine dir when FilesystemService is available
         target_dir = self._resolve_quarantine_dir(original_path)
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"{timestamp}_{original_path_obj.name}"
-        quarantine_path = target_dir / filename
-
-        # Ensure uniqueness if file already exists
-        counter = 1
-        while quarantine_path.exists():
-            filename = f"{timestamp}_{counter}_{original_path_obj.name}"
-            quarantine_path = target_dir / filename
-            counter += 1
-
-        # Get file size before moving
-        file_size = original_path_obj.stat().st_size
+        unique = f"{os.getpid():x}-{next(_SEQ):x}"
+        filename = f"{timestamp}_{unique}_{original_path_obj.name}"
+        quarantine_path = _shard_dir(target_dir, filename) / filename
 
         # Move the file first, then create DB record (avoids ghost records)
-        # Try os.rename first (instant on same filesystem), fall back to
-        # shutil.move (cross-device copy) if that fails.
-        try:
-            os.rename(str(original_path), str(quarantine_path))
-        except OSError:
-            shutil.move(str(original_path), str(quarantine_path))
+        _move_file(str(original_path), str(quarantine_path))
 
         # Create database record after successful move
         expires_at = datetime.now(timezone.utc) + timedelta(days=expiration_days)
@@ -157,33 +247,44 @@ class QuarantineService:
             status="quarantined",
             expires_at=expires_at,
         )
-        self.db.add(item)
+        try:
+            # Savepoint so a duplicate only rolls back this insert
+            with self.db.begin_nested():
+                self.db.add(item)
+        except IntegrityError:
+            # Already quarantined (unique active original_path): undo the move
+            _move_file(str(quarantine_path), str(original_path))
+            LOG.debug(
+                "Skipping quarantine of %s: already quarantined",
+                original_path,
+            )
+            return None
+
         if not defer_commit:
             self.db.commit()
             self.db.refresh(item)
 
         return item
 
-    def restore_file(self, item_id: int) -> bool:
-        """Restore a quarantined file to its original location.
+    def _restore_one(self, item: QuarantineItem) -> bool:
+        """Move one quarantined file back and mark it restored (no commit).
 
         Args:
-            item_id: QuarantineItem ID
+            item: QuarantineItem to restore
 
         Returns:
-            True if restored successfully, False otherwise
+            True if restored, False if the item cannot be restored
         """
-        item = (
-            self.db.query(QuarantineItem).filter(QuarantineItem.id == item_id).first()
-        )
-        if not item or item.status != "quarantined":
+        if item.status != "quarantined":
             return False
 
         quarantine_path = Path(item.quarantine_path)
         original_path = Path(item.original_path)
 
         # Check if quarantined file exists
-        if not quarantine_path.exists():
+        try:
+            os.stat(quarantine_path)
+        except FileNotFoundError:
             return False
 
         # Check if original location is available
@@ -193,19 +294,111 @@ class QuarantineService:
         # Create parent directory if needed
         original_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Move file back — try rename first (instant on same FS)
-        try:
-            os.rename(str(quarantine_path), str(original_path))
-        except OSError:
-            shutil.move(str(quarantine_path), str(original_path))
+        # Move file back — rename when possible (instant on same FS)
+        _move_file(str(quarantine_path), str(original_path))
 
-        # Update database
         item.status = "restored"
         item.restored_at = datetime.now(timezone.utc)
-        self.db.commit()
+        return True
+
+    def _delete_one(self, item: QuarantineItem) -> bool:
+        """Remove one quarantined file and mark it deleted (no commit).
+
+        Args:
+            item: QuarantineItem to delete
+
+        Returns:
+            True if deleted, False if the item is not quarantined
+        """
+        if item.status != "quarantined":
+            return False
+
+        # Delete the file if it exists
+        try:
+            os.remove(item.quarantine_path)
+        except FileNotFoundError:
+            pass
+
+        item.status = "deleted"
+        item.deleted_at = datetime.now(timezone.utc)
+        return True
+
+    def restore_file(self, item_id: int) -> bool:
+        """Restore a quarantined file to its original location.
+
+        Args:
+            item_id: QuarantineItem ID
+
+        Returns:
+            True if restored successfully, False otherwise
+        """
+        item = (
+            self.db.query(QuarantineItem).filter(QuarantineItem.id == item_id).first()
+        )
+        if not item or not self._restore_one(item):
+            return False
 
+        self.db.commit()
         return True
 
+    def restore_files(self, item_ids: List[int]) -> Dict[int, Optional[str]]:
+        """Restore several quarantined files with a single commit.
+
+        If the commit fails, the files already moved are put back into
+        quarantine so disk and database agree, and reported as failed.
+
+        Args:
+            item_ids: QuarantineItem IDs to restore (duplicates are ignored)
+
+        Returns:
+            Dict mapping each ID to None if restored, or an error message
+        """
+        item_ids = list(dict.fromkeys(item_ids))
+        item_map = {}
+        for chunk in _chunks(item_ids):
+            item_map.update(
+                (item.id, item)
+                for item in self.db.query(QuarantineItem).filter(
+                    QuarantineItem.id.in_(chunk)
+                )
+            )
+
+        results = {}
+        moved = []  # (item_id, quarantine_path, original_path) to undo
+        for item_id in item_ids:
+            item = item_map.get(item_id)
+            if item is None:
+                results[item_id] = f"Failed to restore item {item_id}"
+                continue
+            paths = (item_id, item.quarantine_path, item.original_path)
+            try:
+                if self._restore_one(item):
+                    results[item_id] = None
+                    moved.append(paths)
+                else:
+                    results[item_id] = f"Failed to restore item {item_id}"
+            except Exception as e:
+                results[item_id] = f"Item {item_id}: {e}"
+
+        try:
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            LOG.error("Failed to record %d restore(s): %s", len(moved), e)
+            for item_id, quarantine_path, original_path in moved:
+                try:
+                    _move_file(original_path, quarantine_path)
+                    results[item_id] = (
+                        f"Item {item_id}: restore not recorded ({e}); "
+                        "left in quarantine"
+                    )
+                except OSError as move_error:
+                    results[item_id] = (
+                        f"Item {item_id}: restored to {original_path} but not "
+                        f"recorded ({e}); could not undo: {move_error}"
+                    )
+        return results
+
     def delete_file(self, item_id: int) -> bool:
         """Permanently delete a quarantined file.
 
@@ -218,22 +411,27 @@ class QuarantineService:
         item = (
             self.db.query(QuarantineItem).filter(QuarantineItem.id == item_id).first()
         )
-        if not item or item.status != "quarantined":
+        if not item or not self._delete_one(item):
             return False
 
-        quarantine_path = Path(item.quarantine_path)
-
-        # Delete the file if it exists
-        if quarantine_path.exists():
-            os.remove(quarantine_path)
-
-        # Update database
-        item.status = "deleted"
-        item.deleted_at = datetime.now(timezone.utc)
         self.db.commit()
-
         return True
 
+    def _mark_deleted(self, item_ids: List[int], now: datetime) -> None:
+        """Mark items as deleted with set-based UPDATEs (no commit).
+
+        Args:
+            item_ids: QuarantineItem IDs whose files have been removed
+            now: Deletion timestamp to record
+        """
+        for chunk in _chunks(item_ids):
+            self.db.execute(
+                update(QuarantineItem)
+                .where(QuarantineItem.id.in_(chunk))
+                .values(status="deleted", deleted_at=now)
+                .execution_options(synchronize_session=False)
+            )
+
     def get_quarantined_files(
         self, include_expired: bool = True
     ) -> List[QuarantineItem]:
@@ -250,10 +448,46 @@ class QuarantineService:
         )
 
         if not include_expired:
-            query = query.filter(QuarantineItem.expires_at > datetime.utcnow())
+            query = query.filter(QuarantineItem.expires_at > _now_param())
 
         return query.order_by(QuarantineItem.original_path.asc()).all()
 
+    def get_quarantined_rows(self, include_expired: bool = True) -> Iterator[Row]:
+        """Stream quarantined items as lightweight Core rows.
+
+        Same filtering and ordering as :meth:`get_quarantined_files`, but
+        selects only the listed columns and fetches in windows of
+        ``_STREAM_WINDOW`` rows instead of building every ORM instance.
+
+        Args:
+            include_expired: Include expired items
+
+        Yields:
+            Rows with id, original_path, quarantine_path, file_type,
+            recording_path, file_size_bytes, reason, status, created_at
+            and expires_at attributes
+        """
+        stmt = select(
+            QuarantineItem.id,
+            QuarantineItem.original_path,
+            QuarantineItem.quarantine_path,
+            QuarantineItem.file_type,
+            QuarantineItem.recording_path,
+            QuarantineItem.file_size_bytes,
+            QuarantineItem.reason,
+            QuarantineItem.status,
+            QuarantineItem.created_at,
+            QuarantineItem.expires_at,
+        ).where(QuarantineItem.status == "quarantined")
+
+        if not include_expired:
+            stmt = stmt.where(QuarantineItem.expires_at > _now_param())
+
+        stmt = stmt.order_by(QuarantineItem.original_path.asc()).execution_options(
+            yield_per=_STREAM_WINDOW
+        )
+        yield from self.db.execute(stmt)
+
     def get_expired_files(self) -> List[QuarantineItem]:
         """Get all quarantined files past their expiration date.
 
@@ -264,7 +498,7 @@ class QuarantineService:
             self.db.query(QuarantineItem)
             .filter(
                 QuarantineItem.status == "quarantined",
-                QuarantineItem.expires_at <= datetime.utcnow(),
+                QuarantineItem.expires_at <= _now_param(),
             )
             .order_by(QuarantineItem.created_at.desc())
             .all()
@@ -273,17 +507,32 @@ class QuarantineService:
     def delete_expired_files(self) -> int:
         """Delete all expired quarantined files.
 
+        Unlinks the expired files concurrently, then marks the ones that
+        are gone deleted with set-based UPDATEs; an item whose file could
+        not be removed stays quarantined and is retried next time.
+
         Returns:
             Number of files deleted
         """
-        expired = self.get_expired_files()
-        count = 0
+        now = datetime.now(timezone.utc)
+        rows = self.db.execute(
+            select(QuarantineItem.id, QuarantineItem.quarantine_path).where(
+                QuarantineItem.status == "quarantined",
+                QuarantineItem.expires_at <= bindparam("now", now),
+            )
+        ).all()
+        if not rows:
+            return 0
 
-        for item in expired:
-            if self.delete_file(item.id):
-                count += 1
+        with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+            results = pool.map(lambda row: _try_unlink(*row), rows)
+            deleted_ids = [row.id for row, ok in zip(rows, results) if ok]
 
-        return count
+        if deleted_ids:
+            self._mark_deleted(deleted_ids, now)
+            self.db.commit()
+
+        return len(deleted_ids)
 
     def delete_files_batch(
         self,
@@ -297,68 +546,75 @@ class QuarantineService:
 
         Args:
             item_ids: List of QuarantineItem IDs to delete
-            batch_size: Number of items to process before committing
-            cancel_check: Called between items; return True to cancel
+            batch_size: Number of items to unlink concurrently per commit
+            cancel_check: Called between batches; return True to cancel
 
         Yields:
             Tuples of (current, total, deleted, failed, cancelled)
         """
+        # Each ID counts once, however often it was selected
+        item_ids = list(dict.fromkeys(item_ids))
         deleted = 0
         failed = 0
         cancelled = False
         total = len(item_ids)
+        processed = 0
         now = datetime.now(timezone.utc)
 
-        # Pre-fetch all items in one query
-        items = (
-            self.db.query(QuarantineItem).filter(QuarantineItem.id.in_(item_ids)).all()
-        )
-        item_map = {item.id: item for item in items}
-
-        for i, item_id in enumerate(item_ids):
-            # Check cancellation
-            if cancel_check and cancel_check():
-                cancelled = True
-                LOG.info(
-                    "Delete batch cancelled at %d/%d (deleted=%d)",
-                    i,
-                    total,
-                    deleted,
+        # Pre-fetch (status, quarantine_path) as plain rows, chunked to stay
+        # under SQLite's variable limit.  Not ORM objects: the per-batch
+        # commits would expire them and reload each one with its own SELECT.
+        item_map = {}
+        for chunk in _chunks(item_ids):
+            item_map.update(
+                (row.id, (row.status, row.quarantine_path))
+                for row in self.db.execute(
+                    select(
+                        QuarantineItem.id,
+                        QuarantineItem.status,
+                        QuarantineItem.quarantine_path,
+                    ).where(QuarantineItem.id.in_(chunk))
                 )
-                break
-
-            item = item_map.get(item_id)
-            if not item or item.status != "quarantined":
-                failed += 1
-                continue
-
-            try:
-                quarantine_path = Path(item.quarantine_path)
-                if quarantine_path.exists():
-                    os.remove(quarantine_path)
-
-                item.status = "deleted"
-                item.deleted_at = now
-                deleted += 1
-
-            except Exception as e:
-                failed += 1
-                LOG.error("Failed to delete item %d: %s", item_id, e)
+            )
 
-            # Batch commit
-            if (i + 1) % batch_size == 0:
+        with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+            for start in range(0, total, batch_size):
+                # Check cancellation between chunks
+                if cancel_check and cancel_check():
+                    cancelled = True
+                    LOG.info(
+                        "Delete batch cancelled at %d/%d (deleted=%d)",
+                        processed,
+                        total,
+                        deleted,
+                    )
+                    break
+
+                chunk_ids = item_ids[start : start + batch_size]
+                targets = []
+                for item_id in chunk_ids:
+                    status, quarantine_path = item_map.get(item_id, (None, None))
+                    if status != "quarantined":
+                        failed += 1
+                        continue
+                    targets.append((item_id, quarantine_path))
+
+                # Unlinks are I/O-bound; overlap them across the pool
+                results = pool.map(lambda t: _try_unlink(*t), targets)
+                pending_ids = [
+                    item_id for (item_id, _), ok in zip(targets, results) if ok
+                ]
+                deleted += len(pending_ids)
+                failed += len(targets) - len(pending_ids)
+
+                self._mark_deleted(pending_ids, now)
                 self.db.commit()
 
-            # Yield progress periodically or on last item
-            progress_interval = max(1, min(50, total // 20))
-            if (i + 1) % progress_interval == 0 or i == total - 1:
-                yield (i + 1, total, deleted, failed, cancelled)
-
-        # Final commit for remaining items
-        self.db.commit()
+                processed += len(chunk_ids)
+                yield (processed, total, deleted, failed, cancelled)
 
         # Yield final state
-        yield (total if not cancelled else i, total, deleted, failed, cancelled)
+        yield (processed, total, deleted, failed, cancelled)
 
     def deduplicate(self) -> dict:
         """Remove duplicate quarantine entries (keep newest for each original_path).
@@ -368,59 +624,60 @@ class QuarantineService:
         Returns:
             Dict with duplicates_removed count and details
         """
-        # Find original_paths with more than one active quarantine record
-        dupes = (
-            self.db.query(
+        # Rank active records per original_path, newest first; anything
+        # ranked below 1 is a duplicate.  One query instead of 1 + D.
+        ranked = (
+            select(
+                QuarantineItem.id,
                 QuarantineItem.original_path,
-                func.count(QuarantineItem.id).label("cnt"),
+                QuarantineItem.quarantine_path,
+                func.row_number()
+                .over(
+                    partition_by=QuarantineItem.original_path,
+                    order_by=(
+                        QuarantineItem.created_at.desc(),
+                        QuarantineItem.id.desc(),
+                    ),
+                )
+                .label("rn"),
             )
-            .filter(QuarantineItem.status == "quarantined")
-            .group_by(QuarantineItem.original_path)
-            .having(func.count(QuarantineItem.id) > 1)
-            .all()
+            .where(QuarantineItem.status == "quarantined")
+            .cte("ranked")
         )
+        dupes = self.db.execute(
+            select(ranked.c.id, ranked.c.original_path, ranked.c.quarantine_path)
+            .where(ranked.c.rn > 1)
+            .order_by(ranked.c.original_path, ranked.c.rn)
+        ).all()
 
-        removed = 0
+        removed_ids = []
         details = []
 
-        for original_path, count in dupes:
-            # Get all records for this path, newest first
-            records = (
-                self.db.query(QuarantineItem)
-                .filter(
-                    QuarantineItem.original_path == original_path,
-                    QuarantineItem.status == "quarantined",
+        for dup_id, original_path, dup_quarantine_path in dupes:
+            # If the quarantine file doesn't exist, just mark as deleted
+            try:
+                os.remove(dup_quarantine_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                LOG.warning(
+                    "Could not remove duplicate quarantine file %s: %s",
+                    dup_quarantine_path,
+                    e,
                 )
-                .order_by(QuarantineItem.created_at.desc())
-                .all()
-            )
 
-            # Keep the first (newest) record, mark the rest as duplicates
-            for dup in records[1:]:
-                # If the quarantine file doesn't exist, just mark as deleted
-                quarantine_path = Path(dup.quarantine_path)
-                if quarantine_path.exists():
-                    try:
-                        os.remove(quarantine_path)
-                    except OSError as e:
-                        LOG.warning(
-                            "Could not remove duplicate quarantine file %s: %s",
-                            quarantine_path,
-                            e,
-                        )
-
-                dup.status = "deleted"
-                dup.deleted_at = datetime.now(timezone.utc)
-                removed += 1
-                details.append(f"Removed duplicate #{dup.id} for {original_path}")
+            removed_ids.append(dup_id)
+            details.append(f"Removed duplicate #{dup_id} for {original_path}")
 
+        removed = len(removed_ids)
         if removed > 0:
+            self._mark_deleted(removed_ids, datetime.now(timezone.utc))
             self.db.commit()
             LOG.info("Deduplicated quarantine: removed %d duplicate entries", removed)
 
         return {
             "duplicates_removed": removed,
-            "duplicate_paths": len(dupes),
+            "duplicate_paths": len({row.original_path for row in dupes}),
             "details": details,
         }
 
@@ -430,11 +687,22 @@ class QuarantineService:
         Returns:
             Dictionary with stats
         """
-        quarantined = self.get_quarantined_files()
-        expired = self.get_expired_files()
-
-        total_size = sum(
-            item.file_size_bytes for item in quarantined if item.file_size_bytes
+        # Aggregate in SQL rather than hydrating every quarantined row
+        total_quarantined, total_size = (
+            self.db.query(
+                func.count(QuarantineItem.id),
+                func.coalesce(func.sum(QuarantineItem.file_size_bytes), 0),
+            )
+            .filter(QuarantineItem.status == "quarantined")
+            .one()
+        )
+        total_expired = (
+            self.db.query(func.count(QuarantineItem.id))
+            .filter(
+                QuarantineItem.status == "quarantined",
+                QuarantineItem.expires_at <= _now_param(),
+            )
+            .scalar()
         )
 
         # Last purge time and total bytes recovered — 30-day sliding window
@@ -454,8 +722,8 @@ class QuarantineService:
         total_purged_bytes = int(purge_row[1]) if purge_row[1] else 0
 
         return {
-            "total_quarantined": len(quarantined),
-            "total_expired": len(expired),
+            "total_quarantined": total_quarantined,
+            "total_expired": total_expired,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "last_purge_at": last_purge_at.isoformat() + "Z" if last_purge_at else None,
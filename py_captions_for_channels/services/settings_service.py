@@ -1,21 +1,95 @@
 """Settings service for database-backed configuration management."""
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from ..models import Setting
 from datetime import datetime, timezone
 
 
+def _convert(value_type: str, value: str) -> Any:
+    """Convert a stored setting string to its declared type.
+
+    Args:
+        value_type: Stored type tag ('bool', 'int', 'float', 'json', 'string')
+        value: Stored string value
+
+    Returns:
+        Value converted to the appropriate Python type
+    """
+    if value_type == "bool":
+        return value.lower() in ("true", "1", "yes", "on")
+    elif value_type == "int":
+        return int(value)
+    elif value_type == "float":
+        return float(value)
+    elif value_type == "json":
+        return json.loads(value)
+    else:  # string
+        return value
+
+
+# Exact-type dispatch for the common cases; keyed on type(value), so bool
+# never matches int the way isinstance() would
+_ENCODERS = {
+    bool: ("bool", lambda v: str(v).lower()),
+    int: ("int", str),
+    float: ("float", str),
+    dict: ("json", json.dumps),
+    list: ("json", json.dumps),
+    str: ("string", str),
+}
+
+
+def _encode(value: Any) -> Tuple[str, str]:
+    """Determine a value's type tag and string form for storage.
+
+    Args:
+        value: Setting value (any JSON-serializable type)
+
+    Returns:
+        Tuple of (value_type, value_str)
+    """
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        value_type, to_str = encoder
+        return value_type, to_str(value)
+
+    # Subclasses (e.g. IntEnum) fall back to the isinstance checks
+    if isinstance(value, bool):
+        return "bool", str(value).lower()
+    elif isinstance(value, int):
+        return "int", str(value)
+    elif isinstance(value, float):
+        return "float", str(value)
+    elif isinstance(value, (dict, list)):
+        return "json", json.dumps(value)
+    else:
+        return "string", str(value)
+
+
 class SettingsService:
     """Service for managing application settings in the database.
 
     Provides type-safe get/set operations with automatic type conversion.
     Replaces: load_settings/save_settings functions in web_app.py
+
+    Reads are served from a lazily loaded per-instance cache of the stored
+    (value_type, value) pairs, so create one service per session/request.
     """
 
     def __init__(self, db: Session):
         self.db = db
+        self._cache: Optional[Dict[str, Tuple[str, str]]] = None
+
+    def _load_cache(self) -> Dict[str, Tuple[str, str]]:
+        """Load every stored setting with a single SELECT on first use."""
+        if self._cache is None:
+            self._cache = {
+                s.key: (s.value_type, s.value) for s in self.db.query(Setting).all()
+            }
+        return self._cache
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value with type conversion.
@@ -27,24 +101,11 @@ class SettingsService:
         Returns:
             Setting value converted to appropriate type, or default
         """
-        setting = self.db.query(Setting).filter(Setting.key == key).first()
-        if not setting:
+        stored = self._load_cache().get(key)
+        if stored is None:
             return default
 
-        # Convert from stored string to actual type
-        value_type = setting.value_type
-        value = setting.value
-
-        if value_type == "bool":
-            return value.lower() in ("true", "1", "yes", "on")
-        elif value_type == "int":
-            return int(value)
-        elif value_type == "float":
-            return float(value)
-        elif value_type == "json":
-            return json.loads(value)
-        else:  # string
-            return value
+        return _convert(*stored)
 
     def set(self, key: str, value: Any) -> None:
         """Set a setting value with automatic type detection.
@@ -53,50 +114,7 @@ class SettingsService:
             key: Setting key
             value: Setting value (any JSON-serializable type)
         """
-        # Determine type and convert to string for storage
-        if isinstance(value, bool):
-            value_type = "bool"
-            value_str = str(value).lower()
-        elif isinstance(value, int):
-            value_type = "int"
-            value_str = str(value)
-        elif isinstance(value, float):
-            value_type = "float"
-            value_str = str(value)
-        elif isinstance(value, (dict, list)):
-            value_type = "json"
-            value_str = json.dumps(value)
-        else:
-            value_type = "string"
-            value_str = str(value)
-
-        # Update or create setting
-        setting = self.db.query(Setting).filter(Setting.key == key).first()
-        if setting:
-            setting.value = value_str
-            setting.value_type = value_type
-            setting.updated_at = datetime.now(timezone.utc)
-        else:
-            setting = Setting(
-                key=key,
-                value=value_str,
-                value_type=value_type,
-                updated_at=datetime.now(timezone.utc),
-            )
-            self.db.add(setting)
-
-        try:
-            self.db.commit()
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "no transaction" in error_msg:
-                pass
-            else:
-                try:
-                    self.db.rollback()
-                except Exception:
-                    pass  # Rollback itself may fail if no transaction
-                raise
+        self.set_many({key: value})
 
     def get_all(self) -> Dict[str, Any]:
         """Get all settings as a dictionary.
@@ -104,12 +122,7 @@ class SettingsService:
         Returns:
             Dictionary of all settings with type conversion applied
         """
-        settings = self.db.query(Setting).all()
-        result = {}
-        for setting in settings:
-            # Use get() method to apply type conversion
-            result[setting.key] = self.get(setting.key)
-        return result
+        return {key: _convert(*stored) for key, stored in self._load_cache().items()}
 
     def set_many(self, settings: Dict[str, Any]) -> None:
         """Set multiple settings at once.
@@ -117,8 +130,50 @@ class SettingsService:
         Args:
             settings: Dictionary of key-value pairs to set
         """
+        if not settings:
+            return
+
+        now = datetime.now(timezone.utc)
+        rows = []
         for key, value in settings.items():
-            self.set(key, value)
+            value_type, value_str = _encode(value)
+            rows.append(
+                {
+                    "key": key,
+                    "value": value_str,
+                    "value_type": value_type,
+                    "updated_at": now,
+                }
+            )
+
+        # One INSERT ... ON CONFLICT DO UPDATE and a single commit for all keys
+        stmt = sqlite_insert(Setting).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Setting.key],
+            set_={
+                "value": stmt.excluded.value,
+                "value_type": stmt.excluded.value_type,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.db.execute(stmt)
+
+        try:
+            self.db.commit()
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "no transaction" in error_msg:
+                pass
+            else:
+                try:
+                    self.db.rollback()
+                except Exception:
+                    pass  # Rollback itself may fail if no transaction
+                raise
+
+        if self._cache is not None:
+            for row in rows:
+                self._cache[row["key"]] = (row["value_type"], row["value"])
 
     def delete(self, key: str) -> bool:
         """Delete a setting.
@@ -144,6 +199,8 @@ class SettingsService:
                     except Exception:
                         pass  # Rollback itself may fail if no transaction
                     raise
+            if self._cache is not None:
+                self._cache.pop(key, None)
             return True
         return False
 
@@ -153,7 +210,6 @@ class SettingsService:
         Args:
             defaults: Dictionary of default key-value pairs
         """
-        for key, value in defaults.items():
-            existing = self.db.query(Setting).filter(Setting.key == key).first()
-            if not existing:
-                self.set(key, value)
+        existing = self._load_cache()
+        missing = {k: v for k, v in defaults.items() if k not in existing}
+        self.set_many(missing)
@@ -18,7 +18,6 @@ LOG = logging.getLogger(__name__)
 class ShutdownState:
     """Tracks shutdown state and timing."""
 
-    requested: bool = False
     graceful: bool = False
     requested_at: Optional[datetime] = None
     initiated_by: Optional[str] = None
@@ -30,6 +29,10 @@ class ShutdownController:
     def __init__(self):
         self._state = ShutdownState()
         self._shutdown_event = asyncio.Event()
+        # The event is the source of truth for "requested"; these derived
+        # flags are set once on transition so the predicates stay one load
+        self._graceful_flag = False
+        self._immediate_flag = False
 
     def request_immediate_shutdown(self, initiated_by: str = "api"):
         """
@@ -38,12 +41,12 @@ class ShutdownController:
         Args:
             initiated_by: Who initiated the shutdown (e.g., "api", "signal")
         """
-        if self._state.requested:
+        if self._shutdown_event.is_set():
             LOG.warning("Shutdown already requested, ignoring duplicate request")
             return
 
-        self._state.requested = True
         self._state.graceful = False
+        self._immediate_flag = True
         self._state.requested_at = datetime.now(timezone.utc)
         self._state.initiated_by = initiated_by
         self._shutdown_event.set()
@@ -61,12 +64,12 @@ class ShutdownController:
         Args:
             initiated_by: Who initiated the shutdown (e.g., "api", "signal")
         """
-        if self._state.requested:
+        if self._shutdown_event.is_set():
             LOG.warning("Shutdown already requested, ignoring duplicate request")
             return
 
-        self._state.requested = True
         self._state.graceful = True
+        self._graceful_flag = True
         self._state.requested_at = datetime.now(timezone.utc)
         self._state.initiated_by = initiated_by
         self._shutdown_event.set()
@@ -80,20 +83,20 @@ class ShutdownController:
 
     def is_shutdown_requested(self) -> bool:
         """Check if any shutdown has been requested."""
-        return self._state.requested
+        return self._shutdown_event.is_set()
 
     def is_graceful_shutdown(self) -> bool:
         """Check if graceful shutdown is requested."""
-        return self._state.requested and self._state.graceful
+        return self._graceful_flag
 
     def is_immediate_shutdown(self) -> bool:
         """Check if immediate shutdown is requested."""
-        return self._state.requested and not self._state.graceful
+        return self._immediate_flag
 
     def get_state(self) -> dict:
         """Get current shutdown state as a dict."""
         return {
-            "shutdown_requested": self._state.requested,
+            "shutdown_requested": self._shutdown_event.is_set(),
             "shutdown_graceful": self._state.graceful,
             "shutdown_requested_at": (
                 self._state.requested_at.isoformat()
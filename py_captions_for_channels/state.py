@@ -1,12 +1,32 @@
 """State management for pipeline with database backend for manual queue."""
 
+import asyncio
 import json
 import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from .database import get_db
 from .services.manual_queue_service import ManualQueueService
 
+# Parsed last_timestamp values keyed by the state file's stat signature, so
+# repeated _load() calls skip JSON parsing while the file is unchanged.
+# st_ino is part of the key because every write replaces the file.
+_LOAD_CACHE = {}
+_LOAD_CACHE_MAX = 32
+_MISSING = object()
+_CORRUPT = object()
+
+
+def _remember_load(key: tuple, last_ts):
+    """Store a parsed state file in _LOAD_CACHE, evicting the oldest entry."""
+    if len(_LOAD_CACHE) >= _LOAD_CACHE_MAX:
+        del _LOAD_CACHE[next(iter(_LOAD_CACHE))]
+    _LOAD_CACHE[key] = last_ts
+
 
 class StateBackend:
     """
@@ -16,24 +36,117 @@ class StateBackend:
     State storage:
     - last_ts: Stored in JSON file for backward compatibility
     - manual_process_queue: Migrated to database (ManualQueueItem model)
+
+    Manual queue lookups are served from an in-memory mirror of the table.
+    The mirror is updated on every write made through this backend and
+    reloaded from the database after QUEUE_CACHE_TTL seconds, or when the
+    full queue is listed more than QUEUE_LIST_TTL seconds after the last
+    load, to pick up writes from other processes.
     """
 
+    QUEUE_CACHE_TTL = 60.0
+    QUEUE_LIST_TTL = 1.0
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+    # State paths whose migration marker is known to exist
+    _migrated_paths = set()
+
     def __init__(self, path: str):
         self.path = path
         self.last_ts = None
+        # Create the state directory once instead of checking on every write
+        self._dir = os.path.dirname(self.path)
+        if self._dir:
+            os.makedirs(self._dir, exist_ok=True)
+        self._persisted_ts = _MISSING  # Value last written to / read from disk
+        self._deferred = False
+        self._queue_cache = None
+        self._queue_cache_loaded_at = 0.0
+        # (loop, asyncio.Event) pairs woken when a request is queued
+        self._manual_listeners = []
+        self._listeners_lock = threading.Lock()
         self._load()
         self._migrate_manual_queue()
 
-    def _get_service(self) -> ManualQueueService:
-        """Get ManualQueueService with database session."""
-        db = next(get_db())
-        return ManualQueueService(db)
+    @classmethod
+    def get(cls, path: str) -> "StateBackend":
+        """Return the shared StateBackend for a state file path.
+
+        The watcher and the web app run in one process; sharing an instance
+        avoids re-reading the state file and re-running the queue migration
+        for every consumer.
+
+        Args:
+            path: Path to the state JSON file
+
+        Returns:
+            The process-wide StateBackend for the normalized path
+        """
+        key = os.path.realpath(path)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(path)
+                cls._instances[key] = instance
+            return instance
+
+    @contextmanager
+    def _get_service(self):
+        """Get ManualQueueService with a session scoped to the caller.
+
+        Callers run on arbitrary threads (the watcher loop, asyncio.to_thread
+        and the web app's threadpool), so the session is closed when the
+        block exits instead of being cached on the thread.
+
+        Usage:
+            with self._get_service() as service:
+                service.add_to_queue(...)
+        """
+        db_gen = get_db()
+        try:
+            yield ManualQueueService(next(db_gen))
+        finally:
+            db_gen.close()
+
+    @staticmethod
+    def _item_settings(item) -> dict:
+        """Extract the per-item settings dict from a ManualQueueItem."""
+        return {
+            "generate_srt": item.generate_srt,
+            "run_transcode": item.run_transcode,
+            "skip_caption_generation": item.skip_caption_generation,
+            "log_verbosity": item.log_verbosity,
+        }
+
+    def _refresh_queue_cache(self) -> dict:
+        """Reload the manual queue mirror from the database."""
+        with self._get_service() as service:
+            self._queue_cache = {
+                item.path: self._item_settings(item) for item in service.get_queue()
+            }
+        self._queue_cache_loaded_at = time.monotonic()
+        return self._queue_cache
+
+    def _queue_items(self) -> dict:
+        """Return the manual queue mirror, reloading it once it has expired."""
+        if (
+            self._queue_cache is None
+            or time.monotonic() - self._queue_cache_loaded_at > self.QUEUE_CACHE_TTL
+        ):
+            return self._refresh_queue_cache()
+        return self._queue_cache
 
     def _migrate_manual_queue(self):
         """Migrate manual process queue from JSON to database on first run."""
+        migrated = type(self)._migrated_paths
+        if self.path in migrated:
+            return  # Marker seen earlier in this process
+
         migration_marker = Path(self.path).parent / ".manual_queue_migrated"
 
         if migration_marker.exists():
+            migrated.add(self.path)
             return  # Already migrated
 
         # Check if we have data in JSON to migrate
@@ -46,73 +159,125 @@ class StateBackend:
                     )
 
                     if manual_data:
-                        service = self._get_service()
-
                         # Handle both list (old) and dict (new) formats
                         if isinstance(manual_data, list):
-                            for path in manual_data:
-                                service.add_to_queue(path)
+                            items = [{"path": path} for path in manual_data]
                         else:
-                            for path, settings in manual_data.items():
-                                service.add_to_queue(
-                                    path,
-                                    skip_caption_generation=settings.get(
+                            items = [
+                                {
+                                    "path": path,
+                                    "skip_caption_generation": settings.get(
                                         "skip_caption_generation", False
                                     ),
-                                    log_verbosity=settings.get(
+                                    "log_verbosity": settings.get(
                                         "log_verbosity", "NORMAL"
                                     ),
-                                )
+                                }
+                                for path, settings in manual_data.items()
+                            ]
+                        # One transaction for the whole queue
+                        with self._get_service() as service:
+                            service.bulk_add_to_queue(items)
 
                         # Mark as migrated
                         migration_marker.touch()
+                        migrated.add(self.path)
 
-                        # Rename state.json to preserve it
+                        # Copy state.json to preserve it (byte copy, no
+                        # re-encoding; state.json itself still holds last_ts)
                         backup_path = self.path + ".manual_queue_migrated"
                         if not os.path.exists(backup_path):
-                            with open(backup_path, "w") as f:
-                                json.dump(data, f, indent=2)
+                            shutil.copyfile(self.path, backup_path)
             except Exception:
                 pass  # Ignore migration errors
 
     def _load(self):
         """Load last_ts from JSON file (manual queue now in database)."""
-        if os.path.exists(self.path):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+        key = (self.path, st.st_ino, st.st_mtime_ns, st.st_size)
+        parsed = _LOAD_CACHE.get(key, _MISSING)
+        if parsed is _MISSING:
             try:
                 with open(self.path, "r") as f:
                     data = json.load(f)
                     ts_str = data.get("last_timestamp")
-                    if ts_str:
-                        self.last_ts = datetime.fromisoformat(ts_str)
+                    parsed = datetime.fromisoformat(ts_str) if ts_str else None
             except Exception:
-                # Corrupt state file? Reset safely.
-                self.last_ts = None
+                parsed = _CORRUPT
+            _remember_load(key, parsed)
+
+        if parsed is _CORRUPT:
+            # Corrupt state file? Reset safely.
+            self.last_ts = None
+            self._persisted_ts = _MISSING
+        else:
+            self._persisted_ts = parsed
+            if parsed is not None:
+                self.last_ts = parsed
+
+    @property
+    def last_ts(self):
+        """Last processed timestamp, as loaded or last passed to update()."""
+        return self._last_ts
+
+    @last_ts.setter
+    def last_ts(self, value):
+        self._last_ts = value
+        # Timezone-aware copy used by should_process(), computed once here
+        # rather than on every comparison
+        if isinstance(value, datetime) and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        self._last_ts_aware = value
 
     def should_process(self, ts: datetime) -> bool:
         """
         Returns True if this timestamp is newer than the last processed one.
         Ensures both timestamps have timezone info for comparison.
         """
-        if self.last_ts is None:
+        if self._last_ts_aware is None:
             return True
 
-        # Ensure both timestamps are timezone-aware for comparison
-        ts_aware = ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
-        last_ts_aware = (
-            self.last_ts
-            if self.last_ts.tzinfo is not None
-            else self.last_ts.replace(tzinfo=timezone.utc)
-        )
-
-        return ts_aware > last_ts_aware
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        return ts > self._last_ts_aware
 
     def update(self, ts: datetime):
         """
         Persist the new timestamp safely using an atomic write.
-        Ensures the directory exists before writing.
+        The state directory is created once, in __init__.
+
+        The write is skipped when the timestamp matches what is already on
+        disk, and deferred until the end of a batched_updates() block.
         """
         self.last_ts = ts  # Update in-memory state
+        if self._deferred or ts == self._persisted_ts:
+            return
         self._persist_state(ts)
+        self._persisted_ts = ts
+
+    @contextmanager
+    def batched_updates(self):
+        """Group several update() calls into a single write.
+
+        Usage:
+            with state.batched_updates():
+                for event in events:
+                    state.update(event.timestamp)
+        """
+        if self._deferred:
+            yield self  # Already inside an outer batch
+            return
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            if self.last_ts != self._persisted_ts:
+                self._persist_state(self.last_ts)
+                self._persisted_ts = self.last_ts
 
     def mark_for_manual_process(
         self,
@@ -125,36 +290,61 @@ class StateBackend:
         Mark a file path for manual processing with specific settings.
         Now stores in database via ManualQueueService.
         """
-        service = self._get_service()
-        service.add_to_queue(
-            path,
-            log_verbosity=log_verbosity,
-            generate_srt=generate_srt,
-            run_transcode=run_transcode,
-        )
+        with self._get_service() as service:
+            item = service.add_to_queue(
+                path,
+                log_verbosity=log_verbosity,
+                generate_srt=generate_srt,
+                run_transcode=run_transcode,
+            )
+            settings = self._item_settings(item)
+        if self._queue_cache is not None:
+            self._queue_cache[path] = settings
+        self._notify_manual_process()
+
+    def manual_process_event(self) -> asyncio.Event:
+        """Create an event that is set whenever a manual request is queued.
+
+        Must be called from a running event loop; the event is set on that
+        loop even when the request is queued from another thread (e.g. the
+        web app).  Requests written by other processes are not signalled,
+        so waiters should still use a timeout.
+
+        Returns:
+            asyncio.Event bound to the calling loop
+        """
+        event = asyncio.Event()
+        with self._listeners_lock:
+            self._manual_listeners.append((asyncio.get_running_loop(), event))
+        return event
+
+    def _notify_manual_process(self):
+        """Set every registered manual-process event on its own loop."""
+        with self._listeners_lock:
+            listeners = list(self._manual_listeners)
+        for loop, event in listeners:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # Loop closed
+                with self._listeners_lock:
+                    if (loop, event) in self._manual_listeners:
+                        self._manual_listeners.remove((loop, event))
 
     def has_manual_process_request(self, path: str) -> bool:
         """
         Check if a path is marked for manual processing.
-        Now checks database via ManualQueueService.
+        Served from the in-memory queue mirror.
         """
-        service = self._get_service()
-        return service.has_path(path)
+        return path in self._queue_items()
 
     def get_manual_process_settings(self, path: str) -> dict:
         """
         Get manual process settings for a path.
-        Now retrieves from database via ManualQueueService.
-        """
-        service = self._get_service()
-        item = service.get_queue_item(path)
-        if item:
-            return {
-                "generate_srt": item.generate_srt,
-                "run_transcode": item.run_transcode,
-                "skip_caption_generation": item.skip_caption_generation,
-                "log_verbosity": item.log_verbosity,
-            }
+        Served from the in-memory queue mirror.
+        """
+        settings = self._queue_items().get(path)
+        if settings:
+            return dict(settings)
         return {
             "generate_srt": True,
             "run_transcode": True,
@@ -167,36 +357,61 @@ class StateBackend:
         Clear a manual process request after handling it.
         Now removes from database via ManualQueueService.
         """
-        service = self._get_service()
-        service.remove_from_queue(path)
+        with self._get_service() as service:
+            service.remove_from_queue(path)
+        if self._queue_cache is not None:
+            self._queue_cache.pop(path, None)
+
+    def clear_manual_process_requests(self, paths: list):
+        """
+        Clear several manual process requests with one database commit.
+        """
+        if not paths:
+            return
+        with self._get_service() as service:
+            service.remove_many_from_queue(paths)
+        if self._queue_cache is not None:
+            for path in paths:
+                self._queue_cache.pop(path, None)
 
     def get_manual_process_queue(self) -> list:
         """
         Return list of paths awaiting manual processing.
-        Now retrieves from database via ManualQueueService.
+        Reads the database and refreshes the in-memory mirror, unless the
+        mirror was loaded less than QUEUE_LIST_TTL seconds ago.
         """
-        service = self._get_service()
-        return service.get_queue_paths()
+        if (
+            self._queue_cache is not None
+            and time.monotonic() - self._queue_cache_loaded_at < self.QUEUE_LIST_TTL
+        ):
+            return list(self._queue_cache)
+        return list(self._refresh_queue_cache())
 
     def _persist_state(self, ts: datetime):
         """
         Persist last_ts safely using an atomic write.
         Manual queue is now persisted in database.
         """
-        directory = os.path.dirname(self.path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
-
-        tmp = self.path + ".tmp"
-        with open(tmp, "w") as f:
-            # Handle ts as both datetime and string
-            timestamp_str = None
-            if ts:
-                timestamp_str = ts if isinstance(ts, str) else ts.isoformat()
-            data = {
+        # Handle ts as both datetime and string
+        timestamp_str = None
+        if ts:
+            timestamp_str = ts if isinstance(ts, str) else ts.isoformat()
+        payload = json.dumps(
+            {
                 "last_timestamp": timestamp_str,
                 # manual_process_paths removed - now in database
             }
-            json.dump(data, f)
+        ).encode()
+
+        # Write + fsync the temp file before renaming it over the old one so
+        # a crash leaves either the previous or the new state, never an
+        # empty file
+        tmp = self.path + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
         os.replace(tmp, self.path)
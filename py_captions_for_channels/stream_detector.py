@@ -9,12 +9,14 @@ This module provides functions to:
 """
 
 import json
+import os
 import subprocess
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioStream:
     """Represents an audio stream with metadata."""
 
@@ -31,7 +33,7 @@ class AudioStream:
         return f"<AudioStream #{self.index}: {self.codec} {ch} [{lang}]>"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubtitleStream:
     """Represents a subtitle stream with metadata."""
 
@@ -45,7 +47,7 @@ class SubtitleStream:
         return f"<SubtitleStream #{self.index}: {self.codec} [{lang}]>"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamSelection:
     """Selected streams for processing."""
 
@@ -67,6 +69,9 @@ def probe_streams(video_path: str) -> Dict[str, List]:
     """
     Use ffprobe to detect all audio and subtitle streams with language tags.
 
+    Results are cached per (path, size, mtime), so probing an unchanged
+    file again does not spawn ffprobe.
+
     Args:
         video_path: Path to video file
 
@@ -78,13 +83,44 @@ def probe_streams(video_path: str) -> Dict[str, List]:
         subprocess.CalledProcessError: If ffprobe fails
         ValueError: If ffprobe output cannot be parsed
     """
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        # Let ffprobe report the problem (or handle non-file inputs)
+        audio_streams, subtitle_streams = _run_ffprobe(video_path)
+    else:
+        audio_streams, subtitle_streams = _probe_cached(
+            video_path, st.st_size, st.st_mtime_ns
+        )
+    return {
+        "audio_streams": list(audio_streams),
+        "subtitle_streams": list(subtitle_streams),
+    }
+
+
+@lru_cache(maxsize=512)
+def _probe_cached(
+    video_path: str, size: int, mtime_ns: int
+) -> Tuple[Tuple[AudioStream, ...], Tuple[SubtitleStream, ...]]:
+    """Memoized ffprobe call; size and mtime_ns only form the cache key."""
+    return _run_ffprobe(video_path)
+
+
+def _run_ffprobe(
+    video_path: str,
+) -> Tuple[Tuple[AudioStream, ...], Tuple[SubtitleStream, ...]]:
+    """Run ffprobe and parse the audio and subtitle streams it reports."""
     cmd = [
         "ffprobe",
         "-v",
         "quiet",
         "-print_format",
         "json",
-        "-show_streams",
+        # Only the fields parsed below, so ffprobe emits (and json.loads
+        # decodes) a small document instead of every stream property
+        "-show_entries",
+        "stream=index,codec_type,codec_name,channels,channel_layout"
+        ":stream_tags=language,title",
         video_path,
     ]
 
@@ -140,7 +176,7 @@ def probe_streams(video_path: str) -> Dict[str, List]:
                     )
                 )
 
-        return {"audio_streams": audio_streams, "subtitle_streams": subtitle_streams}
+        return tuple(audio_streams), tuple(subtitle_streams)
 
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"ffprobe failed for {video_path}: {e.stderr}") from e
@@ -150,6 +186,27 @@ def probe_streams(video_path: str) -> Dict[str, List]:
         raise RuntimeError(f"ffprobe timed out for {video_path}") from e
 
 
+def _index_by_lang(streams: List) -> Tuple[Dict[str, object], Dict[str, object]]:
+    """
+    Index streams by normalized language code.
+
+    Args:
+        streams: Audio or subtitle streams, in file order
+
+    Returns:
+        Tuple of (by3, by2) dicts mapping the lowercased 3- and 2-letter
+        language prefix to the first stream carrying it
+    """
+    by3 = {}
+    by2 = {}
+    for stream in streams:
+        if stream.language:
+            lang = stream.language.lower()
+            by3.setdefault(lang[:3], stream)
+            by2.setdefault(lang[:2], stream)
+    return by3, by2
+
+
 def select_audio_stream(
     audio_streams: List[AudioStream], preferred_language: str, fallback: str = "first"
 ) -> Tuple[Optional[AudioStream], str]:
@@ -174,20 +231,17 @@ def select_audio_stream(
     # Normalize language code (handle both 2-letter and 3-letter codes)
     preferred_norm = preferred_language.lower()[:3]
 
+    by3, by2 = _index_by_lang(audio_streams)
+
     # Try exact match first
-    for stream in audio_streams:
-        if stream.language:
-            stream_lang = stream.language.lower()[:3]
-            if stream_lang == preferred_norm:
-                return stream, f"Matched language '{stream.language}'"
+    stream = by3.get(preferred_norm)
+    if stream is not None:
+        return stream, f"Matched language '{stream.language}'"
 
     # Try partial match (eng matches en, spa matches es, etc.)
-    preferred_2 = preferred_norm[:2]
-    for stream in audio_streams:
-        if stream.language:
-            stream_lang = stream.language.lower()[:2]
-            if stream_lang == preferred_2:
-                return stream, f"Partial match language '{stream.language}'"
+    stream = by2.get(preferred_norm[:2])
+    if stream is not None:
+        return stream, f"Partial match language '{stream.language}'"
 
     # No match - apply fallback strategy
     if fallback == "skip":
@@ -229,20 +283,17 @@ def select_subtitle_stream(
     # Normalize language code
     preferred_norm = preferred_language.lower()[:3]
 
+    by3, by2 = _index_by_lang(subtitle_streams)
+
     # Try exact match
-    for stream in subtitle_streams:
-        if stream.language:
-            stream_lang = stream.language.lower()[:3]
-            if stream_lang == preferred_norm:
-                return stream, f"Matched subtitle language '{stream.language}'"
+    stream = by3.get(preferred_norm)
+    if stream is not None:
+        return stream, f"Matched subtitle language '{stream.language}'"
 
     # Try partial match
-    preferred_2 = preferred_norm[:2]
-    for stream in subtitle_streams:
-        if stream.language:
-            stream_lang = stream.language.lower()[:2]
-            if stream_lang == preferred_2:
-                return stream, f"Partial match subtitle language '{stream.language}'"
+    stream = by2.get(preferred_norm[:2])
+    if stream is not None:
+        return stream, f"Partial match subtitle language '{stream.language}'"
 
     # No match - apply fallback
     if fallback == "skip":
@@ -331,6 +382,10 @@ def extract_audio_for_transcription(
         "-map",
         f"0:a:{audio_stream_index}",  # Select specific audio stream
         "-vn",  # No video
+        "-map_metadata",
+        "-1",  # Don't copy container/stream metadata into the WAV
+        "-map_chapters",
+        "-1",
         "-acodec",
         "pcm_s16le",  # PCM audio for Whisper
         "-ar",
@@ -2,19 +2,102 @@
 Lightweight system monitor for tracking CPU, disk, network, and GPU metrics.
 """
 
+import array
+import atexit
+import fcntl
+import json
 import os
+import queue
 import time
-import psutil
 import threading
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict
-from collections import deque
+from typing import Callable, Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass
+from collections import deque, namedtuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+DiskIO = namedtuple("DiskIO", ["read_bytes", "write_bytes"])
+NetIO = namedtuple("NetIO", ["bytes_recv", "bytes_sent"])
 
-@dataclass
+_PROC_DISKSTATS = "/proc/diskstats"
+_PROC_NET_DEV = "/proc/net/dev"
+_SECTOR_SIZE = 512  # /proc/diskstats always counts 512-byte sectors
+_MiB = 1048576.0
+_block_devices: Optional[set] = None
+
+
+def _whole_disks() -> set:
+    """Names of whole block devices (partitions excluded), read once."""
+    global _block_devices
+    if _block_devices is None:
+        try:
+            _block_devices = set(os.listdir("/sys/block"))
+        except OSError:
+            _block_devices = set()
+    return _block_devices
+
+
+def read_disk_io() -> Optional[DiskIO]:
+    """System-wide disk read/write byte totals.
+
+    Parses /proc/diskstats with a single read, summing whole disks only
+    (as psutil does) so partitions aren't double counted.  Falls back to
+    psutil where /proc is unavailable.
+    """
+    try:
+        with open(_PROC_DISKSTATS, "rb") as f:
+            data = f.read()
+    except OSError:
+        import psutil
+
+        counters = psutil.disk_io_counters()
+        if counters is None:
+            return None
+        return DiskIO(counters.read_bytes, counters.write_bytes)
+
+    disks = _whole_disks()
+    sectors_read = 0
+    sectors_written = 0
+    for line in data.split(b"\n"):
+        fields = line.split()
+        if len(fields) < 10 or fields[2].decode() not in disks:
+            continue
+        sectors_read += int(fields[5])
+        sectors_written += int(fields[9])
+    return DiskIO(sectors_read * _SECTOR_SIZE, sectors_written * _SECTOR_SIZE)
+
+
+def read_net_io() -> Optional[NetIO]:
+    """System-wide network receive/send byte totals.
+
+    Parses /proc/net/dev with a single read (all interfaces, as psutil
+    does).  Falls back to psutil where /proc is unavailable.
+    """
+    try:
+        with open(_PROC_NET_DEV, "rb") as f:
+            data = f.read()
+    except OSError:
+        import psutil
+
+        counters = psutil.net_io_counters()
+        if counters is None:
+            return None
+        return NetIO(counters.bytes_recv, counters.bytes_sent)
+
+    recv = 0
+    sent = 0
+    for line in data.split(b"\n")[2:]:
+        _iface, sep, stats = line.partition(b":")
+        if not sep:
+            continue
+        fields = stats.split()
+        recv += int(fields[0])
+        sent += int(fields[8])
+    return NetIO(recv, sent)
+
+
+@dataclass(slots=True)
 class MetricPoint:
     """Single point-in-time system metrics."""
 
@@ -30,8 +113,24 @@ class MetricPoint:
     gpu_enc_percent: Optional[float] = None
     gpu_dec_percent: Optional[float] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fields (cheaper than dataclasses.asdict)."""
+        return {
+            "timestamp": self.timestamp,
+            "cpu_percent": self.cpu_percent,
+            "disk_read_mbps": self.disk_read_mbps,
+            "disk_write_mbps": self.disk_write_mbps,
+            "net_recv_mbps": self.net_recv_mbps,
+            "net_sent_mbps": self.net_sent_mbps,
+            "gpu_util_percent": self.gpu_util_percent,
+            "gpu_mem_used_mb": self.gpu_mem_used_mb,
+            "gpu_mem_total_mb": self.gpu_mem_total_mb,
+            "gpu_enc_percent": self.gpu_enc_percent,
+            "gpu_dec_percent": self.gpu_dec_percent,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     """Single pipeline stage timing."""
 
@@ -74,6 +173,9 @@ class GPUProvider:
     def get_name(self) -> str:
         return "None"
 
+    def close(self) -> None:
+        """Release any resources held by the provider."""
+
 
 class NvidiaNvmlProvider(GPUProvider):
     """NVIDIA GPU metrics via nvidia-ml-py (pynvml) library."""
@@ -83,9 +185,16 @@ class NvidiaNvmlProvider(GPUProvider):
     # when the GPU becomes active. Keep polling every second; just suppress
     # the warning log after the first burst of failures.
 
+    # get_metrics() results are reused for this long, so callers polling
+    # faster than the 1 Hz sampler don't trigger extra NVML calls
+    _CACHE_SECONDS = 0.9
+
     def __init__(self):
         self.available = False
         self._consecutive_failures = 0
+        self.mem_total_mb: Optional[float] = None
+        self._last_result: Optional[Dict[str, Optional[float]]] = None
+        self._last_result_at = 0.0
         try:
             import warnings
 
@@ -93,12 +202,21 @@ class NvidiaNvmlProvider(GPUProvider):
                 warnings.filterwarnings("ignore", message=".*pynvml.*deprecated.*")
                 import pynvml
 
+            # NVML is initialized once and the handle kept for the process
+            # lifetime; nvmlInit/nvmlShutdown per sample is expensive
             pynvml.nvmlInit()
             self.handle = pynvml.nvmlDeviceGetHandleByIndex(0)
             self.available = True
             self.pynvml = pynvml
-            device_name = pynvml.nvmlDeviceGetName(self.handle)
-            logger.warning(f"NVIDIA NVML GPU provider initialized: {device_name}")
+            if logger.isEnabledFor(logging.WARNING):
+                device_name = pynvml.nvmlDeviceGetName(self.handle)
+                logger.warning(f"NVIDIA NVML GPU provider initialized: {device_name}")
+            try:
+                # Total memory never changes; used memory is read per sample
+                total = pynvml.nvmlDeviceGetMemoryInfo(self.handle).total
+                self.mem_total_mb = total / _MiB
+            except Exception:
+                pass  # Read lazily by get_metrics() (NVML may be idle on WSL2)
         except Exception as e:
             logger.warning(f"NVIDIA NVML not available: {type(e).__name__}: {e}")
 
@@ -115,9 +233,18 @@ class NvidiaNvmlProvider(GPUProvider):
         if not self.available:
             return super().get_metrics()
 
+        now = time.monotonic()
+        if (
+            self._last_result is not None
+            and now - self._last_result_at < self._CACHE_SECONDS
+        ):
+            return dict(self._last_result)
+
         try:
             util = self.pynvml.nvmlDeviceGetUtilizationRates(self.handle)
             mem_info = self.pynvml.nvmlDeviceGetMemoryInfo(self.handle)
+            if self.mem_total_mb is None:
+                self.mem_total_mb = mem_info.total / _MiB
 
             # NVENC/NVDEC utilization (dedicated hardware, not CUDA cores)
             enc_percent = None
@@ -138,13 +265,15 @@ class NvidiaNvmlProvider(GPUProvider):
                 pass
 
             self._consecutive_failures = 0
-            return {
+            self._last_result = {
                 "util_percent": float(util.gpu),
-                "mem_used_mb": mem_info.used / (1024 * 1024),
-                "mem_total_mb": mem_info.total / (1024 * 1024),
+                "mem_used_mb": mem_info.used / _MiB,
+                "mem_total_mb": self.mem_total_mb,
                 "enc_percent": enc_percent,
                 "dec_percent": dec_percent,
             }
+            self._last_result_at = now
+            return dict(self._last_result)
         except Exception as e:
             self._consecutive_failures += 1
             # Log first failure, then only every 60 seconds to avoid spam
@@ -157,10 +286,37 @@ class NvidiaNvmlProvider(GPUProvider):
 
 
 class NvidiaSmiProvider(GPUProvider):
-    """NVIDIA GPU metrics via nvidia-smi command."""
+    """NVIDIA GPU metrics via nvidia-smi command.
+
+    Rather than spawning nvidia-smi for every sample, a single long-lived
+    ``nvidia-smi --loop-ms`` process is started on first use and its CSV
+    output is parsed by a background reader thread; get_metrics() just
+    returns the most recent line.  A line older than _STALE_AFTER seconds
+    is not reported, a stream silent for _HANG_AFTER seconds is restarted,
+    and restarts back off exponentially while the process keeps failing.
+    """
+
+    _QUERY = (
+        "--query-gpu=utilization.gpu,"
+        "utilization.encoder,utilization.decoder,"
+        "memory.used,memory.total"
+    )
+    _LOOP_MS = 1000
+    _STALE_AFTER = 3.0
+    _HANG_AFTER = 10.0
+    _RESTART_MIN = 1.0
+    _RESTART_MAX = 60.0
 
     def __init__(self):
         self.available = False
+        self._proc = None
+        self._reader: Optional[threading.Thread] = None
+        # (monotonic time read, metrics) of the most recent parsed line
+        self._latest: Optional[Tuple[float, Dict[str, Optional[float]]]] = None
+        self._start_lock = threading.Lock()
+        self._started_at = 0.0
+        self._next_start = 0.0
+        self._restart_delay = self._RESTART_MIN
         try:
             import subprocess
 
@@ -186,37 +342,103 @@ class NvidiaSmiProvider(GPUProvider):
     def get_name(self) -> str:
         return "NVIDIA SMI"
 
-    def get_metrics(self) -> Dict[str, Optional[float]]:
-        if not self.available:
-            return super().get_metrics()
+    @staticmethod
+    def _parse_line(line: str) -> Dict[str, Optional[float]]:
+        """Parse one CSV line of the query into a metrics dict."""
+        parts = line.strip().split(",")
+        return {
+            "util_percent": float(parts[0].strip()),
+            "enc_percent": float(parts[1].strip()),
+            "dec_percent": float(parts[2].strip()),
+            "mem_used_mb": float(parts[3].strip()),
+            "mem_total_mb": float(parts[4].strip()),
+        }
+
+    @staticmethod
+    def _reap(proc) -> None:
+        """Terminate *proc* if still running and wait for it to exit."""
+        import subprocess
+
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    def _ensure_stream(self):
+        """Start (or restart) the looping nvidia-smi process if needed."""
+        with self._start_lock:
+            now = time.monotonic()
+            proc = self._proc
+            if proc is not None:
+                latest = self._latest
+                last_output = self._started_at
+                if latest is not None and latest[0] > last_output:
+                    last_output = latest[0]
+                if proc.poll() is None and now - last_output < self._HANG_AFTER:
+                    return  # Running and producing output
+                self._reap(proc)  # Exited (poll() reaped it) or hung
+                self._proc = None
+                if last_output > self._started_at:
+                    # It did produce output, so restart promptly
+                    self._restart_delay = self._RESTART_MIN
+                logger.debug("nvidia-smi stream stopped; restarting with backoff")
+
+            if now < self._next_start:
+                return
 
-        try:
             import subprocess
 
-            result = subprocess.run(
+            self._proc = subprocess.Popen(
                 [
                     "nvidia-smi",
-                    "--query-gpu=utilization.gpu,"
-                    "utilization.encoder,utilization.decoder,"
-                    "memory.used,memory.total",
+                    self._QUERY,
                     "--format=csv,noheader,nounits",
+                    f"--loop-ms={self._LOOP_MS}",
                 ],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=2,
+                bufsize=1,
             )
-            if result.returncode == 0:
-                parts = result.stdout.strip().split(",")
-                return {
-                    "util_percent": float(parts[0].strip()),
-                    "enc_percent": float(parts[1].strip()),
-                    "dec_percent": float(parts[2].strip()),
-                    "mem_used_mb": float(parts[3].strip()),
-                    "mem_total_mb": float(parts[4].strip()),
-                }
+            self._started_at = now
+            self._next_start = now + self._restart_delay
+            self._restart_delay = min(self._restart_delay * 2, self._RESTART_MAX)
+            self._reader = threading.Thread(
+                target=self._read_stream, args=(self._proc,), daemon=True
+            )
+            self._reader.start()
+
+    def _read_stream(self, proc):
+        """Reader thread: keep self._latest updated from nvidia-smi output."""
+        for line in iter(proc.stdout.readline, ""):
+            try:
+                # Single attribute assignment; readers never see a partial tuple
+                self._latest = (time.monotonic(), self._parse_line(line))
+            except (ValueError, IndexError):
+                continue  # e.g. "[N/A]" for encoder utilization
+
+    def close(self):
+        """Stop the looping nvidia-smi process and reap it."""
+        with self._start_lock:
+            proc, self._proc = self._proc, None
+        if proc is not None:
+            self._reap(proc)
+
+    def get_metrics(self) -> Dict[str, Optional[float]]:
+        if not self.available:
+            return super().get_metrics()
+
+        try:
+            self._ensure_stream()
         except Exception as e:
             logger.warning(f"Failed to get NVIDIA SMI metrics: {e}")
 
+        latest = self._latest
+        if latest is not None and time.monotonic() - latest[0] < self._STALE_AFTER:
+            return dict(latest[1])
         return super().get_metrics()
 
 
@@ -259,23 +481,52 @@ class SysfsDrmProvider(GPUProvider):
 class SystemMonitor:
     """Lightweight system metrics collector with ring buffer."""
 
-    def __init__(self, max_seconds: int = 600):
+    _GPU_HISTORY = 10
+    _SAMPLE_INTERVAL = 1.0  # Seconds
+    # With no reader for _IDLE_AFTER seconds and no active stage, sample
+    # only every _IDLE_INTERVAL seconds until the next read
+    _IDLE_AFTER = 60.0
+    _IDLE_INTERVAL = 10.0
+
+    def __init__(self, max_seconds: int = 300):
+        # Imported here rather than at module level: processes that only use
+        # PipelineTimeline (e.g. the caption subprocess) never load psutil
+        import psutil
+
+        self._psutil = psutil
         self.max_seconds = max_seconds
+        # Sized to the 5-minute window the dashboard requests (1 Hz sampling)
+        # Single writer (the sampler thread), many readers.  deque.append
+        # with maxlen and list(deque) are atomic under the GIL, so no lock
         self.buffer: deque[MetricPoint] = deque(maxlen=max_seconds)
-        self.lock = threading.Lock()
+        # Dict form of the newest sample, built once by the sampler so the
+        # status poll doesn't rebuild it per request: (point, dict)
+        self._latest: Optional[tuple] = None
         self.running = False
         self.sample_thread: Optional[threading.Thread] = None
 
+        # Idle back-off: readers stamp _last_read; is_busy (set by
+        # PipelineTimeline) keeps full rate while a stage is running, and
+        # _wake cuts an idle sleep short on the first read
+        self._last_read = time.monotonic()
+        self.is_busy: Optional[Callable[[], bool]] = None
+        self._idle = False
+        self._wake = threading.Event()
+
         # Initialize GPU provider
         self.gpu_provider = self._init_gpu_provider()
 
         # Disk/network baselines for delta calculation
-        self.prev_disk = psutil.disk_io_counters()
-        self.prev_net = psutil.net_io_counters()
-        self.prev_time = time.time()
+        self.prev_disk = read_disk_io()
+        self.prev_net = read_net_io()
+        # Monotonic: rate deltas must not be skewed by NTP/wall-clock jumps
+        self.prev_time = time.monotonic()
 
-        # GPU engagement tracking
-        self.gpu_util_history: deque[float] = deque(maxlen=10)
+        # GPU engagement tracking: fixed ring of the last _GPU_HISTORY
+        # utilization samples (unboxed floats, no per-append allocation)
+        self._gpu_hist = array.array("f", [0.0] * self._GPU_HISTORY)
+        self._gpu_head = 0  # Next slot to write
+        self._gpu_fill = 0  # Number of valid samples
 
     def _init_gpu_provider(self) -> GPUProvider:
         """Try GPU providers in order of preference."""
@@ -307,57 +558,102 @@ class SystemMonitor:
         logger.info("System monitor started")
 
     def stop(self):
-        """Stop the sampling thread."""
+        """Stop the sampling thread and release the GPU provider."""
         self.running = False
+        self._wake.set()
         if self.sample_thread:
             self.sample_thread.join(timeout=2)
+        self.gpu_provider.close()
         logger.info("System monitor stopped")
 
     def _sample_loop(self):
-        """Main sampling loop (1 Hz)."""
+        """Main sampling loop (1 Hz).
+
+        Sleeps until an absolute deadline rather than a fixed 1 s after each
+        sample, so the cadence doesn't drift by the cost of sampling.
+        """
+        next_tick = time.monotonic()
         while self.running:
             try:
                 self._sample_once()
             except Exception as e:
                 logger.error(f"Error sampling metrics: {e}")
-            time.sleep(1.0)
+
+            self._idle = self._is_idle()
+            if self._idle:
+                next_tick += self._IDLE_INTERVAL
+                delay = next_tick - time.monotonic()
+                if delay > 0 and self._wake.wait(delay):
+                    # A reader arrived: sample now and return to 1 Hz
+                    self._wake.clear()
+                    next_tick = time.monotonic() - self._SAMPLE_INTERVAL
+                continue
+
+            next_tick += self._SAMPLE_INTERVAL
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (stall/suspend): resume from now, no burst
+                next_tick = time.monotonic()
+
+    def _is_idle(self) -> bool:
+        """True when nobody has read metrics recently and no stage is active."""
+        if time.monotonic() - self._last_read <= self._IDLE_AFTER:
+            return False
+        is_busy = self.is_busy
+        try:
+            return not (is_busy and is_busy())
+        except Exception:
+            return False
+
+    def _note_read(self):
+        """Record a metrics read, waking the sampler if it is backed off."""
+        self._last_read = time.monotonic()
+        if self._idle:
+            self._wake.set()
 
     def _sample_once(self):
         """Collect one metric sample."""
-        now = time.time()
+        now = time.time()  # Wall clock, for the user-facing timestamp
+        mono_now = time.monotonic()
 
         # CPU
-        cpu_percent = psutil.cpu_percent(interval=0)
+        cpu_percent = self._psutil.cpu_percent(interval=0)
 
         # Disk I/O
-        disk = psutil.disk_io_counters()
-        disk_delta_time = now - self.prev_time
+        disk = read_disk_io()
+        disk_delta_time = mono_now - self.prev_time
         disk_read_mbps = 0.0
         disk_write_mbps = 0.0
 
-        if disk and self.prev_disk and disk_delta_time > 0:
+        # One division per tick; the rates below are plain multiplies
+        inv_bps = 1.0 / (_MiB * disk_delta_time) if disk_delta_time > 0 else 0.0
+
+        if disk and self.prev_disk and inv_bps:
             bytes_read = disk.read_bytes - self.prev_disk.read_bytes
             bytes_written = disk.write_bytes - self.prev_disk.write_bytes
-            disk_read_mbps = (bytes_read / disk_delta_time) / (1024 * 1024)
-            disk_write_mbps = (bytes_written / disk_delta_time) / (1024 * 1024)
+            disk_read_mbps = bytes_read * inv_bps
+            disk_write_mbps = bytes_written * inv_bps
 
         # Network I/O
-        net = psutil.net_io_counters()
+        net = read_net_io()
         net_recv_mbps = 0.0
         net_sent_mbps = 0.0
 
-        if net and self.prev_net and disk_delta_time > 0:
+        if net and self.prev_net and inv_bps:
+            inv_bps_net = inv_bps * 8.0  # Bytes -> bits, for Mbps
             bytes_recv = net.bytes_recv - self.prev_net.bytes_recv
             bytes_sent = net.bytes_sent - self.prev_net.bytes_sent
-            net_recv_mbps = (bytes_recv * 8 / disk_delta_time) / (1024 * 1024)  # Mbps
-            net_sent_mbps = (bytes_sent * 8 / disk_delta_time) / (1024 * 1024)
+            net_recv_mbps = bytes_recv * inv_bps_net
+            net_sent_mbps = bytes_sent * inv_bps_net
 
         # GPU
         gpu_metrics = self.gpu_provider.get_metrics()
 
         # Track GPU utilization history
         if gpu_metrics["util_percent"] is not None:
-            self.gpu_util_history.append(gpu_metrics["util_percent"])
+            self._record_gpu_util(gpu_metrics["util_percent"])
 
         # Create metric point
         point = MetricPoint(
@@ -375,41 +671,77 @@ class SystemMonitor:
         )
 
         # Add to buffer
-        with self.lock:
-            self.buffer.append(point)
+        self.buffer.append(point)
+        self._latest = (point, point.to_dict())
 
         # Update baselines
         self.prev_disk = disk
         self.prev_net = net
-        self.prev_time = now
+        self.prev_time = mono_now
 
     def get_latest(self) -> Optional[Dict[str, Any]]:
-        """Get the most recent metric point."""
-        with self.lock:
-            if not self.buffer:
-                return None
+        """Get the most recent metric point.
+
+        Returns:
+            Dict of the newest sample (shared between callers; treat as
+            read-only), or None before the first sample
+        """
+        self._note_read()
+        try:
             point = self.buffer[-1]
-            return asdict(point)
+        except IndexError:
+            return None
+        latest = self._latest
+        if latest is not None and latest[0] is point:
+            return latest[1]
+        return point.to_dict()
 
     def get_window(self, seconds: int = 300) -> List[Dict[str, Any]]:
         """Get metrics for the last N seconds."""
+        self._note_read()
         cutoff = time.time() - seconds
 
-        with self.lock:
-            points = [p for p in self.buffer if p.timestamp >= cutoff]
-            return [asdict(p) for p in points]
+        # Linear filter rather than a bisect: timestamps are wall-clock, so a
+        # backward clock step can leave the buffer out of order
+        return [p.to_dict() for p in list(self.buffer) if p.timestamp >= cutoff]
 
     def is_gpu_engaged(self) -> bool:
         """Check if GPU is actively engaged (>10% util for 3+ consecutive samples)."""
-        if len(self.gpu_util_history) < 3:
+        if self._gpu_fill < 3:
             return False
+        h = self._gpu_hist
+        i = self._gpu_head  # Negative indexes wrap to the end of the array
+        return h[i - 1] > 10.0 and h[i - 2] > 10.0 and h[i - 3] > 10.0
 
-        recent = list(self.gpu_util_history)[-3:]
-        return all(u > 10.0 for u in recent)
+    def _record_gpu_util(self, util_percent: float):
+        """Append a GPU utilization sample to the history ring."""
+        self._gpu_hist[self._gpu_head] = util_percent
+        self._gpu_head = (self._gpu_head + 1) % self._GPU_HISTORY
+        if self._gpu_fill < self._GPU_HISTORY:
+            self._gpu_fill += 1
 
 
 class PipelineTimeline:
-    """Track pipeline stage timing and GPU engagement with file-based persistence."""
+    """Track pipeline stage timing and GPU engagement with file-based persistence.
+
+    State is shared across processes through two files: a snapshot
+    (``pipeline_state.json``) and an append-only event log next to it
+    (``pipeline_events.jsonl``).  Every state change (stage start/end, job
+    completion and cancellation) appends a single line to the log; readers
+    load the snapshot and replay the log, and never write either file.  A
+    process that appended events compacts them on job completion, folding
+    the log into the snapshot while holding an exclusive lock on the log.
+
+    File writes are queued to a background thread so stage transitions
+    never block on disk; flush() waits for pending writes.
+    """
+
+    # Compact early if a job never completes and the log keeps growing
+    _MAX_EVENTS_BYTES = 256 * 1024
+    # Use 1 hour to match STALE_EXECUTION_SECONDS — CPU ffmpeg encodes can
+    # legitimately run for 20-60 minutes, so a 5-minute cap was incorrectly
+    # clearing the chart mid-encode on slow hardware.
+    _CHART_STALE_SECONDS = 3600
 
     def __init__(
         self,
@@ -420,66 +752,257 @@ class PipelineTimeline:
             from .config import DATA_DIR
 
             state_file = os.path.join(DATA_DIR, "pipeline_state.json")
-        self.system_monitor = system_monitor
+        self.system_monitor = None
+        if system_monitor is not None:
+            self.attach_system_monitor(system_monitor)
         self.state_file = state_file
+        self.events_file = os.path.join(
+            os.path.dirname(state_file), "pipeline_events.jsonl"
+        )
         self.lock = threading.Lock()
         self.current_stage: Optional[PipelineStage] = None
         self.completed_stages: List[PipelineStage] = []
         self.current_job_id: Optional[str] = None
+        # File writes happen on a background thread so stage transitions
+        # never wait on disk I/O; see _writer_loop()
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._events_bytes = 0  # Bytes this instance appended since compaction
+
+    @staticmethod
+    def _stage_dict(stage: PipelineStage) -> Dict[str, Any]:
+        return {
+            "stage": stage.stage,
+            "job_id": stage.job_id,
+            "filename": stage.filename,
+            "started_at": stage.started_at,
+            "ended_at": stage.ended_at,
+            "gpu_engaged": stage.gpu_engaged,
+        }
 
-    def _save_state(self):
-        """Persist pipeline state to file for cross-process sharing."""
-        try:
-            state = {
-                "current_job_id": self.current_job_id,
-                "current_stage": None,
-                "completed_stages": [],
-            }
+    def attach_system_monitor(self, system_monitor: SystemMonitor) -> None:
+        """Use *system_monitor* for GPU engagement of stages.
 
-            if self.current_stage:
-                state["current_stage"] = {
-                    "stage": self.current_stage.stage,
-                    "job_id": self.current_stage.job_id,
-                    "filename": self.current_stage.filename,
-                    "started_at": self.current_stage.started_at,
-                    "ended_at": self.current_stage.ended_at,
-                    "gpu_engaged": self.current_stage.gpu_engaged,
-                }
+        Args:
+            system_monitor: Monitor sampling this process's GPU
+        """
+        self.system_monitor = system_monitor
+        # Keep the sampler at full rate while a stage is running
+        system_monitor.is_busy = self._has_active_stage
 
-            state["completed_stages"] = [
-                {
-                    "stage": s.stage,
-                    "job_id": s.job_id,
-                    "filename": s.filename,
-                    "started_at": s.started_at,
-                    "ended_at": s.ended_at,
-                    "gpu_engaged": s.gpu_engaged,
-                }
-                for s in self.completed_stages
-            ]
+    def _has_active_stage(self) -> bool:
+        """True while any process has a (non-stale) stage running.
 
-            import os
-            import json
+        Reads the shared files rather than this instance's view, which in
+        the web process is only refreshed by get_status(): the caption
+        subprocess's stages must keep the sampler at full rate even when
+        nobody is polling the dashboard.
+        """
+        with self.lock:
+            self._load_state()
+            stage = self.current_stage
+            return (
+                stage is not None
+                and stage.ended_at is None
+                and time.time() - stage.started_at <= self._CHART_STALE_SECONDS
+            )
+
+    def _gpu_engaged(self) -> bool:
+        return bool(self.system_monitor and self.system_monitor.is_gpu_engaged())
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            "current_job_id": self.current_job_id,
+            "current_stage": (
+                self._stage_dict(self.current_stage) if self.current_stage else None
+            ),
+            "completed_stages": [self._stage_dict(s) for s in self.completed_stages],
+        }
 
-            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+    def _request_compaction(self):
+        """Queue folding the event log into the snapshot file."""
+        self._events_bytes = 0
+        self._enqueue_write("compact", None)
+
+    def _append_event(self, event: Dict[str, Any]):
+        """Apply an event to the in-memory state and queue it for the log."""
+        self._apply_event(event)
+        line = (json.dumps(event, separators=(",", ":")) + "\n").encode()
+        self._events_bytes += len(line)
+        self._enqueue_write("event", line)
+        if self._events_bytes > self._MAX_EVENTS_BYTES:
+            self._request_compaction()
+
+    def _enqueue_write(self, kind: str, payload: Any):
+        """Hand a write to the background writer thread, starting it if needed."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="pipeline-state-writer", daemon=True
+            )
+            self._writer.start()
+            # Don't lose queued writes when a short-lived process exits
+            atexit.register(self.flush)
+        self._write_queue.put_nowait((kind, payload))
+
+    def flush(self):
+        """Block until every queued state write has reached disk."""
+        if self._writer is not None:
+            self._write_queue.join()
+
+    def _writer_loop(self):
+        """Background writer: apply queued writes in order.
+
+        Runs of consecutive compactions are coalesced into one; events are
+        never dropped or reordered relative to compactions.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            for i, (kind, payload) in enumerate(batch):
+                try:
+                    next_kind = batch[i + 1][0] if i + 1 < len(batch) else None
+                    if kind == "compact" and next_kind != "compact":
+                        self._compact()
+                    elif kind == "event":
+                        self._write_event(payload)
+                except Exception:
+                    pass  # Don't let persistence errors break pipeline execution
+                finally:
+                    self._write_queue.task_done()
+
+    def _compact(self):
+        """Fold the event log into the snapshot file and empty the log.
+
+        Holds an exclusive lock on the log throughout, so events appended by
+        other processes are either folded in or written after the truncate,
+        and readers never see the new snapshot next to the old log.
+        """
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        fd = os.open(self.events_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # Rebuild from disk rather than memory: other processes' events
+            # (e.g. the watcher's file_copy stage) are only in the log
+            merged = PipelineTimeline(state_file=self.state_file)
+            merged._read_state(fd)
             # Write atomically via temp file so a SIGKILL mid-write never
             # leaves a corrupted state file that makes _load_state silently
             # keep stale in-memory data (stuck active-stage for up to 1 hour).
             tmp_file = self.state_file + ".tmp"
             with open(tmp_file, "w") as f:
-                json.dump(state, f)
+                json.dump(merged._snapshot(), f)
             os.replace(tmp_file, self.state_file)
-        except Exception:
-            pass  # Don't let persistence errors break pipeline execution
+            # Everything in the log is now part of the snapshot
+            os.ftruncate(fd, 0)
+        finally:
+            os.close(fd)  # Releases the lock
+
+    def _write_event(self, line: bytes):
+        """Append one encoded event line to the log."""
+        os.makedirs(os.path.dirname(self.events_file), exist_ok=True)
+        fd = os.open(self.events_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            # Waits out a compaction in progress so the line isn't truncated
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # One write() of a single line; O_APPEND keeps concurrent
+            # writers from interleaving within a line
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    def _end_current(self, ended_at: float, gpu_engaged: bool):
+        """Move the active stage to completed_stages."""
+        self.current_stage.ended_at = ended_at
+        self.current_stage.gpu_engaged = gpu_engaged
+        self.completed_stages.append(self.current_stage)
+
+    def _apply_event(self, event: Dict[str, Any]):
+        """Apply one logged state transition (used for writing and replay)."""
+        op = event.get("op")
+        job_id = event.get("job_id")
+        t = event.get("t")
+        gpu = event.get("gpu", False)
+
+        if op == "start":
+            # If starting a new job, clear old completed stages
+            if self.current_job_id != job_id:
+                self.completed_stages = []
+            # End previous stage if any
+            if self.current_stage and not self.current_stage.ended_at:
+                self._end_current(t, gpu)
+            self.current_stage = PipelineStage(
+                stage=event["stage"],
+                job_id=job_id,
+                filename=event["filename"],
+                started_at=t,
+            )
+            self.current_job_id = job_id
+        elif op == "end":
+            if (
+                self.current_stage
+                and self.current_stage.stage == event.get("stage")
+                and self.current_stage.job_id == job_id
+            ):
+                self._end_current(t, gpu)
+                self.current_stage = None
+        elif op == "complete":
+            if self.current_stage and self.current_stage.job_id == job_id:
+                self._end_current(t, gpu)
+                self.current_stage = None
+            # Drop completed stages of other jobs older than 5 minutes
+            cutoff = t - 300
+            self.completed_stages = [
+                s
+                for s in self.completed_stages
+                if s.started_at >= cutoff or s.job_id == job_id
+            ]
+        elif op == "cancel":
+            if self.current_job_id == job_id:
+                if self.current_stage and not self.current_stage.ended_at:
+                    self._end_current(t, gpu)
+                self.current_stage = None
 
     def _load_state(self):
-        """Load pipeline state from file."""
+        """Load pipeline state from the snapshot file and replay the event log."""
+        self.flush()  # Our own queued writes must be on disk first
+        try:
+            fd = os.open(self.events_file, os.O_RDONLY)
+        except FileNotFoundError:
+            fd = None  # No events yet; the snapshot alone is the state
+        try:
+            if fd is not None:
+                # Shared lock: a compaction can't swap the snapshot and
+                # empty the log between the two reads below
+                fcntl.flock(fd, fcntl.LOCK_SH)
+            self._read_state(fd)
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    @staticmethod
+    def _read_all(fd: int) -> bytes:
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(fd, 65536, offset)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+            offset += len(chunk)
+
+    def _read_state(self, events_fd: Optional[int]):
+        """Replace in-memory state with the snapshot plus the log on events_fd."""
         try:
-            import json
-
             with open(self.state_file, "r") as f:
                 state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = None  # Start from in-memory state if no valid snapshot
 
+        if state is not None:
             self.current_job_id = state.get("current_job_id")
 
             current = state.get("current_stage")
@@ -504,46 +1027,45 @@ class PipelineTimeline:
                     job_id=s["job_id"],
                     filename=s["filename"],
                     started_at=s["started_at"],
+                    ended_at=s.get("ended_at"),
+                    gpu_engaged=s.get("gpu_engaged", False),
                 )
                 for s in state.get("completed_stages", [])
                 if s.get("job_id") == self.current_job_id
             ]
-            for i, s in enumerate(
-                [
-                    s
-                    for s in state.get("completed_stages", [])
-                    if s.get("job_id") == self.current_job_id
-                ]
-            ):
-                if i < len(self.completed_stages):
-                    self.completed_stages[i].ended_at = s.get("ended_at")
-                    self.completed_stages[i].gpu_engaged = s.get("gpu_engaged", False)
 
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass  # Start fresh if no valid state file
+        if events_fd is None:
+            return
+        lines = self._read_all(events_fd).splitlines()
+        if state is None:
+            # The log alone describes the state; replay it from scratch
+            self.current_job_id = None
+            self.current_stage = None
+            self.completed_stages = []
+        for line in lines:
+            try:
+                self._apply_event(json.loads(line))
+            except (ValueError, KeyError):
+                continue  # Torn final line from a killed writer
 
     def stage_start(self, stage: str, job_id: str, filename: str):
         """Start tracking a new pipeline stage."""
         with self.lock:
-            # If starting a new job, clear old completed stages
-            if self.current_job_id != job_id:
-                self.completed_stages = []
-
-            # End previous stage if any
-            if self.current_stage and not self.current_stage.ended_at:
-                self.current_stage.ended_at = time.time()
-                if self.system_monitor:
-                    self.current_stage.gpu_engaged = (
-                        self.system_monitor.is_gpu_engaged()
-                    )
-                self.completed_stages.append(self.current_stage)
-
-            # Start new stage
-            self.current_stage = PipelineStage(
-                stage=stage, job_id=job_id, filename=filename, started_at=time.time()
+            gpu = (
+                self._gpu_engaged()
+                if self.current_stage and not self.current_stage.ended_at
+                else False
+            )
+            self._append_event(
+                {
+                    "op": "start",
+                    "stage": stage,
+                    "job_id": job_id,
+                    "filename": filename,
+                    "t": time.time(),
+                    "gpu": gpu,
+                }
             )
-            self.current_job_id = job_id
-            self._save_state()
 
     def stage_end(self, stage: str, job_id: str):
         """End the current stage."""
@@ -553,54 +1075,47 @@ class PipelineTimeline:
                 and self.current_stage.stage == stage
                 and self.current_stage.job_id == job_id
             ):
-                self.current_stage.ended_at = time.time()
-                if self.system_monitor:
-                    self.current_stage.gpu_engaged = (
-                        self.system_monitor.is_gpu_engaged()
-                    )
-                self.completed_stages.append(self.current_stage)
-                self.current_stage = None
-                self._save_state()
+                self._append_event(
+                    {
+                        "op": "end",
+                        "stage": stage,
+                        "job_id": job_id,
+                        "t": time.time(),
+                        "gpu": self._gpu_engaged(),
+                    }
+                )
 
     def job_complete(self, job_id: str):
         """Mark entire job as complete."""
         with self.lock:
-            if self.current_stage and self.current_stage.job_id == job_id:
-                self.current_stage.ended_at = time.time()
-                if self.system_monitor:
-                    self.current_stage.gpu_engaged = (
-                        self.system_monitor.is_gpu_engaged()
-                    )
-                self.completed_stages.append(self.current_stage)
-                self.current_stage = None
-
-            # Clear completed stages for this job older than 5 minutes
-            cutoff = time.time() - 300
-            self.completed_stages = [
-                s
-                for s in self.completed_stages
-                if s.started_at >= cutoff or s.job_id == job_id
-            ]
-
-            # Keep current_job_id set so completed stages remain visible
-            # It will be cleared when the next job starts in stage_start()
+            # Ends the job's active stage and drops other jobs' stages older
+            # than 5 minutes.  current_job_id stays set so completed stages
+            # remain visible until the next job starts in stage_start()
+            self._append_event(
+                {
+                    "op": "complete",
+                    "job_id": job_id,
+                    "t": time.time(),
+                    "gpu": self._gpu_engaged(),
+                }
+            )
 
-            self._save_state()
+            # Compact: fold the finished job into the snapshot
+            self._request_compaction()
 
     def job_cancel(self, job_id: str):
         """Mark a job as cancelled, ending any in-progress stage."""
         with self.lock:
             self._load_state()
             if self.current_job_id == job_id:
-                if self.current_stage and not self.current_stage.ended_at:
-                    self.current_stage.ended_at = time.time()
-                    if self.system_monitor:
-                        self.current_stage.gpu_engaged = (
-                            self.system_monitor.is_gpu_engaged()
-                        )
-                    self.completed_stages.append(self.current_stage)
-                self.current_stage = None
-                self._save_state()
+                self._append_event(
+                    {
+                        "op": "cancel",
+                        "job_id": job_id,
+                        "t": time.time(),
+                        "gpu": self._gpu_engaged(),
+                    }
+                )
 
     def get_status(self) -> Dict[str, Any]:
         """Get current pipeline status from file (cross-process visibility)."""
@@ -608,31 +1123,34 @@ class PipelineTimeline:
             # Load latest state from file (updated by subprocess)
             self._load_state()
 
+            # The auto-clears below only change this reader's view; they are
+            # re-derived on every load, so nothing is written back.
+
             # Auto-clear stale active stages (subprocess killed without stage_end).
-            # Use 1 hour to match STALE_EXECUTION_SECONDS — CPU ffmpeg encodes can
-            # legitimately run for 20-60 minutes, so a 5-minute cap was incorrectly
-            # clearing the chart mid-encode on slow hardware.
             if self.current_stage and not self.current_stage.ended_at:
-                _CHART_STALE_SECONDS = 3600  # 1 hour
-
                 stage_age = time.time() - self.current_stage.started_at
-                if stage_age > _CHART_STALE_SECONDS:
+                if stage_age > self._CHART_STALE_SECONDS:
                     self.current_stage.ended_at = time.time()
                     self.completed_stages.append(self.current_stage)
                     self.current_stage = None
-                    self._save_state()
+
+            # Completed stages for the current job, collected in one pass and
+            # reused below for the auto-clear check and the response
+            job_stages = (
+                [s for s in self.completed_stages if s.job_id == self.current_job_id]
+                if self.current_job_id
+                else []
+            )
 
             # Auto-clear completed jobs older than 30 seconds
-            if self.current_job_id and not self.current_stage and self.completed_stages:
+            if job_stages and not self.current_stage:
                 # Find the last completed stage for this job
-                job_stages = [
-                    s for s in self.completed_stages if s.job_id == self.current_job_id
-                ]
-                if job_stages and any(s.ended_at is not None for s in job_stages):
-                    # Re-evaluate using only valid stages
-                    valid_stages = [s for s in job_stages if s.ended_at is not None]
-                    last_stage = max(valid_stages, key=lambda s: s.ended_at)
-                    completion_age = time.time() - last_stage.ended_at
+                last_ended_at = max(
+                    (s.ended_at for s in job_stages if s.ended_at is not None),
+                    default=None,
+                )
+                if last_ended_at is not None:
+                    completion_age = time.time() - last_ended_at
                     if completion_age > 30:  # 30 seconds
                         # Clear the completed job
                         old_job_id = self.current_job_id
@@ -640,7 +1158,7 @@ class PipelineTimeline:
                         self.completed_stages = [
                             s for s in self.completed_stages if s.job_id != old_job_id
                         ]
-                        self._save_state()
+                        job_stages = []
 
             result = {
                 "active": self.current_stage is not None,
@@ -664,9 +1182,6 @@ class PipelineTimeline:
             # CRITICAL: Only include completed stages for the CURRENT job
             # This prevents showing stale data from previous jobs
             if self.current_job_id:
-                job_stages = [
-                    s for s in self.completed_stages if s.job_id == self.current_job_id
-                ]
                 result["stages"] = [
                     {
                         "stage": s.stage,
@@ -690,12 +1205,20 @@ def get_system_monitor() -> SystemMonitor:
     global _system_monitor
     if _system_monitor is None:
         _system_monitor = SystemMonitor()
+        if _pipeline_timeline is not None:
+            _pipeline_timeline.attach_system_monitor(_system_monitor)
     return _system_monitor
 
 
 def get_pipeline_timeline() -> PipelineTimeline:
-    """Get the pipeline timeline singleton."""
+    """Get the pipeline timeline singleton.
+
+    Uses the system monitor only if this process has one (the web app
+    creates it at startup); the caption subprocess never samples, so it
+    doesn't build one (no psutil, NVML or nvidia-smi).  A monitor created
+    later attaches itself.
+    """
     global _pipeline_timeline
     if _pipeline_timeline is None:
-        _pipeline_timeline = PipelineTimeline(get_system_monitor())
+        _pipeline_timeline = PipelineTimeline(_system_monitor)
     return _pipeline_timeline
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from .logging.structured_logger import get_logger
 from datetime import datetime, timezone
 from functools import partial
@@ -6,7 +7,6 @@ from dataclasses import dataclass
 from typing import Optional
 
 import os
-import subprocess
 import signal
 
 from .logging_config import set_job_id
@@ -23,6 +23,7 @@ from .services.settings_service import SettingsService
 from .shutdown_control import get_shutdown_controller
 from .progress_tracker import get_progress_tracker
 from .system_monitor import get_pipeline_timeline
+from .web_app import load_settings
 from .config import (
     CHANNELWATCH_URL,
     CHANNELS_API_URL,
@@ -37,6 +38,7 @@ from .config import (
     POLL_LIMIT,
     POLL_MAX_AGE_HOURS,
     POLL_MAX_QUEUE_SIZE,
+    POLL_QUEUE_MAXSIZE,
     DRY_RUN,
     STALE_EXECUTION_SECONDS,
     LOG_VERBOSITY_FILE,
@@ -47,10 +49,36 @@ from .config import (
 )
 from .logging_config import set_verbosity, get_verbosity
 import json
-from pathlib import Path
 
 LOG = get_logger("watcher")
 
+# Requests queued in this process wake the manual loop immediately; this
+# fallback only picks up requests from other processes and deferred items.
+# Kept under the 30 s window in which a heartbeat counts as alive.
+MANUAL_PROCESS_IDLE_SECONDS = max(MANUAL_PROCESS_POLL_SECONDS, 20)
+
+
+@dataclass(slots=True)
+class _PartialEvent:
+    """Minimal event for Parser.from_channelwatch() on manual requests."""
+
+    timestamp: datetime
+    title: str
+    start_time: datetime
+    path: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _RecoveredEvent:
+    """Orphaned execution re-queued for the polling processor at startup."""
+
+    timestamp: datetime
+    title: str
+    start_time: datetime
+    source: str = "restart_recovery"
+    path: Optional[str] = None
+    exec_id: Optional[str] = None
+
 
 def _get_db_dry_run() -> bool:
     """Return the live dry_run flag from the settings DB.
@@ -110,8 +138,31 @@ def _load_whitelist() -> "Whitelist":
 
 
 # Queue for pending polling detections
-# (allows polling to continue while processing serially)
-_polling_queue = asyncio.Queue()
+# (allows polling to continue while processing serially).  Bounded so a burst
+# of detections backpressures the event source instead of growing unbounded.
+_polling_queue = asyncio.Queue(maxsize=POLL_QUEUE_MAXSIZE)
+
+# Strong references to overflow put() tasks so they are not garbage-collected
+_overflow_puts: set = set()
+
+
+def _enqueue_nowait(event) -> None:
+    """Queue an event without awaiting, for callers that must not block.
+
+    Used where awaiting ``put()`` on a full queue would deadlock: startup
+    recovery runs before the consumer starts, and promotion runs inside the
+    consumer itself. Normally a plain ``put_nowait``; only when the queue is
+    full does the put move to a task that waits for room.
+
+    Args:
+        event: Partial event to enqueue
+    """
+    try:
+        _polling_queue.put_nowait(event)
+    except asyncio.QueueFull:
+        task = asyncio.create_task(_polling_queue.put(event))
+        _overflow_puts.add(task)
+        task.add_done_callback(_overflow_puts.discard)
 
 
 def promote_next_discovered_to_pending():
@@ -123,15 +174,10 @@ def promote_next_discovered_to_pending():
     when current job completes. Only promotes if no pending jobs exist.
     """
     tracker = get_tracker()
-    all_executions = tracker.get_executions(limit=1000)
 
     # Count pending jobs (not running, just waiting)
     # Exclude manual_process jobs (handled by separate loop)
-    pending_count = sum(
-        1
-        for e in all_executions
-        if e.get("status") == "pending" and e.get("kind") != "manual_process"
-    )
+    pending_count = tracker.count_by_status(["pending"], exclude_kind="manual_process")
 
     # Only promote if we have NO pending jobs (keep exactly 1 pending queued)
     if pending_count > 0:
@@ -139,15 +185,12 @@ def promote_next_discovered_to_pending():
 
     # Get oldest discovered execution (by started_at)
     # Exclude manual_process jobs (handled by separate loop)
-    discovered = [
-        e
-        for e in all_executions
-        if e.get("status") == "discovered" and e.get("kind") != "manual_process"
-    ]
+    discovered = tracker.get_executions_by_status(
+        ["discovered"], limit=1, exclude_kind="manual_process"
+    )
     if not discovered:
         return None
 
-    discovered.sort(key=lambda x: x.get("started_at", ""))
     next_exec = discovered[0]
 
     # Promote to pending
@@ -211,8 +254,6 @@ def apply_settings_to_event(event, item_overrides=None):
         event: ProcessingEvent to apply settings to
         item_overrides: Optional dict of per-item overrides (from manual processing UI)
     """
-    from .web_app import load_settings
-
     # Load baseline settings from database/web UI
     global_settings = load_settings()
 
@@ -243,7 +284,6 @@ async def process_manual_process_queue(state, pipeline, api, parser):
             "PROCESSING_ENABLED=false — skipping manual process queue (monitoring only)"
         )
         return
-    state._load()
     queue = state.get_manual_process_queue()
     tracker = get_tracker()
 
@@ -273,24 +313,25 @@ async def process_manual_process_queue(state, pipeline, api, parser):
     if queue:
         LOG.info("Processing manual process queue: %d items", len(queue))
 
+        # Index the executions fetched above by path and ID once, rather than
+        # re-fetching and scanning them for every queued item
+        execs_by_path = {}
+        for e in all_execs:
+            execs_by_path.setdefault(e.get("path"), []).append(e)
+        execs_by_id, index_complete = _index_executions(all_execs)
+
         # Create pending executions for all queued items that don't have one
+        # (one creation timestamp for the whole pass)
+        created_at = datetime.now(timezone.utc).isoformat()
         for path in queue:
             job_id = build_manual_process_job_id(path)
-            existing = tracker.get_execution(job_id)
+            existing = execs_by_id.get(job_id)
+            if existing is None and not index_complete:
+                existing = tracker.get_execution(job_id)
 
             # Check if there's already an active execution for this path
             # (including retries with timestamped IDs)
-            all_execs = tracker.get_executions(limit=1000)
-
-            # Debug: Log what we're looking for
-            LOG.debug(
-                "Queue check: looking for path=%r in %d executions",
-                path,
-                len(all_execs),
-            )
-
-            # Debug: Log all executions with this path
-            matching_execs = [e for e in all_execs if e.get("path") == path]
+            matching_execs = execs_by_path.get(path, [])
             if matching_execs:
                 LOG.debug("Found %d executions matching path:", len(matching_execs))
                 for e in matching_execs:
@@ -301,21 +342,15 @@ async def process_manual_process_queue(state, pipeline, api, parser):
                         e.get("path"),
                     )
 
-            path_has_active_exec = any(
-                e.get("path") == path
-                and e.get("status") in ("pending", "running", "discovered", "canceling")
-                for e in all_execs
-            )
+            active_execs = [
+                e.get("id")
+                for e in matching_execs
+                if e.get("status") in ("pending", "running", "discovered", "canceling")
+            ]
+            path_has_active_exec = bool(active_execs)
 
             # Debug logging
             if path_has_active_exec:
-                active_execs = [
-                    e.get("id")
-                    for e in all_execs
-                    if e.get("path") == path
-                    and e.get("status")
-                    in ("pending", "running", "discovered", "canceling")
-                ]
                 LOG.debug(
                     "Skipping creation - active executions exist for %s: %s",
                     path,
@@ -352,26 +387,50 @@ async def process_manual_process_queue(state, pipeline, api, parser):
                     should_create = True
 
             if should_create:
-                filename = path.split("/")[-1]
+                filename = os.path.basename(path)
                 title = f"Manual: {filename}"
                 LOG.debug("Creating pending execution: job_id=%s path=%r", job_id, path)
-                tracker.start_execution(
+                new_id = tracker.start_execution(
                     job_id,
                     title,
                     path,
-                    datetime.now(timezone.utc).isoformat(),
+                    created_at,
                     status="pending",
                     kind="manual_process",
                 )
+                # Keep the index in step with the row just written; a
+                # timestamped retry ID leaves the base job_id untouched
+                if new_id == job_id:
+                    execs_by_id[job_id] = {
+                        "id": job_id,
+                        "title": title,
+                        "path": path,
+                        "status": "pending",
+                        "kind": "manual_process",
+                    }
                 LOG.debug("Created pending execution for queued item: %s", path)
 
+        # Previously failed items are removed from the queue together after
+        # the pass (one commit); if the pass dies first they are simply
+        # skipped again next time
+        skipped_failed = []
+
+        # Statuses only change under us while a pipeline run is awaited (the
+        # polling processor and web UI run meanwhile), so the index is
+        # refreshed from the DB once after each run rather than per item
+        index_stale = False
+
         # Process items in queue
         for path in queue:
             _maybe_update_log_verbosity()
 
+            if index_stale:
+                all_execs = tracker.get_executions(limit=1000)
+                execs_by_id, index_complete = _index_executions(all_execs)
+                index_stale = False
+
             # Check queue capacity before processing
             # Count currently running OR canceling executions
-            all_execs = tracker.get_executions(limit=100)
             running_count = sum(
                 1 for e in all_execs if e.get("status") in ("running", "canceling")
             )
@@ -393,69 +452,42 @@ async def process_manual_process_queue(state, pipeline, api, parser):
             try:
                 # Skip items that are failed or cancelled — don't retry automatically.
                 # Also clear them from the queue so they don't re-appear after restart.
-                existing = tracker.get_execution(job_id)
+                existing = execs_by_id.get(job_id)
+                if existing is None and not index_complete:
+                    existing = tracker.get_execution(job_id)
                 if existing and existing.get("status") == "failed":
                     LOG.info(
                         "Skipping failed item, removing from queue: %s",
                         path,
                     )
-                    state.clear_manual_process_request(path)
+                    skipped_failed.append(path)
                     continue
                 # Note: "cancelled" is no longer skipped here — if the user
                 # explicitly re-queued a cancelled job, we should run it.
 
                 LOG.info("Manual processing: %s", path)
-                orig_path = path + ".cc4chan.orig"
-                legacy_orig_path = path + ".orig"
-                srt_path = path.rsplit(".", 1)[0] + ".srt"
-
-                # embed_captions.py reads from .cc4chan.orig directly when it
-                # exists, so we no longer need to copy the multi-GB original
-                # back to .mpg.  Just log what source will be used.
-                if os.path.exists(orig_path):
-                    LOG.info(
-                        "Reprocessing: .cc4chan.orig exists, embed_captions "
-                        "will read from it directly: %s",
-                        orig_path,
-                    )
-                elif os.path.exists(legacy_orig_path):
-                    LOG.info(
-                        "Reprocessing: legacy .orig exists, embed_captions "
-                        "will read from it directly: %s",
-                        legacy_orig_path,
-                    )
-                # If .orig does not exist, proceed with current .mpg
-
-                # Remove existing .srt to force reprocessing
-                if os.path.exists(srt_path):
-                    LOG.info("Removing existing SRT for reprocessing: %s", srt_path)
-                    os.remove(srt_path)
+                # Recordings may live on a NAS, so the file checks run in a
+                # worker thread rather than stalling the web app and sources
+                await asyncio.to_thread(_prepare_manual_reprocess, path)
 
                 # Create a minimal event from the path with settings
-                filename = path.split("/")[-1]
+                filename = os.path.basename(path)
                 title = f"Manual: {filename}"
 
                 # Load per-item settings for this manual process request
                 item_settings = state.get_manual_process_settings(path)
 
-                event = Parser().from_channelwatch(
-                    type(
-                        "PartialEvent",
-                        (),
-                        {
-                            "timestamp": datetime.now(timezone.utc),
-                            "title": filename,
-                            "start_time": datetime.now(timezone.utc),
-                        },
-                    )(),
+                now = datetime.now(timezone.utc)
+                event = parser.from_channelwatch(
+                    _PartialEvent(timestamp=now, title=filename, start_time=now),
                     path,
                 )
 
                 # Apply unified settings: global baseline + per-item overrides
                 apply_settings_to_event(event, item_overrides=item_settings)
 
-                # Start tracking execution
-                existing = tracker.get_execution(job_id)
+                # Start tracking execution (existing was fetched above and
+                # is not "failed")
 
                 # DEBUG: Log what we found
                 if existing:
@@ -478,18 +510,14 @@ async def process_manual_process_queue(state, pipeline, api, parser):
                     "failed",
                     "cancelled",
                 ):
-                    all_execs = tracker.get_executions(limit=1000)
-                    active_for_path = [
-                        e
-                        for e in all_execs
-                        if e.get("path") == path
-                        and e.get("status")
-                        in ("pending", "running", "canceling", "discovered")
-                        and e.get("kind") == "manual_process"
-                    ]
+                    active_for_path = tracker.get_execution_by_path(
+                        path,
+                        statuses=["pending", "running", "canceling", "discovered"],
+                        kind="manual_process",
+                    )
                     if active_for_path:
-                        # Use the first active execution found for this path
-                        existing = active_for_path[0]
+                        # Use the most recent active execution for this path
+                        existing = active_for_path
                         job_id = existing.get("id")  # Use its ID (may have timestamp)
                         LOG.info(
                             "Found orphaned %s execution by path: " "status=%s, id=%s",
@@ -550,28 +578,15 @@ async def process_manual_process_queue(state, pipeline, api, parser):
                 # immediately without requiring a full container restart.
                 pipeline.dry_run = _get_db_dry_run()
 
-                # Run pipeline in executor to not block event loop
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    partial(
-                        pipeline.run,
-                        event,
-                        job_id_override=exec_id,
-                        cancel_check=lambda: tracker.is_cancel_requested(exec_id),
-                    ),
+                # Run pipeline in a worker thread to not block event loop
+                index_stale = True
+                result = await asyncio.to_thread(
+                    pipeline.run,
+                    event,
+                    job_id_override=exec_id,
+                    cancel_check=partial(tracker.is_cancel_requested, exec_id),
                 )
 
-                # Add pipeline output to execution logs
-                if result.stdout:
-                    for line in result.stdout.strip().split("\n"):
-                        if line.strip():
-                            tracker.add_log(exec_id, f"[stdout] {line}")
-                if result.stderr:
-                    for line in result.stderr.strip().split("\n"):
-                        if line.strip():
-                            tracker.add_log(exec_id, f"[stderr] {line}")
-
                 # Complete execution tracking
                 # For dry-run executions, mark as "dry_run" status
                 # instead of "completed"
@@ -655,16 +670,96 @@ async def process_manual_process_queue(state, pipeline, api, parser):
             finally:
                 set_job_id(None)
 
+        state.clear_manual_process_requests(skipped_failed)
+
+
+def _prepare_manual_reprocess(path: str) -> None:
+    """Prepare a recording's files for a manual reprocess.
+
+    embed_captions.py reads from .cc4chan.orig directly when it exists, so
+    the multi-GB original is no longer copied back to .mpg; this only logs
+    which source will be used and removes any existing .srt to force
+    caption regeneration.
+
+    Args:
+        path: Recording file path
+    """
+    orig_path = path + ".cc4chan.orig"
+    legacy_orig_path = path + ".orig"
+    srt_path = os.path.splitext(path)[0] + ".srt"
+
+    if os.path.exists(orig_path):
+        LOG.info(
+            "Reprocessing: .cc4chan.orig exists, embed_captions "
+            "will read from it directly: %s",
+            orig_path,
+        )
+    elif os.path.exists(legacy_orig_path):
+        LOG.info(
+            "Reprocessing: legacy .orig exists, embed_captions "
+            "will read from it directly: %s",
+            legacy_orig_path,
+        )
+    # If .orig does not exist, proceed with current .mpg
+
+    if os.path.exists(srt_path):
+        LOG.info("Removing existing SRT for reprocessing: %s", srt_path)
+        os.remove(srt_path)
+
+
+def _index_executions(executions):
+    """Index execution dicts by ID.
+
+    Args:
+        executions: Execution dicts from ``tracker.get_executions(limit=1000)``
+
+    Returns:
+        Tuple of (dict keyed by execution ID, whether the list covers every
+        execution so that a missing ID means no such execution exists)
+    """
+    by_id = {e.get("id"): e for e in executions}
+    return by_id, len(executions) < 1000
+
+
+def _event_job_id(event_partial) -> str:
+    """Job ID for a detected recording: "<title> @ <start time>".
+
+    Returns the ID already attached to the event if there is one.  The start
+    time is included to avoid daily collisions; it might be a datetime or a
+    string depending on the source.
+    """
+    job_id = getattr(event_partial, "job_id", None)
+    if job_id:
+        return job_id
+    start_time_str = event_partial.start_time
+    if isinstance(start_time_str, datetime):
+        start_time_str = start_time_str.strftime("%Y-%m-%d %H:%M:%S")
+    return f"{event_partial.title} @ {start_time_str}"
+
+
+# (stat signature, parsed verbosity) of LOG_VERBOSITY_FILE when last read
+_verbosity_cache = (None, "")
+
 
 def _maybe_update_log_verbosity() -> None:
-    """Update log verbosity based on shared config file if present."""
+    """Update log verbosity based on shared config file if present.
+
+    The file is only re-read when its stat signature changes, so the
+    per-event cost in steady state is a single stat().
+    """
+    global _verbosity_cache
     try:
-        path = Path(LOG_VERBOSITY_FILE)
-        if not path.exists():
+        try:
+            st = os.stat(LOG_VERBOSITY_FILE)
+        except FileNotFoundError:
             return
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        desired = str(data.get("verbosity", "")).upper()
+        sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached_sig, desired = _verbosity_cache
+        if sig != cached_sig:
+            with open(LOG_VERBOSITY_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            desired = str(data.get("verbosity", "")).upper()
+            _verbosity_cache = (sig, desired)
         if desired and desired != get_verbosity():
             set_verbosity(desired)
             LOG.info("Log verbosity updated to %s", desired)
@@ -672,38 +767,61 @@ def _maybe_update_log_verbosity() -> None:
         LOG.warning("Failed to update log verbosity: %s", e)
 
 
+def _iter_process_cmdlines():
+    """Yield (pid, command line) for every running process.
+
+    Walks /proc/<pid>/cmdline directly (one small read per process, no
+    ``ps`` fork or column parsing).  Falls back to psutil where /proc is
+    unavailable.
+    """
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        import psutil
+
+        for proc in psutil.process_iter(["pid", "cmdline"]):
+            cmdline = proc.info.get("cmdline")
+            if cmdline:
+                yield proc.info["pid"], " ".join(cmdline)
+        return
+
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                raw = f.read()
+        except OSError:
+            continue  # Exited mid-walk, or not ours to read
+        if raw:
+            # Arguments are NUL-separated (and NUL-terminated)
+            yield int(entry), raw.rstrip(b"\0").replace(b"\0", b" ").decode(
+                errors="replace"
+            )
+
+
 def cleanup_orphaned_processes():
     """Kill any existing whisper/caption processes from previous runs."""
     try:
-        # Find all python processes running embed_captions or whisper
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
+        own_pid = os.getpid()
         killed_count = 0
-        for line in result.stdout.splitlines():
-            if "embed_captions" in line or "/whisper " in line or "whisper/" in line:
-                # Skip the grep process itself and this script
-                if "ps aux" in line or "cleanup_orphaned" in line:
-                    continue
-
-                # Extract PID (second column)
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        pid = int(parts[1])
-                        LOG.info(
-                            "Killing orphaned process (PID %d): %s",
-                            pid,
-                            " ".join(parts[10:15]),
-                        )
-                        os.kill(pid, signal.SIGTERM)
-                        killed_count += 1
-                    except (ValueError, ProcessLookupError, PermissionError) as e:
-                        LOG.debug("Failed to kill PID %s: %s", parts[1], e)
+        # Find all processes running embed_captions or whisper
+        for pid, cmdline in _iter_process_cmdlines():
+            if pid == own_pid:
+                continue
+            if (
+                "embed_captions" in cmdline
+                or "/whisper " in cmdline
+                or "whisper/" in cmdline
+            ):
+                try:
+                    LOG.info(
+                        "Killing orphaned process (PID %d): %s", pid, cmdline[:200]
+                    )
+                    os.kill(pid, signal.SIGTERM)
+                    killed_count += 1
+                except (ProcessLookupError, PermissionError) as e:
+                    LOG.debug("Failed to kill PID %s: %s", pid, e)
 
         if killed_count > 0:
             LOG.info("Killed %d orphaned process(es)", killed_count)
@@ -724,8 +842,9 @@ async def main():
     init_db()
     LOG.info("Database initialized")
 
-    # Kill any orphaned processes from previous runs
-    cleanup_orphaned_processes()
+    # Kill any orphaned processes from previous runs (off the event loop,
+    # which the web app shares)
+    await asyncio.to_thread(cleanup_orphaned_processes)
 
     # Initialize API first (needed for health checks)
     api = ChannelsAPI(CHANNELS_API_URL)
@@ -744,27 +863,20 @@ async def main():
     # On container startup, reset any running/pending/interrupted jobs
     # back to discovered so promotion logic can control the single pending slot.
     # Exclude manual_process jobs (handled by separate cleanup logic below)
-    all_execs = tracker.get_executions(limit=1000)
-    running_execs = [
-        e
-        for e in all_execs
-        if e.get("status") == "running" and e.get("kind") != "manual_process"
-    ]
-    pending_execs = [
-        e
-        for e in all_execs
-        if e.get("status") == "pending" and e.get("kind") != "manual_process"
-    ]
+    active_execs = tracker.get_executions_by_status(
+        ["running", "pending"], exclude_kind="manual_process"
+    )
     interrupted_execs = [
         e
-        for e in all_execs
-        if e.get("status") == "completed"
-        and e.get("success") is False
-        and e.get("error", "").startswith("Execution interrupted by container restart")
+        for e in tracker.get_executions_by_status(
+            ["completed"],
+            error_prefix="Execution interrupted by container restart",
+        )
+        if e.get("success") is False
     ]
 
     reset_count = 0
-    for exec_data in running_execs + pending_execs + interrupted_execs:
+    for exec_data in active_execs + interrupted_execs:
         job_id = exec_data.get("id")
         if not job_id:
             continue
@@ -803,17 +915,9 @@ async def main():
     # Re-queue orphaned discovered/pending executions from previous run
     # These were interrupted and need to be processed
     # Exclude manual_process jobs (handled by separate loop)
-    all_executions = tracker.get_executions(limit=1000)
-    orphaned_executions = [
-        e
-        for e in all_executions
-        if e.get("status") in ("pending", "discovered")
-        and e.get("kind") != "manual_process"
-    ]
-
-    # Sort orphaned executions by started_at (oldest first) to maintain FIFO queue order
-    orphaned_executions.sort(
-        key=lambda e: e.get("started_at") or datetime.min.replace(tzinfo=timezone.utc)
+    # Oldest first (by started_at) to maintain FIFO queue order
+    orphaned_executions = tracker.get_executions_by_status(
+        ["pending", "discovered"], exclude_kind="manual_process"
     )
 
     if orphaned_executions:
@@ -854,20 +958,14 @@ async def main():
         # Load whitelist (uses cached version, reloads every 30s)
         whitelist = _load_whitelist()
 
-        @dataclass
-        class PartialProcessingEvent:
-            timestamp: datetime
-            title: str
-            start_time: datetime
-            source: str = "restart_recovery"
-            path: Optional[str] = None
-            exec_id: Optional[str] = None
-
         requeued_count = 0
         skipped_whitelist_count = 0
         stale_dvr_count = 0
         first_discovered_promoted = False  # Track if we've promoted first discovered
 
+        # Recovery is a quick pass; one timestamp serves every orphan
+        now = datetime.now(timezone.utc)
+
         for execution in orphaned_executions:
             try:
                 # Parse job_id format: "Title @ YYYY-MM-DD HH:MM:SS"
@@ -879,9 +977,7 @@ async def main():
                     ).replace(tzinfo=timezone.utc)
                 else:
                     title = execution.get("title", "Unknown")
-                    start_time = execution.get("started_at") or datetime.now(
-                        timezone.utc
-                    )
+                    start_time = execution.get("started_at") or now
 
                 # Check whitelist before re-queuing
                 # (channel not stored in execution tracker, so pass None)
@@ -901,9 +997,7 @@ async def main():
                                 started_dt = datetime.fromisoformat(started_dt)
                             if started_dt.tzinfo is None:
                                 started_dt = started_dt.replace(tzinfo=timezone.utc)
-                            elapsed = (
-                                datetime.now(timezone.utc) - started_dt
-                            ).total_seconds()
+                            elapsed = (now - started_dt).total_seconds()
                         tracker.complete_execution(
                             job_id=job_id,
                             success=False,
@@ -947,7 +1041,7 @@ async def main():
                         execution.get("title", "Unknown"),
                     )
 
-                event = PartialProcessingEvent(
+                event = _RecoveredEvent(
                     title=title,
                     start_time=start_time,
                     timestamp=start_time,
@@ -957,7 +1051,7 @@ async def main():
 
                 # Add to queue for processing
                 # (will be picked up by polling processor)
-                asyncio.create_task(_polling_queue.put(event))
+                _enqueue_nowait(event)
                 requeued_count += 1
                 LOG.info(
                     "Re-queued orphaned execution: %s",
@@ -1070,7 +1164,7 @@ async def main():
 
     # Initialize remaining processing components
     parser = Parser()
-    state = StateBackend(STATE_FILE)
+    state = StateBackend.get(STATE_FILE)
 
     # Auto-detect caption command.
     # Always use embed_captions.py — it handles SRT-only, lossless remux, and
@@ -1107,31 +1201,27 @@ async def main():
     # Only clear 'running' items (interrupted by restart)
     # Keep 'pending' items (safe to retry) and 'failed' items
     # (don't retry automatically)
-    tracker = get_tracker()
-    all_executions = tracker.get_executions()
     stale_count = 0
-    for exec_data in all_executions:
-        if (
-            exec_data.get("kind") == "manual_process"
-            and exec_data.get("status") == "running"
-        ):
-            job_id = exec_data.get("id")
-            LOG.warning(
-                "Clearing stale manual process execution (was running): %s", job_id
-            )
-            tracker.complete_execution(
-                job_id, success=False, elapsed_seconds=0, error="Interrupted by restart"
-            )
-            stale_count += 1
+    for exec_data in tracker.get_executions(
+        limit=1000, status="running", kind="manual_process"
+    ):
+        job_id = exec_data.get("id")
+        LOG.warning("Clearing stale manual process execution (was running): %s", job_id)
+        tracker.complete_execution(
+            job_id, success=False, elapsed_seconds=0, error="Interrupted by restart"
+        )
+        stale_count += 1
     if stale_count > 0:
         LOG.info("Cleared %d stale manual process executions", stale_count)
 
     # Background loop for manual process queue
     async def _manual_process_loop():
         LOG.info(
-            "Starting manual process background loop (interval: %ds)",
-            MANUAL_PROCESS_POLL_SECONDS,
+            "Starting manual process background loop (fallback interval: %ds)",
+            MANUAL_PROCESS_IDLE_SECONDS,
         )
+        # Set by the state backend when a request is queued in this process
+        manual_event = state.manual_process_event()
         # Get database session for heartbeat
         db = next(get_db())
         heartbeat_service = HeartbeatService(db)
@@ -1156,7 +1246,16 @@ async def main():
                 except Exception as e:
                     LOG.error("Error processing manual queue: %s", e, exc_info=True)
 
-                await asyncio.sleep(MANUAL_PROCESS_POLL_SECONDS)
+                # Sleep until a request is queued; the timeout picks up
+                # requests from other processes and deferred items, and
+                # keeps the heartbeat fresh
+                try:
+                    await asyncio.wait_for(
+                        manual_event.wait(), timeout=MANUAL_PROCESS_IDLE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                manual_event.clear()
         except asyncio.CancelledError:
             LOG.info("Manual process loop cancelled")
         except Exception as e:
@@ -1178,6 +1277,10 @@ async def main():
     async def _polling_processor_loop():
         LOG.info("Starting polling processor background loop")
         shutdown_controller = get_shutdown_controller()
+        # Exception types whose traceback has already been logged; repeats
+        # get a one-line error so a failure storm doesn't format hundreds
+        # of identical tracebacks (all are logged in DEBUG mode)
+        traceback_logged = set()
         try:
             while True:
                 # Check for immediate shutdown (emergency stop)
@@ -1202,22 +1305,17 @@ async def main():
 
                     _maybe_update_log_verbosity()
 
-                    # Set job ID for this processing task
-                    # Include date to avoid daily collisions
-                    # start_time might be datetime or string depending on source
-                    start_time_str = event_partial.start_time
-                    if isinstance(start_time_str, datetime):
-                        start_time_str = start_time_str.strftime("%Y-%m-%d %H:%M:%S")
-                    job_id = f"{event_partial.title} @ {start_time_str}"
+                    # Set job ID for this processing task (computed by main()
+                    # before enqueueing, except for recovered/promoted events)
+                    job_id = _event_job_id(event_partial)
                     set_job_id(job_id)
 
-                    tracker = get_tracker()
                     exec_id = None
 
                     try:
-                        # Use path from event if provided (polling source),
-                        # otherwise lookup
-                        if hasattr(event_partial, "path") and event_partial.path:
+                        # Use path from event if provided (polling source, or
+                        # resolved by main() before enqueueing), otherwise lookup
+                        if getattr(event_partial, "path", None):
                             path = event_partial.path
                             LOG.debug("Using path from event: %s", path)
                         else:
@@ -1245,36 +1343,22 @@ async def main():
                         # When job starts, promote next discovered → pending
                         promoted_event = promote_next_discovered_to_pending()
                         if promoted_event:
-                            await _polling_queue.put(promoted_event)
+                            # This loop is the only consumer, so it must
+                            # not await put() on a full queue
+                            _enqueue_nowait(promoted_event)
 
                         # Refresh dry_run from DB so a settings change takes
                         # effect immediately without a full container restart.
                         pipeline.dry_run = _get_db_dry_run()
 
-                        # Run pipeline in executor to not block event loop
-                        loop = asyncio.get_event_loop()
-                        result = await loop.run_in_executor(
-                            None,
-                            partial(
-                                pipeline.run,
-                                event,
-                                job_id_override=exec_id,
-                                cancel_check=lambda: tracker.is_cancel_requested(
-                                    exec_id
-                                ),
-                            ),
+                        # Run pipeline in a worker thread to not block event loop
+                        result = await asyncio.to_thread(
+                            pipeline.run,
+                            event,
+                            job_id_override=exec_id,
+                            cancel_check=partial(tracker.is_cancel_requested, exec_id),
                         )
 
-                        # Add pipeline output to execution logs
-                        if result.stdout:
-                            for line in result.stdout.strip().split("\n"):
-                                if line.strip():
-                                    tracker.add_log(exec_id, f"[stdout] {line}")
-                        if result.stderr:
-                            for line in result.stderr.strip().split("\n"):
-                                if line.strip():
-                                    tracker.add_log(exec_id, f"[stderr] {line}")
-
                         # Complete execution tracking
                         # For dry-run executions, mark as "dry_run"
                         # status instead of "completed"
@@ -1350,11 +1434,16 @@ async def main():
                             )
 
                     except Exception as e:
+                        show_traceback = type(
+                            e
+                        ) not in traceback_logged or LOG.isEnabledFor(logging.DEBUG)
+                        traceback_logged.add(type(e))
                         LOG.error(
-                            "Unexpected error processing '%s': %s",
+                            "Unexpected error processing '%s': %s (%s)",
                             event_partial.title,
                             e,
-                            exc_info=True,
+                            type(e).__name__,
+                            exc_info=show_traceback,
                         )
                         if exec_id:
                             tracker.complete_execution(
@@ -1377,9 +1466,6 @@ async def main():
     LOG.info("Polling processor background task started")
     await asyncio.sleep(0)
 
-    # Track last manual queue check
-    last_manual_check = datetime.now()
-
     # Get shutdown controller for main loop
     shutdown_controller = get_shutdown_controller()
 
@@ -1397,36 +1483,14 @@ async def main():
             )
             break
 
-        # Also check manual queue periodically (every 5 seconds)
-        now = datetime.now()
-        if (now - last_manual_check).total_seconds() > 5:
-            # Non-blocking check of manual queue
-            asyncio.create_task(
-                process_manual_process_queue(state, pipeline, api, parser)
-            )
-            last_manual_check = now
-
         _maybe_update_log_verbosity()
 
-        # start_time might be datetime or string depending on source
-        start_time_str = event_partial.start_time
-        if isinstance(start_time_str, datetime):
-            start_time_str = start_time_str.strftime("%Y-%m-%d %H:%M:%S")
-        job_id = f"{event_partial.title} @ {start_time_str}"
-
-        tracker = get_tracker()
-        existing_by_id = tracker.get_execution(job_id)
-        bypass_state_check = False
-        if existing_by_id and existing_by_id.get("status") in (
-            "pending",
-            "discovered",
-        ):
-            bypass_state_check = True
-
-        if not bypass_state_check and not state.should_process(event_partial.timestamp):
-            continue
+        job_id = _event_job_id(event_partial)
+        # Carried on the event so the processor loop doesn't rebuild it
+        event_partial.job_id = job_id
 
-        # Check whitelist (hot-reloaded from DB every 30s)
+        # Cheapest rejections first; the DB is only queried for survivors.
+        # Check whitelist (in memory, hot-reloaded from DB every 30s)
         if not _load_whitelist().is_allowed(
             event_partial.title,
             event_partial.start_time,
@@ -1434,6 +1498,17 @@ async def main():
         ):
             continue
 
+        existing_by_id = None
+        if not state.should_process(event_partial.timestamp):
+            # Already past this timestamp: only go on for an execution that
+            # is still waiting to run
+            existing_by_id = tracker.get_execution(job_id)
+            if not existing_by_id or existing_by_id.get("status") not in (
+                "pending",
+                "discovered",
+            ):
+                continue
+
         # Use path from event if provided (polling source), otherwise lookup
         if hasattr(event_partial, "path") and event_partial.path:
             path = event_partial.path
@@ -1441,14 +1516,16 @@ async def main():
             path = api.lookup_recording_path(
                 event_partial.title, event_partial.start_time
             )
+            # Carried on the event so the processor loop doesn't repeat the
+            # API lookup
+            event_partial.path = path
 
         # Check if this exact recording (by path) has been processed
         # Handles job_id format changes and multiple recordings, same title
-        all_executions = tracker.get_executions(limit=1000)
-        existing_by_path = next(
-            (e for e in all_executions if e.get("path") == path), None
-        )
-        existing_by_id = tracker.get_execution(job_id)
+        existing_by_path = tracker.get_execution_by_path(path)
+        if not existing_by_path and existing_by_id is None:
+            # Only consulted when nothing matched by path
+            existing_by_id = tracker.get_execution(job_id)
 
         # Determine if we should create a new execution
         should_create = False
@@ -1522,21 +1599,15 @@ async def main():
 
         # For graceful shutdown, wait for current job to complete
         if shutdown_controller.is_graceful_shutdown():
-            tracker = get_tracker()
-            all_executions = tracker.get_executions(limit=1000)
-            running = [e for e in all_executions if e.get("status") == "running"]
+            running = tracker.get_executions_by_status(["running"], limit=1)
             if running:
                 LOG.info(
                     "Waiting for current job to complete: %s",
                     running[0].get("title", "Unknown"),
                 )
                 # Wait for job to finish (check every 2 seconds)
-                while running:
+                while tracker.count_by_status(["running"]):
                     await asyncio.sleep(2)
-                    all_executions = tracker.get_executions(limit=1000)
-                    running = [
-                        e for e in all_executions if e.get("status") == "running"
-                    ]
                 LOG.info("Current job completed, proceeding with shutdown")
     else:
         LOG.info("Event loop ended normally")
@@ -64,7 +64,7 @@ TEMPLATES_DIR = WEB_ROOT / "templates"
 STATIC_DIR = WEB_ROOT / "static"
 
 app = FastAPI(title="Py Captions Web GUI", version=VERSION)
-state_backend = StateBackend(STATE_FILE)
+state_backend = StateBackend.get(STATE_FILE)
 logger = logging.getLogger(__name__)
 
 # Global orphan cleanup scheduler
@@ -1022,7 +1022,7 @@ def format_local(ts: str) -> str:
 async def status() -> dict:
     """Return pipeline status and statistics.
 
-    Reads from state file to report:
+    Reads the shared state backend to report:
     - Last timestamp processed
     - Manual process queue size
     - Configuration snapshot
@@ -1030,9 +1030,8 @@ async def status() -> dict:
     - Service health (Channels DVR, ChannelWatch)
     """
     try:
-        # Reload state to get latest
-        state_backend._load()
-
+        # No reload: the watcher updates this same StateBackend in-process,
+        # and re-reading the file could roll last_ts back mid-update()
         last_ts = state_backend.last_ts
         manual_process_queue = state_backend.get_manual_process_queue()
 
@@ -1501,10 +1500,14 @@ async def clear_polling_cache() -> dict:
     on the next poll. Useful for reprocessing failed recordings.
     """
     try:
-        from .services.polling_cache_service import PollingCacheService
+        from .config import REDIS_URL
+        from .services.polling_cache_service import (
+            PollingCacheService,
+            connect_redis,
+        )
 
         db = next(get_db())
-        cache_service = PollingCacheService(db)
+        cache_service = PollingCacheService(db, redis_client=connect_redis(REDIS_URL))
         count = cache_service.clear_all()
         return {
             "cleared": count,
@@ -2138,7 +2141,7 @@ async def get_quarantined_files() -> dict:
     try:
         db = next(get_db())
         service = _build_quarantine_service(db)
-        items = service.get_quarantined_files()
+        items = service.get_quarantined_rows()
         stats = service.get_quarantine_stats()
 
         return {
@@ -2179,20 +2182,10 @@ async def restore_quarantined_files(item_ids: list[int]) -> dict:
         db = next(get_db())
         service = _build_quarantine_service(db)
 
-        restored = 0
-        failed = 0
-        errors = []
-
-        for item_id in item_ids:
-            try:
-                if service.restore_file(item_id):
-                    restored += 1
-                else:
-                    failed += 1
-                    errors.append(f"Failed to restore item {item_id}")
-            except Exception as e:
-                failed += 1
-                errors.append(f"Item {item_id}: {str(e)}")
+        results = service.restore_files(item_ids)
+        errors = [error for error in results.values() if error]
+        failed = len(errors)
+        restored = len(results) - failed
 
         logger.info(f"Restored {restored} items from quarantine, {failed} failed")
 
@@ -2256,7 +2249,7 @@ async def delete_quarantined_files(item_ids: list[int]) -> dict:
             if last_progress:
                 current, total, deleted, failed, cancelled = last_progress
             else:
-                deleted, failed, cancelled = 0, 0, False
+                total, deleted, failed, cancelled = len(item_ids), 0, 0, False
 
             done_event = {
                 "phase": "done",
@@ -2264,7 +2257,7 @@ async def delete_quarantined_files(item_ids: list[int]) -> dict:
                 "deleted": deleted,
                 "failed": failed,
                 "cancelled": cancelled,
-                "total": len(item_ids),
+                "total": total,
             }
             yield f"data: {json.dumps(done_event)}\n\n"
 
@@ -2922,7 +2915,7 @@ async def add_to_manual_process_queue(request: Request) -> dict:
                 run_transcode=run_transcode,
                 log_verbosity=log_verbosity,
             )
-            filename = path.split("/")[-1]
+            filename = os.path.basename(path)
             title = f"Manual: {filename}"
             job_id = build_manual_process_job_id(path)
             existing = tracker.get_execution(job_id)
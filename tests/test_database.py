@@ -46,3 +46,116 @@ class TestInitDb:
         # Calling init_db multiple times should not raise
         init_db()
         init_db()
+
+    def test_clears_malformed_progress_metadata(self):
+        from py_captions_for_channels import database as db_module
+        from py_captions_for_channels.services.progress_service import (
+            ProgressService,
+        )
+        from sqlalchemy import text
+
+        with db_module.engine.connect() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO progress (job_id, process_type, percent, "
+                    "progress_metadata, updated_at) VALUES "
+                    "('bad', 'ffmpeg', 0.5, 'not json', '2026-01-01 00:00:00'), "
+                    "('ok', 'ffmpeg', 0.5, '{\"a\": 1}', '2026-01-01 00:00:00')"
+                )
+            )
+            conn.commit()
+
+        init_db()
+
+        db = db_module.SessionLocal()
+        try:
+            service = ProgressService(db)
+            assert service.to_dict(service.get_progress("bad"))["details"] == {}
+            assert service.to_dict(service.get_progress("ok"))["details"] == {"a": 1}
+        finally:
+            db.close()
+
+    def test_quarantine_composite_indexes(self):
+        from py_captions_for_channels import database as db_module
+        from sqlalchemy import inspect, text
+
+        # Simulate a pre-existing database with only the old index
+        with db_module.engine.connect() as conn:
+            conn.execute(text("DROP INDEX idx_quarantine_status_expires"))
+            conn.execute(
+                text("CREATE INDEX idx_quarantine_status ON quarantine_items(status)")
+            )
+            conn.commit()
+
+        init_db()
+
+        names = {
+            ix["name"]
+            for ix in inspect(db_module.engine).get_indexes("quarantine_items")
+        }
+        assert "idx_quarantine_status_expires" in names
+        assert "idx_quarantine_status_original" in names
+        assert "idx_quarantine_status" not in names
+
+    def test_unique_quarantine_index_skipped_while_duplicates_exist(self, tmp_path):
+        from datetime import datetime, timedelta, timezone
+
+        from py_captions_for_channels import database as db_module
+        from py_captions_for_channels.models import QuarantineItem
+        from sqlalchemy import inspect, text
+
+        with db_module.engine.connect() as conn:
+            conn.execute(text("DROP INDEX uq_quarantine_active_original"))
+            conn.commit()
+
+        db = db_module.SessionLocal()
+        now = datetime.now(timezone.utc)
+        files = []
+        for i in range(2):
+            path = tmp_path / f"dup_{i}.srt"
+            path.write_text("x")
+            files.append(path)
+            db.add(
+                QuarantineItem(
+                    original_path="/rec/same.srt",
+                    quarantine_path=str(path),
+                    file_type="srt",
+                    reason="test",
+                    status="quarantined",
+                    created_at=now + timedelta(seconds=i),
+                    expires_at=now + timedelta(days=30),
+                )
+            )
+        db.commit()
+        db.close()
+
+        init_db()
+
+        names = {
+            ix["name"]
+            for ix in inspect(db_module.engine).get_indexes("quarantine_items")
+        }
+        assert "uq_quarantine_active_original" not in names
+        assert "idx_quarantine_status_expires" in names
+        # A migration never deletes quarantined files or rows
+        assert all(path.exists() for path in files)
+        with db_module.engine.connect() as conn:
+            active = conn.execute(
+                text("SELECT COUNT(*) FROM quarantine_items WHERE status='quarantined'")
+            ).scalar()
+        assert active == 2
+
+        # Once deduplicated, the next startup adds the index
+        from py_captions_for_channels.services.quarantine_service import (
+            QuarantineService,
+        )
+
+        db = db_module.SessionLocal()
+        QuarantineService(db, str(tmp_path / "q")).deduplicate()
+        db.close()
+        init_db()
+        names = {
+            ix["name"]
+            for ix in inspect(db_module.engine).get_indexes("quarantine_items")
+        }
+        assert "uq_quarantine_active_original" in names
@@ -1,4 +1,5 @@
-"""Tests for embed_captions — extract_channel_number, GPUBackend, StepTracker."""
+"""Tests for embed_captions — extract_channel_number, GPUBackend, StepTracker,
+preserve_original."""
 
 from unittest.mock import patch
 
@@ -65,3 +66,28 @@ class TestExtractChannelNumber:
             mock_api_cls.return_value.get_channel_by_path.return_value = "7.1"
             result = extract_channel_number("/plain/path/file.mpg")
         assert result == "7.1"
+
+
+class TestPreserveOriginal:
+    def test_copies_once_with_timestamps_and_mode(self, tmp_path):
+        import os
+        from unittest.mock import MagicMock
+
+        from py_captions_for_channels.embed_captions import preserve_original
+
+        mpg = tmp_path / "ep.mpg"
+        mpg.write_bytes(b"original")
+        os.chmod(mpg, 0o640)
+        os.utime(mpg, ns=(1_000_000_000, 2_000_000_000))
+
+        preserve_original(str(mpg), MagicMock())
+        orig = tmp_path / "ep.mpg.cc4chan.orig"
+        assert orig.read_bytes() == b"original"
+        assert orig.stat().st_mtime_ns == 2_000_000_000
+        assert orig.stat().st_mode & 0o777 == 0o640
+        assert not (tmp_path / "ep.mpg.cc4chan.orig.tmp").exists()
+
+        # Never overwritten once it exists
+        mpg.write_bytes(b"captioned")
+        preserve_original(str(mpg), MagicMock())
+        assert orig.read_bytes() == b"original"
@@ -72,6 +72,68 @@ class TestGetExecutions:
         assert running[0].id == "r1"
 
 
+class TestGetExecutionByPath:
+    def test_returns_most_recent_for_path(self, service):
+        for i, status in enumerate(("failed", "completed")):
+            ts = datetime(2026, 1, 15, 12, i, 0, tzinfo=timezone.utc)
+            service.create_execution(
+                job_id=f"p-{i}",
+                title="Show",
+                path="/rec/a.mpg",
+                status=status,
+                started_at=ts,
+            )
+        service.create_execution(job_id="other", title="Other", path="/rec/b.mpg")
+
+        assert service.get_execution_by_path("/rec/a.mpg").id == "p-1"
+        assert service.get_execution_by_path("/rec/a.mpg", ["failed"]).id == "p-0"
+        assert service.get_execution_by_path("/rec/missing.mpg") is None
+
+    def test_filter_by_kind(self, service):
+        service.create_execution(
+            job_id="m1", title="Manual", path="/rec/k.mpg", kind="manual_process"
+        )
+        service.create_execution(job_id="n1", title="Normal", path="/rec/k.mpg")
+
+        found = service.get_execution_by_path("/rec/k.mpg", kind="manual_process")
+        assert found.id == "m1"
+
+
+class TestGetExecutionsByStatus:
+    def test_oldest_first_excluding_kind(self, service):
+        for i, kind in enumerate(("normal", None, "manual_process", "normal")):
+            ts = datetime(2026, 1, 15, 12, i, 0, tzinfo=timezone.utc)
+            service.create_execution(
+                job_id=f"d-{i}",
+                title="Show",
+                status="discovered",
+                kind=kind,
+                started_at=ts,
+            )
+        service.create_execution(job_id="r-1", title="Show", status="running")
+
+        found = service.get_executions_by_status(
+            ["discovered"], exclude_kind="manual_process"
+        )
+        assert [e.id for e in found] == ["d-0", "d-1", "d-3"]
+        assert service.get_executions_by_status(["discovered"], limit=1)[0].id == "d-0"
+        assert service.count_by_status(["discovered", "running"]) == 5
+        assert service.count_by_status(["discovered"], "manual_process") == 3
+
+    def test_error_prefix(self, service):
+        for job_id, error in (
+            ("i-1", "Execution interrupted by restart"),
+            ("e-1", "x"),
+        ):
+            service.create_execution(job_id=job_id, title="Show")
+            service.complete_execution(job_id, False, 0.0, error_message=error)
+
+        found = service.get_executions_by_status(
+            ["completed"], error_prefix="Execution interrupted"
+        )
+        assert [e.id for e in found] == ["i-1"]
+
+
 class TestUpdateStatus:
     def test_update_to_running_resets_started_at(self, service):
         ts = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
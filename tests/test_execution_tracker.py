@@ -84,6 +84,22 @@ class TestGetExecutions:
         executions = tracker.get_executions(limit=3)
         assert len(executions) == 3
 
+    def test_filter_by_status_and_kind(self, tracker):
+        tracker.start_execution(
+            job_id="m-run", title="A", path="/p", kind="manual_process"
+        )
+        tracker.start_execution(job_id="n-run", title="B", path="/p")
+        tracker.start_execution(
+            job_id="m-pend",
+            title="C",
+            path="/p",
+            status="pending",
+            kind="manual_process",
+        )
+
+        found = tracker.get_executions(status="running", kind="manual_process")
+        assert [e["id"] for e in found] == ["m-run"]
+
     def test_get_single_execution(self, tracker):
         tracker.start_execution(job_id="single", title="My Show", path="/p")
         ex = tracker.get_execution("single")
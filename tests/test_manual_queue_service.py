@@ -37,6 +37,45 @@ class TestAddToQueue:
         assert len(service.get_queue()) == 1
 
 
+class TestBulkAddToQueue:
+    def test_adds_all(self, service):
+        count = service.bulk_add_to_queue(
+            [
+                {"path": "/rec/a.mpg"},
+                {"path": "/rec/b.mpg", "skip_caption_generation": True},
+                {"path": "/rec/c.mpg", "log_verbosity": "DEBUG"},
+            ]
+        )
+        assert count == 3
+        assert service.get_queue_paths() == ["/rec/a.mpg", "/rec/b.mpg", "/rec/c.mpg"]
+        b = service.get_queue_item("/rec/b.mpg")
+        assert b.generate_srt is False
+        assert b.skip_caption_generation is True
+        assert service.get_queue_item("/rec/c.mpg").log_verbosity == "DEBUG"
+
+    def test_updates_existing(self, service):
+        service.add_to_queue("/rec/a.mpg", log_verbosity="NORMAL")
+        service.bulk_add_to_queue([{"path": "/rec/a.mpg", "log_verbosity": "DEBUG"}])
+        queue = service.get_queue()
+        assert len(queue) == 1
+        service.db.refresh(queue[0])
+        assert queue[0].log_verbosity == "DEBUG"
+
+    def test_empty(self, service):
+        assert service.bulk_add_to_queue([]) == 0
+
+
+class TestRemoveManyFromQueue:
+    def test_removes_listed_paths(self, service):
+        for p in ("/rec/a.mpg", "/rec/b.mpg", "/rec/c.mpg"):
+            service.add_to_queue(p)
+        assert service.remove_many_from_queue(["/rec/a.mpg", "/rec/c.mpg", "/x"]) == 2
+        assert service.get_queue_paths() == ["/rec/b.mpg"]
+
+    def test_empty(self, service):
+        assert service.remove_many_from_queue([]) == 0
+
+
 class TestGetQueue:
     def test_empty(self, service):
         assert service.get_queue() == []
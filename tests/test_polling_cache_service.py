@@ -78,3 +78,68 @@ class TestClearAll:
         removed = service.clear_all()
         assert removed == 2
         assert service.get_all() == {}
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.Redis calls we use."""
+
+    def __init__(self):
+        self.store = {}
+
+    def set(self, key, value, ex=None):
+        self.store[key] = (value, ex)
+
+    def exists(self, key):
+        return int(key in self.store)
+
+    def scan_iter(self, match=None):
+        prefix = match.rstrip("*") if match else ""
+        return [k for k in self.store if k.startswith(prefix)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def redis_service():
+    db = next(get_db())
+    yield PollingCacheService(db, redis_client=FakeRedis())
+    db.close()
+
+
+class TestRedisHotCache:
+    def test_add_writes_through_with_ttl(self, redis_service):
+        redis_service.add_yielded("rec-1")
+        value, ttl = redis_service.redis.store["polling_cache:rec-1"]
+        assert 0 < ttl <= 24 * 3600
+
+    def test_hit_skips_database(self, redis_service):
+        redis_service.redis.set("polling_cache:only-in-redis", 1)
+        assert redis_service.has_yielded("only-in-redis") is True
+
+    def test_db_hit_backfills_redis(self, service):
+        service.add_yielded("rec-2")
+        service.redis = FakeRedis()
+        assert service.has_yielded("rec-2") is True
+        assert "polling_cache:rec-2" in service.redis.store
+
+    def test_expired_entry_not_cached(self, redis_service):
+        old_time = datetime.now(timezone.utc) - timedelta(hours=48)
+        redis_service.add_yielded("old-rec", yielded_at=old_time)
+        assert "polling_cache:old-rec" not in redis_service.redis.store
+
+    def test_clear_all_drops_redis_keys(self, redis_service):
+        redis_service.add_yielded("x")
+        redis_service.clear_all()
+        assert redis_service.redis.store == {}
+        assert redis_service.has_yielded("x") is False
+
+    def test_redis_errors_fall_back_to_db(self, redis_service):
+        def boom(*args, **kwargs):
+            raise ConnectionError("down")
+
+        redis_service.redis.set = boom
+        redis_service.redis.exists = boom
+        assert redis_service.add_yielded("rec-3") is True
+        assert redis_service.has_yielded("rec-3") is True
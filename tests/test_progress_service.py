@@ -1,6 +1,7 @@
 """Tests for ProgressService — update, get, clear, to_dict."""
 
 import pytest
+from sqlalchemy import text
 
 from py_captions_for_channels.database import get_db
 from py_captions_for_channels.services.progress_service import ProgressService
@@ -67,6 +68,9 @@ class TestClearAllProgress:
         assert removed == 2
         assert service.get_all_progress() == []
 
+    def test_empty_table_returns_zero(self, service):
+        assert service.clear_all_progress() == 0
+
 
 class TestToDict:
     def test_structure(self, service):
@@ -79,6 +83,23 @@ class TestToDict:
         assert d["details"] == {"speed": "1.0x"}
         assert "updated_at" in d
 
+    def test_no_details_is_empty_dict(self, service):
+        service.update_progress("job-2", "ffmpeg", 5.0)
+        prog = service.get_progress("job-2")
+        assert prog.progress_metadata is None
+        assert service.to_dict(prog)["details"] == {}
+
+    def test_reads_legacy_text_metadata(self, service):
+        service.update_progress("job-3", "whisper", 1.0)
+        service.db.execute(
+            text("UPDATE progress SET progress_metadata = :m WHERE job_id = 'job-3'"),
+            {"m": '{"eta": 12}'},
+        )
+        service.db.commit()
+        service.db.expire_all()
+        prog = service.get_progress("job-3")
+        assert service.to_dict(prog)["details"] == {"eta": 12}
+
 
 class TestGetAllProgressDict:
     def test_returns_dict(self, service):
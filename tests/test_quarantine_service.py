@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
+from sqlalchemy import text
 
 from py_captions_for_channels.database import get_db
 from py_captions_for_channels.services.quarantine_service import QuarantineService
@@ -41,6 +42,18 @@ class TestQuarantineFile:
         assert not src.exists()  # Moved away
         assert Path(item.quarantine_path).exists()
 
+    def test_quarantine_uses_shard_subdirectory(
+        self, service, tmp_path, quarantine_dir
+    ):
+        src = tmp_path / "sharded.srt"
+        src.write_text("data")
+
+        item = service.quarantine_file(str(src), "srt")
+        shard = Path(item.quarantine_path).parent
+        assert shard.parent == quarantine_dir
+        assert len(shard.name) == 2
+        int(shard.name, 16)
+
     def test_quarantine_nonexistent_returns_none(self, service):
         result = service.quarantine_file(
             original_path="/nonexistent/file.orig",
@@ -60,6 +73,23 @@ class TestQuarantineFile:
         item2 = service.quarantine_file(str(src), "orig")
         # Should skip because original_path already quarantined
         assert item2 is None
+        # The second file is left in place and only one record is active
+        assert src.read_text() == "data2"
+        assert len(service.get_quarantined_files()) == 1
+
+    def test_duplicate_with_deferred_commit_keeps_batch(self, service, tmp_path):
+        first = tmp_path / "first.orig"
+        first.write_text("data")
+        dup = tmp_path / "dup.orig"
+        dup.write_text("data")
+        service.quarantine_file(str(dup), "orig")
+
+        dup.write_text("again")
+        assert service.quarantine_file(str(first), "orig", defer_commit=True)
+        assert service.quarantine_file(str(dup), "orig", defer_commit=True) is None
+        service.db.commit()
+
+        assert len(service.get_quarantined_files()) == 2
 
     def test_quarantine_records_file_size(self, service, tmp_path):
         src = tmp_path / "sized.orig"
@@ -97,6 +127,41 @@ class TestRestoreFile:
     def test_restore_nonexistent_id(self, service):
         assert service.restore_file(99999) is False
 
+    def test_restore_files_bulk(self, service, tmp_path):
+        sources = []
+        ids = []
+        for name in ["r1.orig", "r2.orig"]:
+            src = tmp_path / name
+            src.write_text(name)
+            sources.append(src)
+            ids.append(service.quarantine_file(str(src), "orig").id)
+
+        results = service.restore_files(ids + [99999, ids[0]])
+        assert len(results) == 3  # The repeated ID counts once
+        assert results[ids[0]] is None
+        assert results[ids[1]] is None
+        assert results[99999] == "Failed to restore item 99999"
+        assert all(src.exists() for src in sources)
+        assert service.get_quarantined_files() == []
+
+    def test_restore_files_undone_when_commit_fails(self, service, tmp_path):
+        src = tmp_path / "r.orig"
+        src.write_text("data")
+        item = service.quarantine_file(str(src), "orig")
+        quarantine_path = Path(item.quarantine_path)
+
+        real_commit = service.db.commit
+        service.db.commit = lambda: (_ for _ in ()).throw(RuntimeError("locked"))
+        try:
+            results = service.restore_files([item.id])
+        finally:
+            service.db.commit = real_commit
+
+        assert "not recorded" in results[item.id]
+        assert not src.exists()
+        assert quarantine_path.exists()
+        assert [i.id for i in service.get_quarantined_files()] == [item.id]
+
 
 class TestDeleteFile:
     def test_delete_removes_file(self, service, tmp_path):
@@ -126,6 +191,27 @@ class TestGetQuarantinedFiles:
         assert len(items) == 3
 
 
+class TestGetQuarantinedRows:
+    def test_rows_match_orm_listing(self, service, tmp_path):
+        for name in ["b.orig", "a.orig", "c.srt"]:
+            f = tmp_path / name
+            f.write_bytes(b"x" * 3)
+            service.quarantine_file(str(f), "srt" if name.endswith(".srt") else "orig")
+
+        rows = list(service.get_quarantined_rows())
+        orm = service.get_quarantined_files()
+        assert [r.id for r in rows] == [i.id for i in orm]
+        assert rows[0].original_path.endswith("a.orig")
+        assert rows[0].file_size_bytes == 3
+        assert rows[0].expires_at is not None
+
+    def test_excludes_expired(self, service, tmp_path):
+        src = tmp_path / "old.orig"
+        src.write_text("data")
+        service.quarantine_file(str(src), "orig", expiration_days=-1)
+        assert list(service.get_quarantined_rows(include_expired=False)) == []
+
+
 class TestGetExpiredFiles:
     def test_expired_detection(self, service, tmp_path):
         src = tmp_path / "expired.orig"
@@ -141,6 +227,100 @@ class TestGetExpiredFiles:
         assert isinstance(expired, list)
 
 
+class TestDeleteExpiredFiles:
+    def test_deletes_only_expired(self, service, tmp_path):
+        old = tmp_path / "old.orig"
+        old.write_text("data")
+        fresh = tmp_path / "fresh.orig"
+        fresh.write_text("data")
+
+        expired_item = service.quarantine_file(str(old), "orig", expiration_days=-1)
+        fresh_item = service.quarantine_file(str(fresh), "orig")
+        expired_path = Path(expired_item.quarantine_path)
+
+        assert service.delete_expired_files() == 1
+        assert not expired_path.exists()
+        assert Path(fresh_item.quarantine_path).exists()
+        assert [i.id for i in service.get_quarantined_files()] == [fresh_item.id]
+
+    def test_failed_unlink_stays_quarantined(self, service, tmp_path, monkeypatch):
+        from py_captions_for_channels.services import quarantine_service
+
+        for name in ("keep.orig", "gone.orig"):
+            f = tmp_path / name
+            f.write_text("data")
+            service.quarantine_file(str(f), "orig", expiration_days=-1)
+
+        real_remove = quarantine_service.os.remove
+
+        def fake_remove(path):
+            if path.endswith("keep.orig"):
+                raise PermissionError("denied")
+            real_remove(path)
+
+        monkeypatch.setattr(quarantine_service.os, "remove", fake_remove)
+
+        assert service.delete_expired_files() == 1
+        remaining = service.get_quarantined_files()
+        assert [i.original_path for i in remaining] == [str(tmp_path / "keep.orig")]
+        assert Path(remaining[0].quarantine_path).exists()
+
+    def test_nothing_expired(self, service):
+        assert service.delete_expired_files() == 0
+
+
+class TestDeleteFilesBatch:
+    def _quarantine(self, service, tmp_path, count):
+        items = []
+        for i in range(count):
+            f = tmp_path / f"batch_{i}.orig"
+            f.write_text("data")
+            items.append(service.quarantine_file(str(f), "orig"))
+        return items
+
+    def test_deletes_all(self, service, tmp_path):
+        items = self._quarantine(service, tmp_path, 5)
+        paths = [Path(i.quarantine_path) for i in items]
+
+        progress = list(
+            service.delete_files_batch([i.id for i in items] + [99999], batch_size=2)
+        )
+        current, total, deleted, failed, cancelled = progress[-1]
+        assert (total, deleted, failed, cancelled) == (6, 5, 1, False)
+        assert not any(p.exists() for p in paths)
+        assert service.get_quarantined_files() == []
+
+    def test_duplicate_ids_counted_once(self, service, tmp_path):
+        items = self._quarantine(service, tmp_path, 3)
+        ids = [i.id for i in items]
+
+        progress = list(service.delete_files_batch(ids + ids[:2], batch_size=1))
+        current, total, deleted, failed, cancelled = progress[-1]
+        assert (total, deleted, failed) == (3, 3, 0)
+
+    def test_large_id_list_is_chunked(self, service, tmp_path):
+        items = self._quarantine(service, tmp_path, 3)
+        # Far more ids than SQLite allows in a single IN (...) clause
+        ids = list(range(100000, 102000)) + [i.id for i in items]
+
+        progress = list(service.delete_files_batch(ids, batch_size=500))
+        assert progress[-1][2] == 3
+        assert progress[-1][3] == 2000
+
+    def test_cancel_keeps_remaining(self, service, tmp_path):
+        items = self._quarantine(service, tmp_path, 4)
+        calls = iter([False, False, True])
+
+        progress = list(
+            service.delete_files_batch(
+                [i.id for i in items], batch_size=1, cancel_check=lambda: next(calls)
+            )
+        )
+        assert progress[-1][2] == 2
+        assert progress[-1][4] is True
+        assert len(service.get_quarantined_files()) == 2
+
+
 class TestQuarantineStats:
     def test_stats_structure(self, service, tmp_path):
         src = tmp_path / "stat.orig"
@@ -152,8 +332,28 @@ class TestQuarantineStats:
         assert stats["total_size_bytes"] == 2048
         assert stats["total_size_mb"] == pytest.approx(2048 / (1024 * 1024), abs=0.01)
 
+    def test_stats_empty_and_expired(self, service, tmp_path):
+        stats = service.get_quarantine_stats()
+        assert stats["total_quarantined"] == 0
+        assert stats["total_size_bytes"] == 0
+
+        src = tmp_path / "old.orig"
+        src.write_bytes(b"x" * 10)
+        service.quarantine_file(str(src), "orig", expiration_days=-1)
+        stats = service.get_quarantine_stats()
+        assert stats["total_expired"] == 1
+        assert stats["total_size_bytes"] == 10
+
 
 class TestDeduplicate:
+    @pytest.fixture(autouse=True)
+    def legacy_schema(self):
+        """Duplicates can only exist in databases predating the unique index."""
+        db = next(get_db())
+        db.execute(text("DROP INDEX uq_quarantine_active_original"))
+        db.commit()
+        db.close()
+
     def test_deduplicate_removes_older(self, service, tmp_path):
         # Manually create two quarantine records for the same original path
         db = next(get_db())
@@ -176,6 +376,39 @@ class TestDeduplicate:
         result = service.deduplicate()
         assert result["duplicates_removed"] >= 1
 
+    def test_deduplicate_keeps_newest_per_path(self, service, tmp_path):
+        db = next(get_db())
+        from py_captions_for_channels.models import QuarantineItem
+
+        base = datetime.now(timezone.utc)
+        for path in ("/rec/a.orig", "/rec/b.orig"):
+            for i in range(3):
+                f = tmp_path / f"{Path(path).stem}_{i}.orig"
+                f.write_text("data")
+                db.add(
+                    QuarantineItem(
+                        original_path=path,
+                        quarantine_path=str(f),
+                        file_type="orig",
+                        reason="test",
+                        status="quarantined",
+                        created_at=base + timedelta(seconds=i),
+                        expires_at=base + timedelta(days=30),
+                    )
+                )
+        db.commit()
+
+        result = service.deduplicate()
+        assert result["duplicates_removed"] == 4
+        assert result["duplicate_paths"] == 2
+
+        survivors = service.get_quarantined_files()
+        assert sorted(Path(i.quarantine_path).name for i in survivors) == [
+            "a_2.orig",
+            "b_2.orig",
+        ]
+        assert not (tmp_path / "a_0.orig").exists()
+
 
 class TestIsAlreadyQuarantined:
     def test_not_quarantined(self, service):
@@ -187,3 +420,36 @@ class TestIsAlreadyQuarantined:
         service.quarantine_file(str(src), "orig")
 
         assert service.is_already_quarantined(str(src)) is True
+
+
+class TestMoveFile:
+    def test_cross_device_copies_and_unlinks(self, tmp_path, monkeypatch):
+        import errno
+
+        from py_captions_for_channels.services import quarantine_service
+
+        src = tmp_path / "src.orig"
+        src.write_bytes(b"abc" * 1000)
+        dst = tmp_path / "dst.orig"
+
+        def fake_rename(a, b):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(quarantine_service.os, "rename", fake_rename)
+        quarantine_service._move_file(str(src), str(dst))
+
+        assert not src.exists()
+        assert dst.read_bytes() == b"abc" * 1000
+
+
+class TestQuarantineNames:
+    def test_same_name_gets_distinct_paths(self, service, tmp_path):
+        paths = set()
+        for i in range(5):
+            d = tmp_path / f"dir{i}"
+            d.mkdir()
+            src = d / "show.srt"
+            src.write_text("data")
+            paths.add(service.quarantine_file(str(src), "srt").quarantine_path)
+        assert len(paths) == 5
+        assert all(p.endswith("_show.srt") for p in paths)
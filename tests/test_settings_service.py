@@ -42,6 +42,15 @@ class TestGetSet:
         service.set("items", data)
         assert service.get("items") == data
 
+    def test_int_subclass_stored_as_int(self, service):
+        import enum
+
+        class Level(enum.IntEnum):
+            HIGH = 3
+
+        service.set("level", Level.HIGH)
+        assert service.get("level") == 3
+
     def test_default_when_missing(self, service):
         assert service.get("missing") is None
         assert service.get("missing", "fallback") == "fallback"
@@ -70,6 +79,15 @@ class TestSetMany:
         assert service.get("y") is True
         assert service.get("z") == "hello"
 
+    def test_batch_updates_existing_and_type(self, service):
+        service.set("x", 1)
+        service.set_many({"x": [1, 2], "w": 2.5})
+        assert service.get_all() == {"x": [1, 2], "w": 2.5}
+
+    def test_empty_is_noop(self, service):
+        service.set_many({})
+        assert service.get_all() == {}
+
 
 class TestDelete:
     def test_delete_existing(self, service):
@@ -87,3 +105,24 @@ class TestInitializeDefaults:
         service.initialize_defaults({"existing": "overwrite", "new_key": 42})
         assert service.get("existing") == "original"  # NOT overwritten
         assert service.get("new_key") == 42
+
+
+class TestReadCache:
+    def test_reads_hit_cache_after_first_load(self, service):
+        service.set("a", 1)
+        service.get("a")
+        # Changes made behind the service's back are not re-queried
+        SettingsService(service.db).set("a", 2)
+        assert service.get("a") == 1
+
+    def test_writes_update_cache(self, service):
+        assert service.get("k") is None
+        service.set("k", "v")
+        assert service.get("k") == "v"
+        service.delete("k")
+        assert service.get("k") is None
+
+    def test_json_values_are_fresh_copies(self, service):
+        service.set("items", [1, 2])
+        service.get("items").append(3)
+        assert service.get("items") == [1, 2]
@@ -116,3 +116,283 @@ def test_reprocess_queue_persistence(tmp_path):
     queue = sb2.get_manual_process_queue()
     assert len(queue) == 3
     assert set(queue) == set(paths)
+
+
+def test_service_session_closed_after_each_call(tmp_path, monkeypatch):
+    from py_captions_for_channels import state as state_module
+    from py_captions_for_channels.database import get_db
+
+    opened, closed = [], []
+
+    def tracking_get_db():
+        for db in get_db():
+            opened.append(db)
+            close = db.close
+            db.close = lambda: (closed.append(db), close())
+            yield db
+
+    monkeypatch.setattr(state_module, "get_db", tracking_get_db)
+    sb = StateBackend(str(tmp_path / "state.json"))
+    path = "/tank/AllMedia/Channels/a.mpg"
+
+    sb.mark_for_manual_process(path)
+    assert sb.get_manual_process_queue() == [path]
+    sb.clear_manual_process_requests([path])
+
+    # No session outlives the call that opened it
+    assert len(opened) == 3
+    assert closed == opened
+
+
+def test_sees_writes_from_other_sessions(tmp_path, monkeypatch):
+    from py_captions_for_channels import state as state_module
+    from py_captions_for_channels.database import get_db
+    from py_captions_for_channels.services.manual_queue_service import (
+        ManualQueueService,
+    )
+
+    clock = [1000.0]
+    monkeypatch.setattr(state_module.time, "monotonic", lambda: clock[0])
+
+    p = tmp_path / "state.json"
+    sb = StateBackend(str(p))
+    path = "/tank/AllMedia/Channels/a.mpg"
+    sb.mark_for_manual_process(path, generate_srt=True)
+    assert sb.get_manual_process_settings(path)["generate_srt"] is True
+
+    # Another writer (e.g. the web app) changes the item's settings
+    db = next(get_db())
+    ManualQueueService(db).add_to_queue(path, generate_srt=False)
+    db.close()
+
+    # Listing the queue (as the watcher does each cycle) resyncs the mirror
+    clock[0] += StateBackend.QUEUE_LIST_TTL
+    sb.get_manual_process_queue()
+    assert sb.get_manual_process_settings(path)["generate_srt"] is False
+
+
+def test_migrates_json_manual_queue(tmp_path):
+    p = tmp_path / "state.json"
+    p.write_text(
+        json.dumps(
+            {
+                "last_timestamp": None,
+                "manual_process_paths": {
+                    "/tank/a.mpg": {"skip_caption_generation": True},
+                    "/tank/b.mpg": {"log_verbosity": "DEBUG"},
+                },
+            }
+        )
+    )
+    sb = StateBackend(str(p))
+
+    assert sb.get_manual_process_queue() == ["/tank/a.mpg", "/tank/b.mpg"]
+    assert sb.get_manual_process_settings("/tank/a.mpg")["generate_srt"] is False
+    assert sb.get_manual_process_settings("/tank/b.mpg")["log_verbosity"] == "DEBUG"
+    assert (tmp_path / ".manual_queue_migrated").exists()
+    backup = tmp_path / "state.json.manual_queue_migrated"
+    assert backup.read_bytes() == p.read_bytes()
+
+
+def test_queue_mirror_ttl(tmp_path, monkeypatch):
+    from py_captions_for_channels import state as state_module
+    from py_captions_for_channels.database import get_db
+    from py_captions_for_channels.services.manual_queue_service import (
+        ManualQueueService,
+    )
+
+    clock = [1000.0]
+    monkeypatch.setattr(state_module.time, "monotonic", lambda: clock[0])
+
+    sb = StateBackend(str(tmp_path / "state.json"))
+    assert not sb.has_manual_process_request("/tank/a.mpg")
+
+    db = next(get_db())
+    ManualQueueService(db).add_to_queue("/tank/a.mpg")
+    db.close()
+
+    # Other writers are not visible until the mirror expires
+    assert not sb.has_manual_process_request("/tank/a.mpg")
+    clock[0] += StateBackend.QUEUE_CACHE_TTL + 1
+    assert sb.has_manual_process_request("/tank/a.mpg")
+
+    # Writes through the backend are visible immediately
+    sb.clear_manual_process_request("/tank/a.mpg")
+    assert not sb.has_manual_process_request("/tank/a.mpg")
+    sb.mark_for_manual_process("/tank/b.mpg", run_transcode=False)
+    assert sb.get_manual_process_settings("/tank/b.mpg")["run_transcode"] is False
+
+
+def test_load_skips_parse_when_file_unchanged(tmp_path, monkeypatch):
+    from py_captions_for_channels import state as state_module
+
+    p = tmp_path / "state.json"
+    ts = datetime(2026, 1, 1, 12, 0, 0)
+    p.write_text(json.dumps({"last_timestamp": ts.isoformat()}))
+    assert StateBackend(str(p)).last_ts == ts
+
+    sb = StateBackend(str(p))
+    calls = []
+    real_load = state_module.json.load
+    monkeypatch.setattr(
+        state_module.json, "load", lambda f: calls.append(1) or real_load(f)
+    )
+
+    sb._load()
+    assert sb.last_ts == ts
+    assert calls == []
+
+    # Any rewrite of the file invalidates the cached parse
+    newer = ts + timedelta(hours=1)
+    p.write_text(json.dumps({"last_timestamp": newer.isoformat(), "v": 2}))
+    sb._load()
+    assert sb.last_ts == newer
+    assert calls == [1]
+
+
+def test_update_skips_unchanged_timestamp(tmp_path, monkeypatch):
+    sb = StateBackend(str(tmp_path / "state.json"))
+    writes = []
+    real_persist = sb._persist_state
+    monkeypatch.setattr(
+        sb, "_persist_state", lambda ts: writes.append(ts) or real_persist(ts)
+    )
+
+    ts = datetime(2026, 1, 1, 12, 0, 0)
+    sb.update(ts)
+    sb.update(ts)
+    assert writes == [ts]
+
+    # A backend that loaded the same timestamp from disk does not rewrite it
+    sb2 = StateBackend(str(tmp_path / "state.json"))
+    monkeypatch.setattr(sb2, "_persist_state", lambda ts: writes.append(ts))
+    sb2.update(ts)
+    assert writes == [ts]
+
+
+def test_batched_updates_write_once(tmp_path, monkeypatch):
+    p = tmp_path / "state.json"
+    sb = StateBackend(str(p))
+    writes = []
+    real_persist = sb._persist_state
+    monkeypatch.setattr(
+        sb, "_persist_state", lambda ts: writes.append(ts) or real_persist(ts)
+    )
+
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    with sb.batched_updates():
+        for i in range(5):
+            sb.update(base + timedelta(minutes=i))
+        assert writes == []
+        assert sb.last_ts == base + timedelta(minutes=4)
+
+    assert writes == [base + timedelta(minutes=4)]
+    with open(p, "r") as f:
+        assert json.load(f)["last_timestamp"] == writes[0].isoformat()
+
+
+def test_get_returns_shared_instance(tmp_path, monkeypatch):
+    monkeypatch.setattr(StateBackend, "_instances", {})
+    p = tmp_path / "state.json"
+
+    sb = StateBackend.get(str(p))
+    assert StateBackend.get(str(tmp_path / "." / "state.json")) is sb
+    assert StateBackend.get(str(tmp_path / "other.json")) is not sb
+
+
+def test_migration_marker_checked_once(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    monkeypatch.setattr(StateBackend, "_migrated_paths", set())
+    (tmp_path / ".manual_queue_migrated").touch()
+    p = str(tmp_path / "state.json")
+    StateBackend(p)
+    assert p in StateBackend._migrated_paths
+
+    checks = []
+    real_exists = Path.exists
+    monkeypatch.setattr(
+        Path, "exists", lambda self: checks.append(self) or real_exists(self)
+    )
+    StateBackend(p)
+    assert checks == []
+
+
+def test_creates_state_directory(tmp_path):
+    p = tmp_path / "nested" / "dir" / "state.json"
+    sb = StateBackend(str(p))
+    assert p.parent.is_dir()
+    sb.update(datetime.now())
+    assert p.exists()
+
+
+def test_should_process_mixed_timezones(tmp_path):
+    from datetime import timezone
+
+    sb = StateBackend(str(tmp_path / "state.json"))
+    naive = datetime(2026, 1, 1, 12, 0, 0)
+    sb.update(naive)
+    assert sb.last_ts == naive  # Stored value is left as given
+
+    aware = naive.replace(tzinfo=timezone.utc)
+    assert not sb.should_process(aware)
+    assert sb.should_process(aware + timedelta(seconds=1))
+
+    sb.update(aware)
+    assert not sb.should_process(naive)
+    assert sb.should_process(naive + timedelta(seconds=1))
+
+
+def test_queue_listing_ttl(tmp_path, monkeypatch):
+    from py_captions_for_channels import state as state_module
+
+    clock = [1000.0]
+    monkeypatch.setattr(state_module.time, "monotonic", lambda: clock[0])
+    sb = StateBackend(str(tmp_path / "state.json"))
+    assert sb.get_manual_process_queue() == []
+
+    loads = []
+    real_refresh = sb._refresh_queue_cache
+    monkeypatch.setattr(
+        sb, "_refresh_queue_cache", lambda: loads.append(1) or real_refresh()
+    )
+
+    # Repeated polls within the TTL are served from memory
+    sb.get_manual_process_queue()
+    sb.get_manual_process_queue()
+    assert loads == []
+
+    # Local writes are reflected without waiting for the TTL
+    sb.mark_for_manual_process("/tank/a.mpg")
+    assert sb.get_manual_process_queue() == ["/tank/a.mpg"]
+    sb.clear_manual_process_request("/tank/a.mpg")
+    assert sb.get_manual_process_queue() == []
+    assert loads == []
+
+    clock[0] += StateBackend.QUEUE_LIST_TTL
+    sb.get_manual_process_queue()
+    assert loads == [1]
+
+
+async def test_manual_process_event_set_from_other_thread(tmp_path):
+    import asyncio
+    import threading
+
+    sb = StateBackend(str(tmp_path / "state.json"))
+    event = sb.manual_process_event()
+    assert not event.is_set()
+
+    t = threading.Thread(target=sb.mark_for_manual_process, args=("/tmp/a.mpg",))
+    t.start()
+    t.join()
+    await asyncio.wait_for(event.wait(), timeout=2)
+    assert sb.has_manual_process_request("/tmp/a.mpg")
+
+
+def test_clear_many_manual_requests(tmp_path):
+    sb = StateBackend(str(tmp_path / "state.json"))
+    for p in ("/tmp/a.mpg", "/tmp/b.mpg", "/tmp/c.mpg"):
+        sb.mark_for_manual_process(p)
+    sb.clear_manual_process_requests(["/tmp/a.mpg", "/tmp/b.mpg"])
+    assert not sb.has_manual_process_request("/tmp/a.mpg")
+    assert sb.get_manual_process_queue() == ["/tmp/c.mpg"]
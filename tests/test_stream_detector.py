@@ -79,6 +79,14 @@ class TestStreamRepr:
         r = repr(undetermined_audio)
         assert "und" in r
 
+    def test_streams_are_immutable(self, english_audio):
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            english_audio.language = "spa"
+        assert not hasattr(english_audio, "__dict__")
+        assert {english_audio: 1}[english_audio] == 1
+
     def test_subtitle_stream_repr(self, english_subtitle):
         r = repr(english_subtitle)
         assert "mov_text" in r
@@ -109,6 +117,18 @@ class TestSelectAudioStream:
         assert stream.index == 1  # First in list
         assert "not found" in reason.lower()
 
+    def test_exact_match_preferred_over_earlier_partial(self):
+        partial = AudioStream(1, "aac", 2, "en-US", None, None)
+        exact = AudioStream(2, "ac3", 6, "ENG", None, None)
+        stream, reason = select_audio_stream([partial, exact], "eng")
+        assert stream is exact
+        assert "Matched" in reason
+
+    def test_first_of_equal_matches_wins(self, english_audio):
+        second = AudioStream(5, "aac", 2, "eng", None, None)
+        stream, _ = select_audio_stream([english_audio, second], "eng")
+        assert stream is english_audio
+
     def test_fallback_skip(self, spanish_audio):
         stream, reason = select_audio_stream([spanish_audio], "fra", fallback="skip")
         assert stream is None
@@ -188,3 +208,93 @@ class TestStreamSelectionRepr:
         )
         r = repr(sel)
         assert "no subtitles" in r
+
+
+# ---------------------------------------------------------------------------
+# probe_streams caching
+# ---------------------------------------------------------------------------
+
+FFPROBE_OUTPUT = """{"streams": [
+    {"index": 0, "codec_type": "video", "codec_name": "mpeg2video"},
+    {"index": 1, "codec_type": "audio", "codec_name": "ac3", "channels": 6,
+     "tags": {"language": "eng"}},
+    {"index": 2, "codec_type": "subtitle", "codec_name": "mov_text",
+     "tags": {"language": "spa", "title": "Spanish"}}
+]}"""
+
+
+class TestProbeStreams:
+    @pytest.fixture
+    def fake_ffprobe(self, monkeypatch):
+        import subprocess
+
+        from py_captions_for_channels import stream_detector
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, FFPROBE_OUTPUT, "")
+
+        stream_detector._probe_cached.cache_clear()
+        monkeypatch.setattr(stream_detector.subprocess, "run", fake_run)
+        yield calls
+        stream_detector._probe_cached.cache_clear()
+
+    def test_parses_streams(self, fake_ffprobe, tmp_path):
+        from py_captions_for_channels.stream_detector import probe_streams
+
+        video = tmp_path / "show.mpg"
+        video.write_bytes(b"data")
+        streams = probe_streams(str(video))
+        assert [s.index for s in streams["audio_streams"]] == [1]
+        assert streams["audio_streams"][0].language == "eng"
+        assert streams["subtitle_streams"][0].title == "Spanish"
+
+    def test_unchanged_file_probed_once(self, fake_ffprobe, tmp_path):
+        import os
+
+        from py_captions_for_channels.stream_detector import probe_streams
+
+        video = tmp_path / "show.mpg"
+        video.write_bytes(b"data")
+        first = probe_streams(str(video))
+        second = probe_streams(str(video))
+        assert len(fake_ffprobe) == 1
+        assert first == second
+
+        # Modifying the file invalidates the cached probe
+        video.write_bytes(b"more data")
+        os.utime(video, ns=(0, 12345))
+        probe_streams(str(video))
+        assert len(fake_ffprobe) == 2
+
+
+# ---------------------------------------------------------------------------
+# extract_audio_for_transcription
+# ---------------------------------------------------------------------------
+
+
+class TestExtractAudio:
+    def test_command(self, monkeypatch):
+        import logging
+        import subprocess
+
+        from py_captions_for_channels import stream_detector
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(stream_detector.subprocess, "run", fake_run)
+        ok = stream_detector.extract_audio_for_transcription(
+            "/rec/show.mpg", 1, "/tmp/out.wav", logging.getLogger(__name__)
+        )
+        assert ok is True
+        cmd = calls[0]
+        assert cmd[cmd.index("-map") + 1] == "0:a:1"
+        assert cmd[cmd.index("-map_metadata") + 1] == "-1"
+        assert "-threads" not in cmd
+        assert cmd[-1] == "/tmp/out.wav"
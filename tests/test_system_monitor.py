@@ -41,6 +41,21 @@ class TestMetricPoint:
         assert mp.gpu_util_percent == 80.0
         assert mp.gpu_mem_total_mb == 11264.0
 
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+
+        mp = MetricPoint(
+            timestamp=1.0,
+            cpu_percent=50.0,
+            disk_read_mbps=1.0,
+            disk_write_mbps=2.0,
+            net_recv_mbps=3.0,
+            net_sent_mbps=4.0,
+            gpu_enc_percent=5.0,
+        )
+        assert mp.to_dict() == asdict(mp)
+        assert not hasattr(mp, "__dict__")
+
 
 class TestPipelineStage:
     def test_duration_when_ended(self):
@@ -82,6 +97,80 @@ class TestPipelineStage:
         assert stage.elapsed == 30.0
 
 
+class TestProcCounters:
+    def test_disk_sums_whole_disks(self, tmp_path, monkeypatch):
+        from py_captions_for_channels import system_monitor
+
+        stats = tmp_path / "diskstats"
+        stats.write_text(
+            "   8 0 sda 10 0 100 0 20 0 200 0 0 0 0\n"
+            "   8 1 sda1 5 0 50 0 10 0 100 0 0 0 0\n"
+            "   8 16 sdb 1 0 4 0 2 0 8 0 0 0 0\n"
+        )
+        monkeypatch.setattr(system_monitor, "_PROC_DISKSTATS", str(stats))
+        monkeypatch.setattr(system_monitor, "_block_devices", {"sda", "sdb"})
+        disk = system_monitor.read_disk_io()
+        assert disk.read_bytes == 104 * 512
+        assert disk.write_bytes == 208 * 512
+
+    def test_net_sums_interfaces(self, tmp_path, monkeypatch):
+        from py_captions_for_channels import system_monitor
+
+        dev = tmp_path / "dev"
+        dev.write_text(
+            "Inter-|   Receive |  Transmit\n"
+            " face |bytes packets|bytes packets\n"
+            "    lo: 100 1 0 0 0 0 0 0 300 1 0 0 0 0 0 0\n"
+            "  eth0:1000 9 0 0 0 0 0 0 2000 9 0 0 0 0 0 0\n"
+        )
+        monkeypatch.setattr(system_monitor, "_PROC_NET_DEV", str(dev))
+        net = system_monitor.read_net_io()
+        assert net.bytes_recv == 1100
+        assert net.bytes_sent == 2300
+
+    def test_falls_back_to_psutil(self, tmp_path, monkeypatch):
+        from py_captions_for_channels import system_monitor
+
+        monkeypatch.setattr(system_monitor, "_PROC_NET_DEV", str(tmp_path / "no"))
+        fake = MagicMock(bytes_recv=1, bytes_sent=2)
+        monkeypatch.setattr("psutil.net_io_counters", lambda: fake)
+        assert system_monitor.read_net_io() == (1, 2)
+
+    def test_psutil_not_imported_at_module_level(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, py_captions_for_channels.system_monitor; "
+            "print('psutil' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_timeline_alone_does_not_build_monitor(self, tmp_path):
+        import subprocess
+        import sys
+
+        code = (
+            "import os, sys\n"
+            "os.environ['DATA_DIR'] = sys.argv[1]\n"
+            "from py_captions_for_channels import system_monitor as sm\n"
+            "t = sm.get_pipeline_timeline()\n"
+            "t.stage_start('whisper', 'job', 'a.mpg')\n"
+            "t.stage_end('whisper', 'job')\n"
+            "print(sm._system_monitor is None, 'psutil' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code, str(tmp_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert out.stdout.strip() == "True False"
+
+
 class TestGPUProvider:
     def test_base_provider(self):
         p = GPUProvider()
@@ -91,6 +180,162 @@ class TestGPUProvider:
         assert metrics["util_percent"] is None
 
 
+class TestNvidiaNvmlProvider:
+    def _provider(self, monkeypatch):
+        import sys
+        from types import SimpleNamespace
+
+        from py_captions_for_channels.system_monitor import NvidiaNvmlProvider
+
+        nvml = MagicMock()
+        nvml.nvmlDeviceGetName.return_value = "Test GPU"
+        nvml.nvmlDeviceGetMemoryInfo.return_value = SimpleNamespace(
+            used=512 * 1024 * 1024, total=4096 * 1024 * 1024
+        )
+        nvml.nvmlDeviceGetUtilizationRates.return_value = SimpleNamespace(gpu=42)
+        nvml.nvmlDeviceGetEncoderUtilization.return_value = (5, 0)
+        nvml.nvmlDeviceGetDecoderUtilization.return_value = (7, 0)
+        monkeypatch.setitem(sys.modules, "pynvml", nvml)
+        return NvidiaNvmlProvider(), nvml
+
+    def test_total_memory_read_at_init(self, monkeypatch):
+        provider, nvml = self._provider(monkeypatch)
+        assert provider.is_available() is True
+        assert provider.mem_total_mb == 4096.0
+        metrics = provider.get_metrics()
+        assert metrics["util_percent"] == 42.0
+        assert metrics["mem_used_mb"] == 512.0
+        assert metrics["mem_total_mb"] == 4096.0
+        assert metrics["enc_percent"] == 5.0
+
+    def test_metrics_cached_briefly(self, monkeypatch):
+        from py_captions_for_channels import system_monitor
+
+        provider, nvml = self._provider(monkeypatch)
+        clock = [100.0]
+        monkeypatch.setattr(system_monitor.time, "monotonic", lambda: clock[0])
+
+        provider.get_metrics()
+        provider.get_metrics()
+        assert nvml.nvmlDeviceGetUtilizationRates.call_count == 1
+
+        clock[0] += 1.0
+        provider.get_metrics()
+        assert nvml.nvmlDeviceGetUtilizationRates.call_count == 2
+
+
+class TestNvidiaSmiProvider:
+    def test_streams_loop_output(self, monkeypatch):
+        import io
+        import subprocess
+
+        from py_captions_for_channels.system_monitor import NvidiaSmiProvider
+
+        monkeypatch.setattr(
+            subprocess,
+            "run",
+            lambda *a, **k: subprocess.CompletedProcess(a, 0, "1, 2, 3\n", ""),
+        )
+        popen_calls = []
+
+        def fake_popen(cmd, **kwargs):
+            popen_calls.append(cmd)
+            proc = MagicMock()
+            proc.stdout = io.StringIO(
+                "10, 1, 2, 100, 4096\n[N/A], x\n55, 3, 4, 200, 4096\n"
+            )
+            proc.poll.return_value = None
+            return proc
+
+        monkeypatch.setattr(subprocess, "Popen", fake_popen)
+        provider = NvidiaSmiProvider()
+        assert provider.is_available() is True
+
+        provider.get_metrics()
+        provider._reader.join(timeout=2)
+        metrics = provider.get_metrics()
+
+        assert len(popen_calls) == 1
+        assert any(arg.startswith("--loop-ms=") for arg in popen_calls[0])
+        assert metrics["util_percent"] == 55.0
+        assert metrics["dec_percent"] == 4.0
+        assert metrics["mem_used_mb"] == 200.0
+
+    def _provider(self, monkeypatch, make_proc):
+        import subprocess
+
+        from py_captions_for_channels import system_monitor
+
+        monkeypatch.setattr(
+            subprocess,
+            "run",
+            lambda *a, **k: subprocess.CompletedProcess(a, 0, "1, 2, 3\n", ""),
+        )
+        procs = []
+
+        def fake_popen(cmd, **kwargs):
+            procs.append(make_proc())
+            return procs[-1]
+
+        monkeypatch.setattr(subprocess, "Popen", fake_popen)
+        clock = [100.0]
+        monkeypatch.setattr(system_monitor.time, "monotonic", lambda: clock[0])
+        return system_monitor.NvidiaSmiProvider(), procs, clock
+
+    def test_stale_output_not_reported(self, monkeypatch):
+        import io
+
+        def make_proc():
+            proc = MagicMock()
+            proc.stdout = io.StringIO("10, 1, 2, 100, 4096\n")
+            proc.poll.return_value = None
+            return proc
+
+        provider, procs, clock = self._provider(monkeypatch, make_proc)
+        provider.get_metrics()
+        provider._reader.join(timeout=2)
+        assert provider.get_metrics()["util_percent"] == 10.0
+
+        # The stream went quiet: the old line is no longer reported
+        clock[0] += 5.0
+        assert provider.get_metrics()["util_percent"] is None
+
+    def test_failing_process_restarts_with_backoff(self, monkeypatch):
+        import io
+
+        def make_proc():
+            proc = MagicMock()
+            proc.stdout = io.StringIO("")
+            proc.poll.return_value = 1  # Exits immediately
+            return proc
+
+        provider, procs, clock = self._provider(monkeypatch, make_proc)
+        starts = []
+        for _ in range(8):
+            provider.get_metrics()
+            starts.append(len(procs))
+            clock[0] += 1.0
+        # Restarted after 1 s, then 2 s, then 4 s — not on every sample
+        assert starts == [1, 2, 2, 3, 3, 3, 3, 4]
+
+    def test_close_terminates_and_reaps(self, monkeypatch):
+        import io
+
+        def make_proc():
+            proc = MagicMock()
+            proc.stdout = io.StringIO("")
+            proc.poll.return_value = None
+            return proc
+
+        provider, procs, _ = self._provider(monkeypatch, make_proc)
+        provider.get_metrics()
+        provider.close()
+
+        procs[0].terminate.assert_called_once()
+        procs[0].wait.assert_called_once()
+        assert provider._proc is None
+
+
 class TestSystemMonitor:
     @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
     @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
@@ -123,6 +368,42 @@ class TestSystemMonitor:
         assert latest is not None
         assert "cpu_percent" in latest
 
+    @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
+    @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
+    @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
+    def test_rates_use_monotonic_clock(self, mock_drm, mock_smi, mock_nvml):
+        from py_captions_for_channels import system_monitor
+        from py_captions_for_channels.system_monitor import DiskIO, NetIO
+
+        for m in (mock_nvml.return_value, mock_smi.return_value, mock_drm.return_value):
+            m.is_available.return_value = False
+            m.get_name.return_value = "None"
+        mon = SystemMonitor(max_seconds=10)
+        mon.gpu_provider = GPUProvider()
+        mon.prev_disk = DiskIO(0, 0)
+        mon.prev_net = NetIO(0, 0)
+        mon.prev_time = 100.0
+
+        mb = 1024 * 1024
+        with (
+            patch.object(system_monitor.time, "monotonic", return_value=102.0),
+            patch.object(
+                system_monitor.time,
+                "time",
+                return_value=50.0,  # Wall clock stepped back
+            ),
+            patch.object(
+                system_monitor, "read_disk_io", return_value=DiskIO(4 * mb, 2 * mb)
+            ),
+            patch.object(system_monitor, "read_net_io", return_value=NetIO(0, 0)),
+        ):
+            mon._sample_once()
+
+        latest = mon.get_latest()
+        assert latest["timestamp"] == 50.0
+        assert latest["disk_read_mbps"] == 2.0
+        assert latest["disk_write_mbps"] == 1.0
+
     @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
     @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
     @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
@@ -143,6 +424,122 @@ class TestSystemMonitor:
         window = mon.get_window(seconds=300)
         assert len(window) == 2
 
+    @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
+    @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
+    @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
+    def test_get_window_cutoff(self, mock_drm, mock_smi, mock_nvml):
+        for m in (mock_nvml.return_value, mock_smi.return_value, mock_drm.return_value):
+            m.is_available.return_value = False
+            m.get_name.return_value = "None"
+        mon = SystemMonitor(max_seconds=100)
+        now = time.time()
+        for age in (90, 60, 30, 10, 0):
+            mon.buffer.append(MetricPoint(now - age, 0.0, 0.0, 0.0, 0.0, 0.0))
+
+        window = mon.get_window(seconds=45)
+        assert [round(now - p["timestamp"]) for p in window] == [30, 10, 0]
+        assert mon.get_window(seconds=1000)[0]["timestamp"] == now - 90
+
+        # A backward wall-clock step leaves the buffer out of order; recent
+        # points after the step must still be returned
+        mon.buffer.append(MetricPoint(now - 120, 0.0, 0.0, 0.0, 0.0, 0.0))
+        mon.buffer.append(MetricPoint(now - 5, 0.0, 0.0, 0.0, 0.0, 0.0))
+        window = mon.get_window(seconds=45)
+        assert [round(now - p["timestamp"]) for p in window] == [30, 10, 0, 5]
+
+    @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
+    @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
+    @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
+    def test_sample_loop_keeps_fixed_cadence(self, mock_drm, mock_smi, mock_nvml):
+        from py_captions_for_channels import system_monitor
+
+        for m in (mock_nvml.return_value, mock_smi.return_value, mock_drm.return_value):
+            m.is_available.return_value = False
+            m.get_name.return_value = "None"
+        mon = SystemMonitor(max_seconds=10)
+        clock = [0.0]
+        sleeps = []
+        costs = iter([0.3, 0.1, 2.5, 0.2])
+
+        def fake_sample():
+            clock[0] += next(costs)
+
+        def fake_sleep(dt):
+            sleeps.append(round(dt, 6))
+            clock[0] += dt
+            mon.running = len(sleeps) < 3
+
+        mon._sample_once = fake_sample
+        mon.running = True
+        with (
+            patch.object(system_monitor.time, "monotonic", lambda: clock[0]),
+            patch.object(system_monitor.time, "sleep", fake_sleep),
+        ):
+            mon._sample_loop()
+
+        # Sample cost is absorbed into the sleep; an overrun skips the sleep
+        # and restarts the schedule instead of bursting to catch up
+        assert sleeps == [0.7, 0.9, 0.8]
+
+    @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
+    @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
+    @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
+    def test_idle_without_readers_or_active_stage(
+        self, mock_drm, mock_smi, mock_nvml, tmp_path
+    ):
+        for m in (mock_nvml.return_value, mock_smi.return_value, mock_drm.return_value):
+            m.is_available.return_value = False
+            m.get_name.return_value = "None"
+        mon = SystemMonitor(max_seconds=10)
+        assert mon._is_idle() is False
+
+        mon._last_read -= 61
+        assert mon._is_idle() is True
+
+        timeline = PipelineTimeline(mon, state_file=str(tmp_path / "state.json"))
+        timeline.stage_start("whisper", "j1", "a.mpg")
+        assert mon._is_idle() is False
+        timeline.stage_end("whisper", "j1")
+        timeline.flush()
+        assert mon._is_idle() is True
+
+        # A stage started by another process (the caption subprocess) keeps
+        # the sampler at full rate without anyone calling get_status()
+        worker = PipelineTimeline(None, state_file=str(tmp_path / "state.json"))
+        worker.stage_start("ffmpeg", "j1", "a.mpg")
+        worker.flush()
+        assert mon._is_idle() is False
+        with patch(
+            "py_captions_for_channels.system_monitor.time.time",
+            return_value=time.time() + 7200,
+        ):
+            assert mon._is_idle() is True  # Killed long ago; don't stay busy
+        worker.stage_end("ffmpeg", "j1")
+        worker.flush()
+        assert mon._is_idle() is True
+
+        # The first read ends the back-off and wakes the sampler
+        mon._idle = True
+        mon.get_latest()
+        assert mon._wake.is_set()
+        assert mon._is_idle() is False
+
+    @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
+    @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
+    @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
+    def test_get_latest_reuses_sampled_dict(self, mock_drm, mock_smi, mock_nvml):
+        for m in (mock_nvml.return_value, mock_smi.return_value, mock_drm.return_value):
+            m.is_available.return_value = False
+            m.get_name.return_value = "None"
+        mon = SystemMonitor(max_seconds=10)
+        mon.gpu_provider = GPUProvider()
+        mon._sample_once()
+        assert mon.get_latest() is mon.get_latest()
+
+        # A point appended outside the sampler is still reported correctly
+        mon.buffer.append(MetricPoint(123.0, 1.0, 0.0, 0.0, 0.0, 0.0))
+        assert mon.get_latest()["timestamp"] == 123.0
+
     @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
     @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
     @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
@@ -153,6 +550,29 @@ class TestSystemMonitor:
         mon = SystemMonitor(max_seconds=10)
         assert mon.is_gpu_engaged() is False
 
+    @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
+    @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
+    @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
+    def test_is_gpu_engaged_last_three_samples(self, mock_drm, mock_smi, mock_nvml):
+        for m in (mock_nvml.return_value, mock_smi.return_value, mock_drm.return_value):
+            m.is_available.return_value = False
+            m.get_name.return_value = "None"
+        mon = SystemMonitor(max_seconds=10)
+        for u in (50.0, 50.0):
+            mon._record_gpu_util(u)
+        assert mon.is_gpu_engaged() is False
+        mon._record_gpu_util(11.0)
+        assert mon.is_gpu_engaged() is True
+        mon._record_gpu_util(5.0)
+        assert mon.is_gpu_engaged() is False
+
+        # Keeps working once the ring wraps around
+        for _ in range(SystemMonitor._GPU_HISTORY + 2):
+            mon._record_gpu_util(90.0)
+        assert mon.is_gpu_engaged() is True
+        mon._record_gpu_util(0.0)
+        assert mon.is_gpu_engaged() is False
+
     @patch("py_captions_for_channels.system_monitor.NvidiaNvmlProvider")
     @patch("py_captions_for_channels.system_monitor.NvidiaSmiProvider")
     @patch("py_captions_for_channels.system_monitor.SysfsDrmProvider")
@@ -208,3 +628,157 @@ class TestPipelineTimeline:
         job2_stages = [s for s in status["stages"] if True]
         # Current stage is for job-2
         assert status["current_stage"]["stage"] == "whisper"
+
+    def test_transitions_append_to_event_log(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        writer = PipelineTimeline(system_monitor=None, state_file=state_file)
+        events = tmp_path / "pipeline_events.jsonl"
+
+        writer.stage_start("whisper", "job-1", "a.mpg")
+        writer.stage_end("whisper", "job-1")
+        writer.stage_start("ffmpeg", "job-1", "a.mpg")
+        writer.flush()
+        assert len(events.read_text().splitlines()) == 3
+        assert not (tmp_path / "pipeline_state.json").exists()
+
+        # Another process rebuilds the same state by replaying the log
+        reader = PipelineTimeline(system_monitor=None, state_file=state_file)
+        status = reader.get_status()
+        assert status["current_stage"]["stage"] == "ffmpeg"
+        assert [s["stage"] for s in status["stages"]] == ["whisper"]
+
+    def test_job_complete_compacts_log(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        writer = PipelineTimeline(system_monitor=None, state_file=state_file)
+
+        writer.stage_start("whisper", "job-1", "a.mpg")
+        writer.stage_start("ffmpeg", "job-1", "a.mpg")
+        writer.job_complete("job-1")
+        writer.flush()
+        assert (tmp_path / "pipeline_events.jsonl").read_text() == ""
+
+        reader = PipelineTimeline(system_monitor=None, state_file=state_file)
+        status = reader.get_status()
+        assert status["active"] is False
+        assert [s["stage"] for s in status["stages"]] == ["whisper", "ffmpeg"]
+
+        # Next job's events replay on top of the snapshot
+        writer.stage_start("whisper", "job-2", "b.mpg")
+        writer.flush()
+        status = reader.get_status()
+        assert status["current_job_id"] == "job-2"
+        assert status["stages"] == []
+
+    def test_torn_event_line_ignored(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        writer = PipelineTimeline(system_monitor=None, state_file=state_file)
+        writer.stage_start("whisper", "job-1", "a.mpg")
+        writer.flush()
+        with open(tmp_path / "pipeline_events.jsonl", "a") as f:
+            f.write('{"op":"end","sta')
+
+        reader = PipelineTimeline(system_monitor=None, state_file=state_file)
+        assert reader.get_status()["current_stage"]["stage"] == "whisper"
+
+    def test_writes_happen_off_caller_thread(self, tmp_path):
+        import threading
+
+        state_file = str(tmp_path / "pipeline_state.json")
+        tl = PipelineTimeline(system_monitor=None, state_file=state_file)
+        writer_threads = []
+        real_write = tl._write_event
+        tl._write_event = lambda line: (
+            writer_threads.append(threading.current_thread()) or real_write(line)
+        )
+
+        tl.stage_start("whisper", "job-1", "a.mpg")
+        tl.flush()
+        assert writer_threads and writer_threads[0] is not threading.current_thread()
+
+    def test_consecutive_compactions_coalesce(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        tl = PipelineTimeline(system_monitor=None, state_file=state_file)
+        compactions = []
+        tl._compact = lambda: compactions.append(1)
+
+        # Queue several compactions at once, then let the writer drain them
+        for _ in range(5):
+            tl._write_queue.put_nowait(("compact", None))
+        tl._request_compaction()
+        tl.flush()
+        assert 1 <= len(compactions) < 6
+
+    def test_reader_never_truncates_log(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        events = tmp_path / "pipeline_events.jsonl"
+        writer = PipelineTimeline(system_monitor=None, state_file=state_file)
+        reader = PipelineTimeline(system_monitor=None, state_file=state_file)
+
+        writer.stage_start("whisper", "job-1", "a.mpg")
+        writer.flush()
+        # Stage looks stale to the reader, which clears it in memory only
+        with patch(
+            "py_captions_for_channels.system_monitor.time.time",
+            return_value=time.time() + 7200,
+        ):
+            assert reader.get_status()["active"] is False
+        reader.flush()
+        assert len(events.read_text().splitlines()) == 1
+        assert not (tmp_path / "pipeline_state.json").exists()
+
+        # The writer's later events are still replayed by the reader
+        writer.stage_end("whisper", "job-1")
+        writer.stage_start("ffmpeg", "job-1", "a.mpg")
+        writer.flush()
+        status = reader.get_status()
+        assert status["current_stage"]["stage"] == "ffmpeg"
+        assert [s["stage"] for s in status["stages"]] == ["whisper"]
+
+    def test_compaction_keeps_other_processes_events(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        watcher = PipelineTimeline(system_monitor=None, state_file=state_file)
+        worker = PipelineTimeline(system_monitor=None, state_file=state_file)
+
+        # The watcher logs the copy, the caption subprocess the rest
+        watcher.stage_start("file_copy", "job-1", "a.mpg")
+        watcher.flush()
+        worker.stage_start("whisper", "job-1", "a.mpg")
+        worker.job_complete("job-1")
+        worker.flush()
+        assert (tmp_path / "pipeline_events.jsonl").read_text() == ""
+
+        reader = PipelineTimeline(system_monitor=None, state_file=state_file)
+        stages = reader.get_status()["stages"]
+        assert [s["stage"] for s in stages] == ["file_copy", "whisper"]
+
+    def test_job_cancel_is_logged(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        worker = PipelineTimeline(system_monitor=None, state_file=state_file)
+        web = PipelineTimeline(system_monitor=None, state_file=state_file)
+
+        worker.stage_start("whisper", "job-1", "a.mpg")
+        worker.flush()
+        web.job_cancel("job-1")
+        web.flush()
+        assert not (tmp_path / "pipeline_state.json").exists()
+
+        reader = PipelineTimeline(system_monitor=None, state_file=state_file)
+        status = reader.get_status()
+        assert status["active"] is False
+        assert [s["stage"] for s in status["stages"]] == ["whisper"]
+
+    def test_finished_job_auto_clears(self, tmp_path):
+        state_file = str(tmp_path / "pipeline_state.json")
+        tl = PipelineTimeline(system_monitor=None, state_file=state_file)
+        tl.stage_start("whisper", "job-1", "a.mpg")
+        tl.job_complete("job-1")
+        assert len(tl.get_status()["stages"]) == 1
+
+        # Look again a minute after the job finished
+        with patch(
+            "py_captions_for_channels.system_monitor.time.time",
+            return_value=time.time() + 60,
+        ):
+            status = tl.get_status()
+        assert status["current_job_id"] is None
+        assert status["stages"] == []